@@ -0,0 +1,154 @@
+"""
+Import-Time Benchmark
+
+Measures how long Jarvis modules take to import, using Python's
+-X importtime, so startup regressions from new top-level imports show up
+before release.
+
+Each module is imported in a fresh interpreter. Save results with --json
+and compare a later run against them with --compare.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+
+# Modules on the startup path, roughly in the order main.py reaches them
+DEFAULT_MODULES = [
+    'main',
+    'core.jarvis',
+    'core.stt',
+    'core.llm',
+    'core.tts',
+    'core.agents',
+    'core.memory',
+    'skills',
+    'ui.dashboard',
+]
+
+
+def measure_import(module: str, runs: int = 3) -> dict:
+    """
+    Measure importing a module in fresh interpreters.
+    
+    Args:
+        module: Module name
+        runs: Number of interpreters to measure (best run is kept)
+    
+    Returns:
+        Result with cumulative time (ms), the heaviest imports, or an error
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=root, capture_output=True, text=True
+        )
+        
+        timings: Dict[str, Dict[str, float]] = {}
+        errors = []
+        for line in proc.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith('import time:'):
+                errors.append(line)
+                continue
+            parts = line[len('import time:'):].split('|')
+            if len(parts) != 3 or not parts[0].strip().isdigit():
+                continue
+            name = parts[2].strip()
+            timings[name] = {
+                'self_ms': int(parts[0]) / 1000,
+                'cumulative_ms': int(parts[1]) / 1000
+            }
+        
+        if proc.returncode != 0:
+            return {
+                'module': module,
+                'error': (errors[-1] if errors else f"exit code {proc.returncode}").strip()
+            }
+        
+        total = timings.get(module, {}).get('cumulative_ms', 0.0)
+        if best is None or total < best['cumulative_ms']:
+            heaviest = sorted(timings.items(), key=lambda item: item[1]['self_ms'], reverse=True)
+            best = {
+                'module': module,
+                'cumulative_ms': total,
+                'top_imports': [
+                    {'name': name, **timing} for name, timing in heaviest[:5]
+                ]
+            }
+    
+    return best
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """Load cumulative times from a previous --json run."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        result['module']: result['cumulative_ms']
+        for result in data.get('results', [])
+        if 'cumulative_ms' in result
+    }
+
+
+def print_report(results: List[dict], baseline: Optional[Dict[str, float]] = None):
+    """Print results as a table."""
+    print(f"{'Module':<16} {'Import (ms)':>12}  {'Change':>10}  Heaviest imports (self ms)")
+    print("-" * 78)
+    
+    for result in results:
+        if 'error' in result:
+            print(f"{result['module']:<16} {'FAILED':>12}  {'':>10}  {result['error']}")
+            continue
+        
+        change = ""
+        if baseline and result['module'] in baseline:
+            change = f"{result['cumulative_ms'] - baseline[result['module']]:+.1f}"
+        
+        heaviest = ", ".join(
+            f"{item['name']} {item['self_ms']:.1f}" for item in result['top_imports'][:3]
+        )
+        print(f"{result['module']:<16} {result['cumulative_ms']:>12.1f}  {change:>10}  {heaviest}")
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Measure Jarvis module import times")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help="Modules to measure")
+    parser.add_argument('--runs', type=int, default=3, help="Fresh interpreters per module (best is kept)")
+    parser.add_argument('--json', metavar='FILE', help="Save results as JSON")
+    parser.add_argument('--compare', metavar='FILE', help="Compare against a saved JSON run")
+    args = parser.parse_args()
+    
+    results = [measure_import(module, args.runs) for module in args.modules]
+    baseline = load_baseline(args.compare) if args.compare else None
+    
+    print_report(results, baseline)
+    
+    if args.json:
+        try:
+            with open('VERSION', 'r', encoding='utf-8') as f:
+                version = f.read().strip()
+        except OSError:
+            version = 'unknown'
+        
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': version,
+                'python': sys.version.split()[0],
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': results
+            }, f, indent=2)
+        print(f"\nSaved results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
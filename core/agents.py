@@ -6,7 +6,9 @@ Three agents debate each input to provide comprehensive analysis.
 """
 
 import logging
+import threading
 import ollama
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -132,28 +134,42 @@ class MultiAgentDebate:
     Orchestrates internal multi-agent debate before Jarvis decides.
     
     Flow:
-    1. Analyst proposes logical response
+    1. Analyst proposes logical response (in parallel with domain expert)
     2. Skeptic identifies risks/issues
     3. Architect synthesizes refined solution
     4. Return all perspectives to Jarvis for final decision
+    
+    Each agent is submitted to a shared thread pool as soon as the agents it
+    depends on have finished. The pool size caps how many LLM requests are
+    in flight at once, and should match what the Ollama server can serve in
+    parallel (OLLAMA_NUM_PARALLEL).
     """
     
-    def __init__(self, model: str, enabled: bool = True):
+    def __init__(self, model: str, enabled: bool = True, max_concurrency: int = 2):
         """
         Initialize multi-agent debate system.
         
         Args:
             model: Ollama model to use for all agents
             enabled: Whether debate system is active
+            max_concurrency: Maximum agents querying the LLM at the same time
+                (1 = strictly sequential)
         """
         self.model = model
         self.enabled = enabled
+        self.max_concurrency = max(1, int(max_concurrency))
         self.logger = logging.getLogger("jarvis.agents")
+        self.executor = None
         
         if not enabled:
             self.logger.info("Multi-agent debate system is DISABLED")
             return
         
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="jarvis-agent"
+        )
+        
         # Initialize three specialized agents
         self.analyst = Agent(
             name="Analyst",
@@ -226,7 +242,10 @@ Keep responses concise (3-5 sentences).""",
         self.expert_agents = {}
         self._init_expert_agents(model)
         
-        self.logger.info(f"Multi-agent debate system initialized with model: {model}")
+        self.logger.info(
+            f"Multi-agent debate system initialized with model: {model} "
+            f"(concurrency: {self.max_concurrency})"
+        )
     
     def _init_expert_agents(self, model: str):
         """Initialize domain-specific expert agents."""
@@ -317,13 +336,15 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
         
         return None
     
-    def debate(self, user_input: str, context: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    def debate(self, user_input: str, context: Optional[List[Dict]] = None,
+               tier: str = 'full') -> Dict[str, Any]:
         """
-        Run full multi-agent debate on user input.
+        Run multi-agent debate on user input.
         
         Args:
             user_input: User's request/command
             context: Recent conversation history
+            tier: 'full' for the complete debate, 'single' for an Analyst-only pass
             
         Returns:
             Dictionary containing:
@@ -332,6 +353,7 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
             - architect_response: Architect's synthesis
             - timestamp: When debate occurred
             - enabled: Whether debate ran or was skipped
+            - tier: Which debate tier ran
         """
         if not self.enabled:
             return {
@@ -342,6 +364,9 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
                 'enabled': False
             }
         
+        if tier == 'single':
+            return self._single_pass(user_input)
+        
         self.logger.info(f"Starting debate on: {user_input[:50]}...")
         start_time = datetime.now()
         
@@ -351,29 +376,37 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
             expert_response = None
             expert_confidence = 0.7
             
-            # Phase 1: Analyst proposes solution
-            analyst_response = self.analyst.think(user_input)
-            analyst_confidence = self.analyst._extract_confidence(analyst_response)
-            
-            # Phase 1.5: Domain expert if applicable
+            # Phase 1: Analyst and domain expert are independent - run together
+            analyst_future = self.executor.submit(self.analyst.think, user_input)
+            expert_future = None
             if domain and domain in self.expert_agents:
                 expert_agent = self.expert_agents[domain]
-                expert_response = expert_agent.think(user_input)
+                expert_future = self.executor.submit(expert_agent.think, user_input)
+            
+            analyst_response = analyst_future.result()
+            analyst_confidence = self.analyst._extract_confidence(analyst_response)
+            
+            if expert_future:
+                expert_response = expert_future.result()
                 expert_confidence = expert_agent._extract_confidence(expert_response)
                 self.logger.info(f"Domain expert ({domain}) consulted")
             
-            # Phase 2: Skeptic critiques
+            # Phase 2: Skeptic critiques (needs Analyst + expert)
             skeptic_context = f"Analyst's Proposal:\n{analyst_response}"
             if expert_response:
                 skeptic_context += f"\n\n{self.expert_agents[domain].name}'s Input:\n{expert_response}"
-            skeptic_response = self.skeptic.think(user_input, skeptic_context)
+            skeptic_response = self.executor.submit(
+                self.skeptic.think, user_input, skeptic_context
+            ).result()
             skeptic_confidence = self.skeptic._extract_confidence(skeptic_response)
             
-            # Phase 3: Architect synthesizes
+            # Phase 3: Architect synthesizes (needs everything above)
             architect_context = f"Analyst's Proposal:\n{analyst_response}\n\nSkeptic's Concerns:\n{skeptic_response}"
             if expert_response:
                 architect_context += f"\n\n{self.expert_agents[domain].name}'s Expertise:\n{expert_response}"
-            architect_response = self.architect.think(user_input, architect_context)
+            architect_response = self.executor.submit(
+                self.architect.think, user_input, architect_context
+            ).result()
             architect_confidence = self.architect._extract_confidence(architect_response)
             
             # Calculate overall confidence
@@ -398,7 +431,8 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
                 'overall_confidence': overall_confidence,
                 'timestamp': start_time.isoformat(),
                 'duration_seconds': duration,
-                'enabled': True
+                'enabled': True,
+                'tier': 'full'
             }
             
         except Exception as e:
@@ -409,9 +443,47 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
                 'architect_response': None,
                 'timestamp': start_time.isoformat(),
                 'enabled': True,
+                'tier': 'full',
                 'error': str(e)
             }
     
+    def _single_pass(self, user_input: str) -> Dict[str, Any]:
+        """
+        Shortened debate: Analyst only, one LLM round-trip.
+        
+        Args:
+            user_input: User's request/command
+            
+        Returns:
+            Debate result dictionary with only the Analyst fields populated
+        """
+        self.logger.info(f"Starting single-agent pass on: {user_input[:50]}...")
+        start_time = datetime.now()
+        
+        analyst_response = self.executor.submit(self.analyst.think, user_input).result()
+        analyst_confidence = self.analyst._extract_confidence(analyst_response)
+        
+        duration = (datetime.now() - start_time).total_seconds()
+        self.logger.info(f"Single-agent pass completed in {duration:.2f}s (confidence: {analyst_confidence:.2f})")
+        
+        return {
+            'analyst_response': analyst_response,
+            'analyst_confidence': analyst_confidence,
+            'skeptic_response': None,
+            'architect_response': None,
+            'overall_confidence': analyst_confidence,
+            'timestamp': start_time.isoformat(),
+            'duration_seconds': duration,
+            'enabled': True,
+            'tier': 'single'
+        }
+    
+    def close(self):
+        """Shut down the agent thread pool."""
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+    
     def get_summary(self, debate_result: Dict[str, Any]) -> str:
         """
         Create human-readable summary of debate for UI/logging.
@@ -440,3 +512,87 @@ Format: Brief entertainment analysis (2-3 sentences) with CONFIDENCE: [Low/Mediu
             summary += f"⏱️ Duration: {debate_result['duration_seconds']:.2f}s"
         
         return summary
+
+
+class DebateGate:
+    """
+    Decides per request how much multi-agent reasoning to run.
+    
+    Tiers:
+    - none: skip the debate (trivial input or a confidently classified command)
+    - single: Analyst-only pass (recent debates have been consistently confident)
+    - full: complete Analyst/Expert/Skeptic/Architect debate
+    
+    Only full debates feed the confidence average, so every audit_every-th
+    input that qualifies for the single tier gets a full debate instead;
+    otherwise short inputs could stay on the Analyst-only path forever.
+    """
+    
+    TIERS = ('none', 'single', 'full')
+    
+    def __init__(self, config: dict):
+        """
+        Initialize debate gate.
+        
+        Args:
+            config: Gating configuration (llm.debate_gating in config.yaml)
+        """
+        self.config = config or {}
+        self.logger = logging.getLogger("jarvis.agents.gate")
+        
+        self.enabled = self.config.get('enabled', True)
+        self.min_words = self.config.get('min_words', 3)
+        self.command_confidence = self.config.get('command_confidence', 0.85)
+        self.command_max_words = self.config.get('command_max_words', 8)
+        self.single_agent_confidence = self.config.get('single_agent_confidence', 0.8)
+        self.single_agent_max_words = self.config.get('single_agent_max_words', 12)
+        self.history_window = self.config.get('history_window', 20)
+        self.audit_every = self.config.get('audit_every', 5)
+        self._single_runs = 0  # Single-tier decisions since the last audit
+        self._lock = threading.Lock()  # decide() runs from the voice loop and the API
+    
+    def decide(self, user_input: str, classification: Dict[str, Any],
+               past_confidence: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Pick the debate tier for an input.
+        
+        Args:
+            user_input: User's request
+            classification: Output of AIBrain.classify_intent()
+            past_confidence: Average overall_confidence of recent full debates
+            
+        Returns:
+            Dict with 'tier' and a short 'reason'
+        """
+        if not self.enabled:
+            return {'tier': 'full', 'reason': 'gating disabled'}
+        
+        word_count = len(user_input.split())
+        
+        if word_count < self.min_words:
+            return {'tier': 'none', 'reason': f'short input ({word_count} words)'}
+        
+        if (classification.get('type') == 'command'
+                and classification.get('confidence', 0.0) >= self.command_confidence
+                and word_count <= self.command_max_words):
+            return {
+                'tier': 'none',
+                'reason': f"clear command (confidence {classification['confidence']:.2f})"
+            }
+        
+        if (past_confidence is not None
+                and past_confidence >= self.single_agent_confidence
+                and word_count <= self.single_agent_max_words):
+            with self._lock:
+                self._single_runs += 1
+                audit = bool(self.audit_every) and self._single_runs >= self.audit_every
+                if audit:
+                    self._single_runs = 0
+            if audit:
+                return {'tier': 'full', 'reason': 'periodic full debate to re-check confidence'}
+            return {
+                'tier': 'single',
+                'reason': f'recent debates confident ({past_confidence:.2f})'
+            }
+        
+        return {'tier': 'full', 'reason': 'default'}
@@ -7,6 +7,7 @@ Provides REST API endpoints for controlling Jarvis remotely.
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import logging
+import queue
 import threading
 from typing import TYPE_CHECKING
 
@@ -34,6 +35,12 @@ class APIServer:
         self.port = self.config.get('port', 5000)
         self.api_key = self.config.get('api_key', '')
         
+        # Speech-to-text for satellite microphones (created on first use)
+        self.stt_config = config.get('stt', {})
+        self.transcription_config = self.config.get('transcription', {})
+        self.transcription = None
+        self._transcription_lock = threading.Lock()
+        
         if self.enabled:
             self.app = Flask(__name__)
             CORS(self.app)  # Enable CORS for mobile apps
@@ -68,8 +75,8 @@ class APIServer:
                 return jsonify({'error': 'No command provided'}), 400
             
             try:
-                # Process command through Jarvis
-                response = self.jarvis.process_text_command(command)
+                # Same pipeline as spoken input (Q&A, custom commands, LLM, skills)
+                response = self.jarvis.process_input(command)
                 
                 return jsonify({
                     'success': True,
@@ -101,6 +108,51 @@ class APIServer:
             except Exception as e:
                 return jsonify({'success': False, 'error': str(e)}), 500
         
+        @self.app.route('/api/transcribe', methods=['POST'])
+        def transcribe():
+            """Transcribe uploaded WAV audio (e.g. from a satellite microphone)."""
+            if not self._check_auth():
+                return jsonify({'error': 'Unauthorized'}), 401
+            
+            upload = request.files.get('audio')
+            data = upload.read() if upload else request.get_data()
+            if not data:
+                return jsonify({'error': 'No audio provided'}), 400
+            
+            try:
+                from core.audio_preprocess import decode_wav
+                audio = decode_wav(data)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            try:
+                service = self._get_transcription_service()
+                if service is None:
+                    return jsonify({'error': 'Transcription service disabled'}), 503
+                
+                transcription = service.transcribe(audio)
+                return jsonify({
+                    'success': True,
+                    'text': transcription.future.result(),
+                    'latency': transcription.latency(),
+                    'queue_depth': service.queue_depth
+                })
+            except queue.Full:
+                return jsonify({'success': False, 'error': 'Transcription queue full'}), 503
+            except Exception as e:
+                self.logger.error(f"Transcription error: {e}")
+                return jsonify({'success': False, 'error': str(e)}), 500
+        
+        @self.app.route('/api/transcribe/stats', methods=['GET'])
+        def transcription_stats():
+            """Get transcription queue depth and latency."""
+            if not self._check_auth():
+                return jsonify({'error': 'Unauthorized'}), 401
+            
+            if self.transcription is None:
+                return jsonify({'success': True, 'stats': None})
+            return jsonify({'success': True, 'stats': self.transcription.stats()})
+        
         @self.app.route('/api/history', methods=['GET'])
         def get_history():
             """Get conversation history."""
@@ -126,10 +178,10 @@ class APIServer:
             
             try:
                 skills = []
-                for skill in self.jarvis.skills_engine.skills:
+                for skill in self.jarvis.skills.skills:
                     skills.append({
-                        'name': skill.__class__.__name__,
-                        'description': skill.__class__.__doc__ or 'No description'
+                        'name': skill.skill_name,
+                        'description': skill.skill_description or 'No description'
                     })
                 
                 return jsonify({
@@ -164,6 +216,24 @@ class APIServer:
                 self.jarvis.memory.set_preference(key, str(value))
                 return jsonify({'success': True})
     
+    def _get_transcription_service(self):
+        """Create the transcription service on first use, sharing Jarvis's Whisper model."""
+        if not self.transcription_config.get('enabled', True):
+            return None
+        
+        with self._transcription_lock:
+            if self.transcription is None:
+                from core.transcription_service import TranscriptionService
+                
+                models = getattr(self.jarvis.stt, 'models', None)
+                if models is None:
+                    # STT runs in API mode; load a local model for serving
+                    from core.whisper_models import get_model_manager
+                    models = get_model_manager(self.stt_config['local'])
+                
+                self.transcription = TranscriptionService(models, self.transcription_config)
+            return self.transcription
+    
     def _check_auth(self) -> bool:
         """Check API authentication."""
         if not self.api_key:
@@ -0,0 +1,122 @@
+"""
+Audio Ring Buffer
+
+Preallocated capture buffer for the microphone callback. Writing copies the
+incoming block into place without allocating, and any recent span of up to
+the buffer's capacity can be read back as a contiguous view, without
+concatenating or copying.
+"""
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Fixed-size float32 ring buffer addressed by absolute sample position.
+    
+    The storage holds two mirrored copies of the ring back to back, so every
+    span of up to `capacity` samples is contiguous in memory and can be
+    returned as a plain numpy view. A view stays valid until `capacity` more
+    samples have been written after it.
+    
+    Written from one thread (the audio callback); views may be taken from
+    any thread.
+    """
+    
+    def __init__(self, capacity: int, channels: int = 1):
+        """
+        Initialize buffer.
+        
+        Args:
+            capacity: Samples (frames) retained
+            channels: Channels per sample
+        """
+        self.capacity = capacity
+        self.channels = channels
+        self._data = np.zeros((2 * capacity, channels), dtype=np.float32)
+        self._written = 0
+    
+    @property
+    def position(self) -> int:
+        """Absolute position of the next sample (total samples written)."""
+        return self._written
+    
+    @property
+    def oldest(self) -> int:
+        """Absolute position of the oldest sample still retained."""
+        return max(0, self._written - self.capacity)
+    
+    def write(self, frames: np.ndarray):
+        """
+        Append a block of samples.
+        
+        Args:
+            frames: Array of shape (samples, channels)
+        """
+        count = len(frames)
+        if count > self.capacity:
+            self._written += count - self.capacity
+            frames = frames[-self.capacity:]
+            count = self.capacity
+        
+        capacity = self.capacity
+        start = self._written % capacity
+        end = start + count
+        
+        self._data[start:end] = frames
+        if end <= capacity:
+            self._data[start + capacity:end + capacity] = frames
+        else:
+            split = capacity - start
+            self._data[start + capacity:] = frames[:split]
+            self._data[:end - capacity] = frames[split:]
+        
+        # Publish only after the samples are in place
+        self._written += count
+    
+    def view(self, start: int, end: int = None) -> np.ndarray:
+        """
+        Contiguous view of samples between two absolute positions.
+        
+        Args:
+            start: First sample position (clamped to the oldest retained sample)
+            end: Position after the last sample (default: current position)
+        
+        Returns:
+            Array of shape (samples, channels) sharing the buffer's memory
+        """
+        if end is None:
+            end = self._written
+        end = min(end, self._written)
+        start = min(max(start, end - self.capacity, 0), end)
+        
+        offset = start % self.capacity
+        return self._data[offset:offset + (end - start)]
+    
+    def latest(self, count: int) -> np.ndarray:
+        """
+        View of the most recent samples.
+        
+        Args:
+            count: Number of samples
+        
+        Returns:
+            Array of shape (samples, channels) sharing the buffer's memory
+        """
+        end = self._written
+        return self.view(end - count, end)
+    
+    def rms(self, count: int) -> float:
+        """
+        RMS level of the most recent samples, without allocating.
+        
+        Args:
+            count: Number of samples
+        
+        Returns:
+            RMS level (0.0 if the buffer is empty)
+        """
+        samples = self.latest(count).reshape(-1)
+        if not len(samples):
+            return 0.0
+        return float(np.sqrt(np.dot(samples, samples) / len(samples)))
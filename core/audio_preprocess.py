@@ -0,0 +1,195 @@
+"""
+Audio Preprocessing Module
+
+Cuts recorded audio down to the spans that contain speech before it is sent
+to Whisper, whose cost grows with input length. Speech is found per frame,
+by frame energy or with the VoiceActivityDetector.
+
+Also decodes WAV audio (uploads, recorded fixtures) to the 16 kHz mono
+float32 samples the recognizer works with.
+"""
+
+import io
+import logging
+import wave
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+
+def decode_wav(source: Union[bytes, str], sample_rate: int = 16000) -> np.ndarray:
+    """
+    Decode a PCM WAV file to mono float32 at the given sample rate.
+    
+    Args:
+        source: WAV file contents or path
+        sample_rate: Target sample rate (resampled linearly if different)
+        
+    Returns:
+        Mono float32 samples in [-1, 1]
+        
+    Raises:
+        ValueError: If the data is not 8/16/32-bit PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(source) if isinstance(source, bytes) else source, 'rb') as wav:
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Unsupported WAV data: {e}")
+    
+    if width == 1:
+        audio = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        audio = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768
+    elif width == 4:
+        audio = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width * 8} bits")
+    
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    
+    if rate != sample_rate and len(audio):
+        duration = len(audio) / rate
+        target = np.arange(int(duration * sample_rate)) / sample_rate
+        audio = np.interp(target, np.arange(len(audio)) / rate, audio).astype(np.float32)
+    
+    return audio
+
+
+class SpeechTrimmer:
+    """
+    Finds speech in mono audio and trims the silence around it.
+    
+    Frames are 32 ms (512 samples at 16 kHz, the frame size Silero VAD
+    expects). With the energy method a frame is speech when its RMS is
+    above both the configured threshold and three times the clip's noise
+    floor (its 10th percentile frame RMS).
+    """
+    
+    def __init__(self, config: dict, sample_rate: int, vad=None):
+        """
+        Initialize trimmer.
+        
+        Args:
+            config: Preprocessing configuration (stt.preprocess in config.yaml)
+            sample_rate: Audio sample rate
+            vad: VoiceActivityDetector for the 'vad' method (optional)
+        """
+        self.logger = logging.getLogger("jarvis.stt.preprocess")
+        self.sample_rate = sample_rate
+        self.enabled = config.get('trim_silence', True)
+        self.method = config.get('method', 'energy')
+        self.threshold = config.get('threshold', 0.01)
+        self.padding = config.get('padding', 0.2)
+        self.drop_gaps = config.get('drop_gaps', True)
+        self.vad = vad
+        
+        self.frame = int(0.032 * sample_rate)
+        
+        if self.method == 'vad' and vad is None:
+            self.logger.warning("No VAD available for silence trimming, using frame energy")
+            self.method = 'energy'
+    
+    def speech_frames(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Classify frames as speech.
+        
+        Args:
+            audio: Mono float32 audio
+        
+        Returns:
+            Boolean array, one entry per whole frame
+        """
+        count = len(audio) // self.frame
+        frames = audio[:count * self.frame].reshape(count, self.frame)
+        
+        if self.method == 'vad':
+            return np.array([self.vad.is_speech(frame, self.sample_rate) for frame in frames], dtype=bool)
+        
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / self.frame)
+        if not count:
+            return rms > 0
+        noise_floor = np.percentile(rms, 10)
+        return rms > max(self.threshold, noise_floor * 3)
+    
+    def _padded_mask(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """Speech frames widened by the padding on both sides, or None if no speech."""
+        speech = self.speech_frames(audio)
+        if not speech.any():
+            return None
+        
+        pad = int(round(self.padding * self.sample_rate / self.frame))
+        if pad:
+            speech = np.convolve(speech, np.ones(2 * pad + 1), mode='same') > 0
+        return speech
+    
+    def _bounds(self, mask: np.ndarray, length: int) -> Tuple[int, int]:
+        """Sample range covered by a frame mask's first to last speech frame."""
+        indexes = np.flatnonzero(mask)
+        start = int(indexes[0]) * self.frame
+        end = (int(indexes[-1]) + 1) * self.frame
+        # The partial frame at the end is kept if the last frame is speech
+        if indexes[-1] == len(mask) - 1:
+            end = length
+        return start, end
+    
+    def speech_bounds(self, audio: np.ndarray) -> Tuple[int, int]:
+        """
+        Sample range from the first to the last speech (with padding).
+        
+        Args:
+            audio: Mono float32 audio
+        
+        Returns:
+            (start, end) sample indexes; (0, len(audio)) when trimming is
+            disabled or no frame is speech
+        """
+        if not self.enabled or len(audio) < self.frame:
+            return 0, len(audio)
+        
+        mask = self._padded_mask(audio)
+        if mask is None:
+            return 0, len(audio)
+        return self._bounds(mask, len(audio))
+    
+    def trim(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Keep only the speech spans of a clip.
+        
+        Leading and trailing silence is cut (a view, no copy). With
+        drop_gaps, pauses inside the utterance longer than twice the padding
+        are cut as well.
+        
+        Args:
+            audio: Mono float32 audio
+        
+        Returns:
+            Trimmed audio (unchanged when disabled or no frame is speech)
+        """
+        if not self.enabled or len(audio) < self.frame:
+            return audio
+        
+        mask = self._padded_mask(audio)
+        if mask is None:
+            return audio
+        
+        if self.drop_gaps and not mask.all():
+            keep = np.repeat(mask, self.frame)
+            tail = len(audio) - len(keep)
+            if tail:
+                keep = np.concatenate([keep, np.full(tail, mask[-1])])
+            trimmed = audio[keep]
+        else:
+            start, end = self._bounds(mask, len(audio))
+            trimmed = audio[start:end]
+        
+        if len(trimmed) < len(audio):
+            self.logger.debug(
+                f"Trimmed audio from {len(audio) / self.sample_rate:.2f}s "
+                f"to {len(trimmed) / self.sample_rate:.2f}s"
+            )
+        return trimmed
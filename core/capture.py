@@ -0,0 +1,366 @@
+"""
+Audio Capture Module
+
+One microphone stream for all voice input. Audio arrives in fixed frames
+into a ring buffer; a worker thread runs voice activity detection on each
+frame and turns runs of speech into segments (with a configurable hangover),
+which recognition, open mic and wake word listening all consume.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import sounddevice as sd
+
+from core.audio_buffer import AudioRingBuffer
+
+
+class SpeechSegment:
+    """A detected run of speech, as absolute ring buffer positions."""
+    
+    def __init__(self, start: int, onset: int, end: int, speech_end: int):
+        """
+        Initialize segment.
+        
+        Args:
+            start: First sample, including the pre-speech padding
+            onset: Sample where speech was first detected
+            end: Position after the last sample, including padding
+            speech_end: Position after the last speech frame
+        """
+        self.start = start
+        self.onset = onset
+        self.end = end
+        self.speech_end = speech_end
+    
+    def clipped(self, since: int) -> "SpeechSegment":
+        """The part of the segment from a position on."""
+        if self.onset >= since:
+            return self
+        return SpeechSegment(since, since, self.end, self.speech_end)
+    
+    def __repr__(self):
+        return f"SpeechSegment(start={self.start}, onset={self.onset}, end={self.end})"
+
+
+class CaptureEngine:
+    """
+    VAD-driven microphone capture.
+    
+    The stream callback only copies each frame into the ring buffer and
+    wakes the worker; detection runs on the worker thread so a slow VAD
+    backend can't cause input overflows.
+    
+    With the energy method, a frame is speech when its RMS level is above
+    both the configured threshold and a multiple of the room's noise floor
+    (a low percentile of the recent frame levels), so steady background
+    noise doesn't hold segments open. Other VAD methods classify frames
+    themselves.
+    
+    Events (see subscribe):
+        speech_start: called with the segment start position
+        segment: called with each finished SpeechSegment
+        level: called with the RMS level of each frame
+    """
+    
+    EVENTS = ('speech_start', 'segment', 'level')
+    
+    def __init__(self, config: dict, vad, sample_rate: int = 16000, channels: int = 1, capacity: float = 30.0):
+        """
+        Initialize capture engine (the stream opens on start()).
+        
+        Args:
+            config: Capture configuration (stt.capture in config.yaml)
+            vad: VoiceActivityDetector used to classify frames
+            sample_rate: Sample rate
+            channels: Input channels
+            capacity: Seconds of audio kept in the ring buffer
+        """
+        self.logger = logging.getLogger("jarvis.capture")
+        self.vad = vad
+        self.sample_rate = sample_rate
+        self.channels = channels
+        
+        self.frame = int(config.get('frame_ms', 32) * sample_rate / 1000)
+        self.onset_frames = config.get('onset_frames', 2)
+        self.hangover_frames = max(1, int(config.get('hangover', 0.8) * sample_rate / self.frame))
+        self.pre_speech = int(config.get('pre_speech', 0.3) * sample_rate)
+        self.min_speech = int(config.get('min_speech', 0.3) * sample_rate)
+        self.max_segment = int(config.get('max_segment', 15) * sample_rate)
+        
+        # Energy detection with an adaptive noise floor
+        self.threshold = config.get('threshold', 0.01)
+        self.noise_factor = config.get('noise_factor', 3.0)
+        self._levels = deque(maxlen=max(1, int(config.get('noise_window', 5.0) * sample_rate / self.frame)))
+        
+        self.ring = AudioRingBuffer(int(capacity * sample_rate), channels)
+        
+        self._listeners: Dict[str, List[Callable]] = {event: [] for event in self.EVENTS}
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        
+        # Detection state (worker thread)
+        self._processed = 0
+        self._speech_run = 0
+        self._silence_run = 0
+        self._last_speech_end = 0
+        
+        # Shared with waiters
+        self._cond = threading.Condition()
+        self._segment_start: Optional[int] = None
+        self._onset: Optional[int] = None
+        self._segments = deque(maxlen=8)
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the microphone stream is open."""
+        return self._stream is not None
+    
+    @property
+    def position(self) -> int:
+        """Absolute position of the next captured sample."""
+        return self.ring.position
+    
+    def subscribe(self, event: str, callback: Callable):
+        """
+        Register an event listener (called on the capture worker thread).
+        
+        Args:
+            event: 'speech_start', 'segment' or 'level'
+            callback: Listener
+        """
+        self._listeners[event].append(callback)
+    
+    def unsubscribe(self, event: str, callback: Callable):
+        """Remove an event listener."""
+        if callback in self._listeners[event]:
+            self._listeners[event].remove(callback)
+    
+    def _emit(self, event: str, value):
+        """Call listeners, isolating their errors from capture."""
+        for callback in list(self._listeners[event]):
+            try:
+                callback(value)
+            except Exception as e:
+                self.logger.debug(f"{event} listener failed: {e}")
+    
+    def start(self):
+        """Open the microphone stream (no-op if already open)."""
+        with self._stream_lock:
+            if self._stream is not None:
+                return
+            
+            self._stop.clear()
+            self._processed = self.ring.position
+            self._reset_detection()
+            
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="jarvis-capture", daemon=True)
+                self._worker.start()
+            
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype='float32',
+                blocksize=self.frame,
+                callback=self._callback
+            )
+            self._stream.start()
+            self.logger.debug("Capture stream opened")
+    
+    def stop(self):
+        """Close the microphone stream and stop detection."""
+        with self._stream_lock:
+            stream, self._stream = self._stream, None
+            self._stop.set()
+            self._frame_ready.set()
+            if stream is not None:
+                stream.stop()
+                stream.close()
+                self.logger.debug("Capture stream closed")
+        
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+            self._worker = None
+        
+        with self._cond:
+            self._cond.notify_all()
+    
+    def _callback(self, indata, frames, time_info, status):
+        """Stream callback: store the frame and wake the worker."""
+        if status:
+            self.logger.warning(f"Audio status: {status}")
+        self.ring.write(indata)
+        self._frame_ready.set()
+    
+    def _reset_detection(self):
+        """Forget any speech in progress."""
+        self._speech_run = 0
+        self._silence_run = 0
+        with self._cond:
+            self._segment_start = None
+            self._onset = None
+    
+    def _run(self):
+        """Worker loop: classify each new frame."""
+        while not self._stop.is_set():
+            self._frame_ready.wait(0.5)
+            self._frame_ready.clear()
+            
+            while self._processed + self.frame <= self.ring.position and not self._stop.is_set():
+                if self._processed < self.ring.oldest:
+                    # Fell a full buffer behind; resume from the oldest audio
+                    self.logger.warning("Capture detection fell behind, skipping audio")
+                    self._processed = self.ring.oldest
+                    self._reset_detection()
+                
+                frame = self.ring.view(self._processed, self._processed + self.frame)
+                mono = frame[:, 0] if self.channels == 1 else frame.mean(axis=1)
+                try:
+                    self._process_frame(mono, self._processed)
+                except Exception as e:
+                    self.logger.error(f"Capture detection error: {e}")
+                self._processed += self.frame
+    
+    def _is_speech(self, frame: np.ndarray, rms: float) -> bool:
+        """Classify one frame."""
+        if self.vad.method != 'energy':
+            return self.vad.is_speech(frame, self.sample_rate)
+        
+        self._levels.append(rms)
+        if len(self._levels) < self._levels.maxlen // 5:
+            # Too little history for a noise floor yet
+            return rms > self.threshold
+        noise_floor = np.percentile(self._levels, 10)
+        return rms > max(self.threshold, noise_floor * self.noise_factor)
+    
+    def _process_frame(self, frame: np.ndarray, position: int):
+        """Update the speech state machine with one frame."""
+        rms = float(np.sqrt(np.dot(frame, frame) / len(frame)))
+        if self._listeners['level']:
+            self._emit('level', rms)
+        
+        is_speech = self._is_speech(frame, rms)
+        frame_end = position + self.frame
+        
+        if self._onset is None:
+            # Waiting for onset: enough consecutive speech frames
+            self._speech_run = self._speech_run + 1 if is_speech else 0
+            if self._speech_run >= self.onset_frames:
+                onset = frame_end - self._speech_run * self.frame
+                start = max(onset - self.pre_speech, self.ring.oldest)
+                with self._cond:
+                    self._onset = onset
+                    self._segment_start = start
+                    self._cond.notify_all()
+                self._silence_run = 0
+                self._last_speech_end = frame_end
+                self._emit('speech_start', start)
+            return
+        
+        # In speech: end after the hangover, or at the maximum length
+        if is_speech:
+            self._silence_run = 0
+            self._last_speech_end = frame_end
+        else:
+            self._silence_run += 1
+        
+        too_long = frame_end - self._segment_start >= self.max_segment
+        if self._silence_run < self.hangover_frames and not too_long:
+            return
+        
+        segment = SpeechSegment(
+            self._segment_start,
+            self._onset,
+            min(self._last_speech_end + self.pre_speech, frame_end),
+            self._last_speech_end
+        )
+        self._speech_run = 0
+        self._silence_run = 0
+        
+        with self._cond:
+            self._onset = None
+            self._segment_start = None
+            if self._last_speech_end - segment.onset >= self.min_speech:
+                self._segments.append(segment)
+            else:
+                segment = None
+            self._cond.notify_all()
+        
+        if segment:
+            self._emit('segment', segment)
+    
+    def next_segment(
+        self,
+        timeout: Optional[float] = None,
+        since: Optional[int] = None,
+        on_start: Optional[Callable[[int], None]] = None
+    ) -> Optional[SpeechSegment]:
+        """
+        Wait for the next speech segment.
+        
+        Args:
+            timeout: Seconds to wait for speech to begin (None = forever);
+                once speech has begun, waits for it to end
+            since: Only accept speech at or after this position (default:
+                now); a segment already under way is clipped to start here,
+                so a reply that runs on from earlier sound isn't lost
+            on_start: Called with the segment start position when speech
+                begins (again if that speech is dropped as too short and
+                new speech begins)
+        
+        Returns:
+            The segment, or None on timeout or when capture stops
+        """
+        if since is None:
+            since = self.position
+        deadline = None if timeout is None else time.time() + timeout
+        announced = None
+        
+        while True:
+            announce = None
+            result = None
+            done = False
+            
+            with self._cond:
+                for segment in self._segments:
+                    if segment.speech_end - max(segment.onset, since) >= self.min_speech:
+                        result = segment.clipped(since)
+                        break
+                
+                if result is not None:
+                    done = True
+                    if announced != result.start:
+                        announce = result.start
+                else:
+                    # Speech too short to count can end without a segment;
+                    # a new start is announced again
+                    in_speech = self._onset is not None
+                    start = max(self._segment_start, since) if in_speech else None
+                    if in_speech and announced != start:
+                        announce = start
+                    elif self._stop.is_set():
+                        done = True
+                    else:
+                        remaining = None
+                        if deadline is not None and not in_speech:
+                            remaining = deadline - time.time()
+                            if remaining <= 0:
+                                return None
+                        self._cond.wait(remaining if remaining is not None else 0.5)
+            
+            # Outside the lock: the callback may block (e.g. restarting a transcriber)
+            if announce is not None:
+                announced = announce
+                if on_start:
+                    on_start(announce)
+            
+            if done:
+                return result
@@ -0,0 +1,164 @@
+"""
+Speech Interrupt Module
+
+Stops Jarvis mid-sentence without polling. A keyboard hook fires on the
+interrupt key and, optionally, the capture engine fires when the user starts
+talking (barge-in); either one stops the speech and wakes the waiting
+thread through an Event. The time from trigger to silence is measured for
+every interrupt.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+# Names the keyboard library reports for each side of the modifier keys
+KEY_ALIASES = {
+    'ctrl': {'ctrl', 'left ctrl', 'right ctrl', 'control', 'left control', 'right control'},
+    'alt': {'alt', 'left alt', 'right alt', 'alt gr'},
+    'shift': {'shift', 'left shift', 'right shift'},
+}
+
+
+class InterruptController:
+    """
+    Runs speech on a thread and stops it on the interrupt key or barge-in.
+    
+    The keyboard hook is installed once and ignored while nothing is
+    speaking. Barge-in listens to the capture engine's speech_start event;
+    without echo cancellation the microphone hears Jarvis too, so it is off
+    by default and only armed after a grace period.
+    """
+    
+    def __init__(self, config: dict, tts, capture=None, interrupt_key: str = 'ctrl'):
+        """
+        Initialize controller and install the keyboard hook.
+        
+        Args:
+            config: Interrupt configuration (stt.interrupt in config.yaml)
+            tts: VoiceSynthesizer to stop
+            capture: CaptureEngine for barge-in (optional)
+            interrupt_key: Key that interrupts speech
+        """
+        self.logger = logging.getLogger("jarvis.interrupt")
+        self.tts = tts
+        self.capture = capture
+        self.interrupt_key = interrupt_key.lower()
+        self.key_names = KEY_ALIASES.get(self.interrupt_key, {self.interrupt_key})
+        
+        self.barge_in = config.get('barge_in', False) and capture is not None
+        self.barge_in_grace = config.get('barge_in_grace', 0.5)
+        
+        self._wake: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+        self._armed = False
+        self._armed_at = 0.0
+        self.source: Optional[str] = None  # What triggered the last interrupt
+        self._latencies = deque(maxlen=50)
+        
+        self._hook = None
+        try:
+            import keyboard
+            self._hook = keyboard.on_press(self._on_key)
+        except Exception as e:
+            # e.g. Linux without root; barge-in still works
+            self.logger.warning(f"Interrupt key unavailable: {e}")
+    
+    def _on_key(self, event):
+        """Keyboard hook (keyboard listener thread)."""
+        if self._armed and event.name and event.name.lower() in self.key_names:
+            # Measure from the key event itself, not from when the hook ran
+            self._trigger('key', time.perf_counter() - max(0.0, time.time() - event.time))
+    
+    def _on_speech_start(self, position: int):
+        """Capture engine speech_start listener (capture worker thread)."""
+        if self._armed and time.perf_counter() - self._armed_at >= self.barge_in_grace:
+            self._trigger('barge-in', time.perf_counter())
+    
+    def _trigger(self, source: str, triggered_at: float):
+        """Stop speech and wake the waiting thread (first trigger wins)."""
+        with self._lock:
+            if not self._armed:
+                return
+            self._armed = False
+            self.source = source
+            wake = self._wake
+        
+        self.tts.stop()
+        latency = self.tts.stopped_at - triggered_at
+        self._latencies.append(latency)
+        self.logger.info(f"Interrupted by {source}: silent after {latency * 1000:.0f} ms")
+        wake.set()
+    
+    def run(self, speak: Callable[[], None]) -> bool:
+        """
+        Speak on a worker thread until it finishes or is interrupted.
+        
+        Args:
+            speak: Function that speaks (e.g. a bound tts.speak call)
+        
+        Returns:
+            True if the speech was interrupted
+        """
+        # A fresh event per utterance, so a late trigger can't wake the next one
+        wake = threading.Event()
+        
+        def target():
+            try:
+                speak()
+            finally:
+                wake.set()
+        
+        thread = threading.Thread(target=target, name="jarvis-speak", daemon=True)
+        
+        # Cleared here, not when speaking starts, so a trigger before the
+        # thread gets going still stops the speech
+        self.tts.begin()
+        with self._lock:
+            self._wake = wake
+            self.source = None
+            self._armed = True
+            self._armed_at = time.perf_counter()
+        if self.barge_in:
+            self.capture.start()
+            self.capture.subscribe('speech_start', self._on_speech_start)
+        
+        try:
+            thread.start()
+            wake.wait()
+        finally:
+            with self._lock:
+                self._armed = False
+            if self.barge_in:
+                self.capture.unsubscribe('speech_start', self._on_speech_start)
+        
+        thread.join(timeout=1.0)
+        return self.source is not None
+    
+    def stats(self) -> dict:
+        """
+        Get interrupt statistics.
+        
+        Returns:
+            Interrupt count and trigger-to-silence latency (ms)
+        """
+        latencies = sorted(self._latencies)
+        return {
+            'interrupts': len(latencies),
+            'latency_p50_ms': round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+            'latency_max_ms': round(latencies[-1] * 1000, 1) if latencies else None,
+            'barge_in': self.barge_in
+        }
+    
+    def close(self):
+        """Remove the keyboard hook."""
+        if self._hook is not None:
+            try:
+                import keyboard
+                keyboard.unhook(self._hook)
+            except Exception:
+                pass
+            self._hook = None
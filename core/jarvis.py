@@ -5,17 +5,16 @@ Coordinates all subsystems: STT, LLM, TTS, Skills, Memory, UI
 """
 
 import logging
+import queue
 import threading
 import time
-import keyboard
-from typing import Optional
-from core.stt import SpeechRecognizer
-from core.llm import AIBrain
-from core.tts import VoiceSynthesizer
-from core.memory import MemorySystem
-from core.license_validator import get_validator
-from core.agents import MultiAgentDebate
-from skills import SkillsEngine
+from typing import Callable, Optional
+from core.startup import StartupGraph
+
+# Subsystem modules (and their heavy dependencies: faster-whisper, numpy,
+# sounddevice, ollama, win32com, keyboard) are imported where they are first
+# needed - mostly the startup stage that constructs them - so importing this
+# module stays cheap.
 
 
 class Jarvis:
@@ -26,6 +25,11 @@ class Jarvis:
     1. Listen (STT) → 2. Think (LLM) → 3. Act (Skills) → 4. Speak (TTS)
     """
     
+    # Phrases spoken word for word (pre-rendered into the TTS cache)
+    ONLINE_PHRASE = "Jarvis Omega online. Systems operational."
+    GOODBYE_PHRASE = "Goodbye, sir."
+    SHUTDOWN_PHRASE = "Goodbye sir. System shutting down."
+    
     def __init__(self, config: dict):
         """
         Initialize Jarvis with configuration.
@@ -47,49 +51,71 @@ class Jarvis:
         self._last_interaction_time = time.time()
         self._idle_cooldown = 300  # 5 minutes before idle thoughts start
         
+        # Subsystems (set by the startup stages below)
+        self.tts = None
+        self.stt = None
+        self.brain = None
+        self.memory = None
+        self.agents = None
+        self.debate_gate = None
+        self.skills = None
+        self.interrupts = None
+        
         # Initialize subsystems
         self.logger.info("Initializing subsystems...")
         
         try:
-            # Text-to-Speech (initialize first for error reporting)
-            self.tts = VoiceSynthesizer(config['tts'])
-            self.logger.info("✓ TTS initialized")
+            # Independent subsystems start concurrently; the wall time is the
+            # longest dependency chain rather than the sum of all stages
+            startup_config = config.get('startup', {})
+            graph = StartupGraph(max_workers=startup_config.get('max_workers', 4))
+            # TTS stays on this thread: SAPI is a COM object with thread affinity
+            graph.add('tts', self._init_tts, main_thread=True)
+            graph.add('stt', self._init_stt)
+            graph.add('brain', self._init_brain)
+            graph.add('memory', self._init_memory)
+            graph.add('agents', self._init_agents, requires=('brain',))
+            graph.add('skills', self._init_skills)
             
-            # Speech-to-Text
-            self.stt = SpeechRecognizer(config['stt'])
-            self.logger.info("✓ STT initialized")
+            self.startup_report = graph.run()
+            self.logger.info(self.startup_report.format())
             
-            # AI Brain (optional)
-            if config['llm'].get('enabled', True):
-                self.brain = AIBrain(config['llm'])
-                self.logger.info("✓ AI Brain initialized")
-            else:
-                self.brain = None
-                self.logger.info("✓ AI Brain disabled (using Q&A + Commands only)")
+            # UI Dashboard (optional)
+            self.dashboard: Optional[Dashboard] = None
             
-            # Memory System
-            self.memory = MemorySystem(config['memory']) if config['memory']['enabled'] else None
-            if self.memory:
-                self.logger.info("✓ Memory initialized")
+            # Remote control API (optional), including transcription for
+            # satellite microphones
+            self.api_server = None
+            if config.get('api', {}).get('enabled', False):
+                from core.api_server import APIServer
+                self.api_server = APIServer(config, self)
+                self.api_server.start()
             
-            # Multi-Agent Debate System (requires AI Brain)
-            if self.brain and config['llm'].get('multi_agent_enabled', True):
-                model = config['llm'].get('model', 'llama3.2:3b')
-                self.agents = MultiAgentDebate(model=model, enabled=True)
-                self.logger.info("✓ Multi-Agent Debate System initialized")
-            else:
-                self.agents = None
-                if not self.brain:
-                    self.logger.info("✓ Multi-Agent Debate disabled (AI Brain disabled)")
-                else:
-                    self.logger.info("✓ Multi-Agent Debate disabled (config)")
+            # Interrupting speech: interrupt key hook and optional barge-in
+            from core.interrupt import InterruptController
+            self.interrupts = InterruptController(
+                config['stt'].get('interrupt', {}),
+                self.tts,
+                capture=self.stt.capture,
+                interrupt_key=self.stt.interrupt_key
+            )
             
-            # Skills Engine
-            self.skills = SkillsEngine(config['skills'])
-            self.logger.info("✓ Skills Engine initialized")
+            # Render fixed phrases and canned answers so they play instantly
+            if self.tts.cache is not None and config['tts'].get('cache', {}).get('prerender', True):
+                self.tts.prerender(
+                    [self.ONLINE_PHRASE, self.GOODBYE_PHRASE, self.SHUTDOWN_PHRASE]
+                    + self.skills.canned_responses()
+                )
             
-            # UI Dashboard (optional)
-            self.dashboard: Optional[Dashboard] = None
+            # Preload frequently used skills once Jarvis is idle
+            warm_up = config['skills'].get('lazy_loading', {}).get('warm_up', {})
+            if warm_up.get('enabled', True):
+                threading.Thread(
+                    target=self._skill_warm_up,
+                    args=(warm_up,),
+                    name="jarvis-skill-warmup",
+                    daemon=True
+                ).start()
             
             self.logger.info("All subsystems ready")
             
@@ -97,65 +123,183 @@ class Jarvis:
             self.logger.error(f"Failed to initialize subsystems: {e}", exc_info=True)
             raise
     
-    def _speak_with_interrupt(self, text: str):
+    def _init_tts(self):
+        """Startup stage: Text-to-Speech."""
+        from core.tts import VoiceSynthesizer
+        self.tts = VoiceSynthesizer(self.config['tts'])
+        self.logger.info("✓ TTS initialized")
+    
+    def _init_stt(self):
+        """Startup stage: Speech-to-Text (loads the Whisper model)."""
+        from core.stt import SpeechRecognizer
+        self.stt = SpeechRecognizer(self.config['stt'], vad_config=self.config.get('vad'))
+        self.logger.info("✓ STT initialized")
+    
+    def _init_brain(self):
+        """Startup stage: AI Brain (optional, connects to Ollama)."""
+        if self.config['llm'].get('enabled', True):
+            from core.llm import AIBrain
+            self.brain = AIBrain(self.config['llm'])
+            self.logger.info("✓ AI Brain initialized")
+        else:
+            self.brain = None
+            self.logger.info("✓ AI Brain disabled (using Q&A + Commands only)")
+    
+    def _init_memory(self):
+        """Startup stage: Memory System."""
+        from core.memory import MemorySystem
+        self.memory = MemorySystem(self.config['memory']) if self.config['memory']['enabled'] else None
+        if self.memory:
+            self.logger.info("✓ Memory initialized")
+    
+    def _init_agents(self):
+        """Startup stage: Multi-Agent Debate System (requires AI Brain)."""
+        config = self.config
+        if self.brain and config['llm'].get('multi_agent_enabled', True):
+            from core.agents import MultiAgentDebate, DebateGate
+            model = config['llm'].get('model', 'llama3.2:3b')
+            self.agents = MultiAgentDebate(
+                model=model,
+                enabled=True,
+                max_concurrency=config['llm'].get('agent_concurrency', 2)
+            )
+            self.debate_gate = DebateGate(config['llm'].get('debate_gating', {}))
+            self.logger.info("✓ Multi-Agent Debate System initialized")
+        else:
+            self.agents = None
+            self.debate_gate = None
+            if not self.brain:
+                self.logger.info("✓ Multi-Agent Debate disabled (AI Brain disabled)")
+            else:
+                self.logger.info("✓ Multi-Agent Debate disabled (config)")
+    
+    def _init_skills(self):
+        """Startup stage: Skills Engine."""
+        from skills import SkillsEngine
+        self.skills = SkillsEngine(self.config['skills'])
+        self.logger.info("✓ Skills Engine initialized")
+    
+    def _skill_warm_up(self, warm_up: dict):
         """
-        Speak text while monitoring for interrupt signal.
-        If interrupted, stop speaking and start listening immediately.
+        Load the skills behind the most used intents while idle.
+        
+        Args:
+            warm_up: skills.lazy_loading.warm_up configuration
         """
-        # Start speaking in a thread
-        speak_thread = threading.Thread(target=self.tts.speak, args=(text,))
-        speak_thread.daemon = True
-        speak_thread.start()
-        
-        # Monitor for interrupt
-        interrupt_key = self.stt.interrupt_key
-        
-        check_count = 0
-        while speak_thread.is_alive():
-            # Check if interrupt key pressed
-            # Handle special key names for keyboard library
-            key_pressed = False
-            try:
-                if interrupt_key.lower() == 'ctrl':
-                    # Check all variations like in the test
-                    key_pressed = (keyboard.is_pressed('ctrl') or 
-                                 keyboard.is_pressed('left ctrl') or 
-                                 keyboard.is_pressed('right ctrl') or
-                                 keyboard.is_pressed('control') or
-                                 keyboard.is_pressed('left control') or
-                                 keyboard.is_pressed('right control'))
-                elif interrupt_key.lower() == 'alt':
-                    key_pressed = keyboard.is_pressed('alt') or keyboard.is_pressed('left alt') or keyboard.is_pressed('right alt')
-                elif interrupt_key.lower() == 'shift':
-                    key_pressed = keyboard.is_pressed('shift') or keyboard.is_pressed('left shift') or keyboard.is_pressed('right shift')
-                else:
-                    key_pressed = keyboard.is_pressed(interrupt_key)
-            except Exception as e:
-                self.logger.error(f"Keyboard check error: {e}")
+        idle_seconds = warm_up.get('idle_seconds', 20)
+        
+        # Wait for a quiet moment so loading doesn't compete with a request
+        while time.time() - self._last_interaction_time < idle_seconds:
+            time.sleep(1)
+        
+        try:
+            if self.memory:
+                frequent = self.memory.get_frequent_commands(limit=warm_up.get('top_intents', 5))
+                intents = [item['intent'] for item in frequent if item['count'] >= warm_up.get('min_uses', 3)]
+                names = self.skills.skills_for_intents(intents)
+            else:
+                names = []
             
-            # Periodic monitoring check
-            check_count += 1
+            if names:
+                loaded = self.skills.warm_up(names)
+                if loaded:
+                    self.logger.info(f"Warmed up skills: {', '.join(loaded)}")
+        except Exception as e:
+            self.logger.error(f"Skill warm-up failed: {e}")
+    
+    def _speak_with_interrupt(
+        self,
+        text: str = None,
+        sentences: queue.Queue = None,
+        cancel: Optional[threading.Event] = None
+    ):
+        """
+        Speak text until it finishes or is interrupted.
+        If interrupted, stop speaking and start listening immediately.
+        
+        The interrupt key (a keyboard hook) and, if enabled, barge-in (the
+        user starting to talk) stop the speech; nothing polls while waiting.
+        
+        Args:
+            text: Full text to speak
+            sentences: Queue of sentences to speak as they arrive (streaming
+                mode, terminated by None). Used instead of text when given.
+            cancel: Set on interrupt, before listening again, to stop the
+                generation still feeding `sentences`
+        """
+        if sentences is not None:
+            speak = lambda: self.tts.speak_stream(sentences)
+        else:
+            speak = lambda: self.tts.speak(text)
+        
+        if not self.interrupts.run(speak):
+            return
+        
+        if cancel is not None:
+            cancel.set()
+        
+        if self.interrupts.source == 'key':
+            # Wait a moment for key release
+            time.sleep(0.2)
+        
+        # Immediately start listening again
+        if self.dashboard:
+            self.dashboard.add_to_history("[Interrupted - Listening...]")
+        self.listen_and_respond()
+    
+    def _streaming_enabled(self) -> bool:
+        """Check if LLM replies should be streamed sentence-by-sentence to TTS."""
+        return bool(self.brain and self.brain.stream)
+    
+    def _stream_and_speak(self, text: str) -> str:
+        """
+        Process input and speak the reply as it is generated.
+        
+        Runs process_input in a background thread that pushes each finished
+        sentence onto a queue, while this thread speaks them (with interrupt
+        monitoring). Non-streamed replies (Q&A, commands) are spoken whole.
+        If the user interrupts, whatever the producer still finishes is
+        discarded: it doesn't execute commands or speak, and isn't waited for.
+        
+        Args:
+            text: User's spoken text
             
-            if key_pressed:
-                self.logger.info(f"Interrupt detected ({interrupt_key} pressed)")
-                self.tts.stop()
-                
-                # Wait for the speak thread to finish
-                speak_thread.join(timeout=1.0)
-                
-                # Wait a moment for key release
-                time.sleep(0.2)
-                
-                # Immediately start listening again
-                if self.dashboard:
-                    self.dashboard.add_to_history("[Interrupted - Listening...]")
-                self.listen_and_respond()
-                return
+        Returns:
+            Full response text (the sentences produced before an interrupt)
+        """
+        sentences = queue.Queue()
+        cancel = threading.Event()
+        result = {}
+        emitted = []
+        
+        def produce():
+            def on_sentence(sentence: str):
+                if not emitted and self.dashboard:
+                    self.dashboard.set_state("speaking")
+                emitted.append(sentence)
+                sentences.put(sentence)
             
-            time.sleep(0.05)  # Check more frequently (20 times per second)
+            try:
+                response = self.process_input(text, on_sentence=on_sentence, cancel=cancel)
+                if not cancel.is_set():
+                    result['response'] = response
+                    if not emitted:
+                        on_sentence(response)
+            finally:
+                sentences.put(None)
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        
+        self._speak_with_interrupt(sentences=sentences, cancel=cancel)
+        
+        if cancel.is_set():
+            # Interrupted (and already answered the next command); the
+            # producer may still be in the debate, so it isn't joined
+            return " ".join(emitted)
         
-        # Wait for speech to complete if not interrupted
-        speak_thread.join(timeout=1)
+        producer.join()
+        return result.get('response', '')
     
     def _license_validation_loop(self):
         """
@@ -163,6 +307,7 @@ class Jarvis:
         """
         import os
         from datetime import datetime
+        from core.license_validator import get_validator
         
         self.logger.info("License validation background thread started")
         
@@ -282,12 +427,39 @@ class Jarvis:
         
         self.logger.info("Idle thought loop stopped")
     
-    def process_input(self, text: str) -> str:
+    def _select_debate_tier(self, text: str) -> dict:
+        """
+        Decide how much multi-agent reasoning this input needs.
+        
+        Args:
+            text: User's input text
+            
+        Returns:
+            Dict with 'tier' ('none', 'single' or 'full') and 'reason'
+        """
+        classification = self.brain.classify_intent(text)
+        past_confidence = None
+        if self.memory and self.debate_gate.enabled:
+            past_confidence = self.memory.get_average_debate_confidence(
+                limit=self.debate_gate.history_window
+            )
+        return self.debate_gate.decide(text, classification, past_confidence)
+    
+    def process_input(
+        self,
+        text: str,
+        on_sentence: Optional[Callable[[str], None]] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> str:
         """
         Process user input through the full pipeline.
         
         Args:
             text: User's spoken text
+            on_sentence: Called with each sentence of a streamed LLM reply
+                (only used when llm.generation.stream is enabled)
+            cancel: Stops a streamed LLM reply when set (the user
+                interrupted it); the abandoned reply isn't stored
             
         Returns:
             Response to speak back
@@ -350,17 +522,39 @@ class Jarvis:
                 context = self.memory.get_recent_context(
                     limit=self.config['memory']['context_window']
                 )
+                
+                # Add relevant older exchanges the recent window doesn't cover
+                if self.memory.semantic:
+                    relevant = self.memory.get_relevant_context(
+                        text,
+                        exclude_ids={item['id'] for item in context}
+                    )
+                    context = relevant + context
             
             # Multi-Agent Internal Debate (before Jarvis thinks)
             debate_result = None
             debate_context = context.copy() if context else []
             
             if self.agents:
-                self.logger.info("Starting internal multi-agent debate...")
-                debate_result = self.agents.debate(text, context)
+                gate = self._select_debate_tier(text)
+                
+                if gate['tier'] == 'none':
+                    self.logger.info(f"Skipping multi-agent debate ({gate['reason']})")
+                else:
+                    self.logger.info(f"Starting internal multi-agent debate (tier: {gate['tier']}, {gate['reason']})...")
+                    debate_result = self.agents.debate(text, context, tier=gate['tier'])
+                    debate_result['gate_reason'] = gate['reason']
+                
+                # Record which tier ran so gating savings can be measured
+                if self.memory:
+                    self.memory.log_statistic('debate_gate', {
+                        'tier': gate['tier'],
+                        'reason': gate['reason'],
+                        'duration_seconds': debate_result.get('duration_seconds', 0.0) if debate_result else 0.0
+                    })
                 
                 # Log debate summary
-                if debate_result['enabled']:
+                if debate_result and debate_result['enabled']:
                     self.logger.debug(self.agents.get_summary(debate_result))
                     
                     # Update UI with internal reasoning if dashboard exists
@@ -383,10 +577,15 @@ class Jarvis:
             
             # Think: Get AI response with intent classification
             # (Jarvis makes final decision, informed by agent debate)
-            response = self.brain.process(text, debate_context)
+            response = self.brain.process(text, debate_context, on_sentence=on_sentence, cancel=cancel)
             
             # Act: Check if this is a command or conversation
             if response['type'] == 'command':
+                if cancel is not None and cancel.is_set():
+                    # Interrupted while thinking: the user has moved on
+                    self.logger.info(f"Command {response['intent']} interrupted, not executed")
+                    return ""
+                
                 # Execute command through skills engine
                 result = self.skills.execute(
                     intent=response['intent'],
@@ -417,6 +616,11 @@ class Jarvis:
                 # Conversational response
                 reply = response['response']
                 
+                if response.get('cancelled'):
+                    # Interrupted: the rest was never generated or heard
+                    self.logger.info("Reply interrupted, not stored")
+                    return reply
+                
                 # Store in memory
                 if self.memory:
                     interaction_id = self.memory.store_interaction(
@@ -462,20 +666,28 @@ class Jarvis:
                 self.dashboard.add_to_history(f"You: {text}")
                 self.dashboard.set_state("thinking")
             
-            # Process
-            response = self.process_input(text)
-            
-            # Update last interaction time (resets idle thoughts)
-            self._last_interaction_time = time.time()
-            
-            # Update UI
-            if self.dashboard:
-                self.dashboard.add_to_history(f"Jarvis: {response}")
-                self.dashboard.set_state("speaking")
-            
-            # Speak with interrupt monitoring
-            self.logger.info(f"Jarvis: {response}")
-            self._speak_with_interrupt(response)
+            if self._streaming_enabled():
+                # Process and speak concurrently (sentence-level handoff)
+                response = self._stream_and_speak(text)
+                self._last_interaction_time = time.time()
+                self.logger.info(f"Jarvis: {response}")
+                if self.dashboard:
+                    self.dashboard.add_to_history(f"Jarvis: {response}")
+            else:
+                # Process
+                response = self.process_input(text)
+                
+                # Update last interaction time (resets idle thoughts)
+                self._last_interaction_time = time.time()
+                
+                # Update UI
+                if self.dashboard:
+                    self.dashboard.add_to_history(f"Jarvis: {response}")
+                    self.dashboard.set_state("speaking")
+                
+                # Speak with interrupt monitoring
+                self.logger.info(f"Jarvis: {response}")
+                self._speak_with_interrupt(response)
             
             # Return to idle
             if self.dashboard:
@@ -501,7 +713,7 @@ class Jarvis:
             wake_word = self.config['stt']['activation']['wake_word']
             print(f"Say '{wake_word}' to activate\n")
         
-        self.tts.speak("Jarvis Omega online. Systems operational.", wait=False)
+        self.tts.speak(self.ONLINE_PHRASE, wait=False)
         
         # Start background license validation
         self._start_license_validation_thread()
@@ -511,8 +723,9 @@ class Jarvis:
                 self.listen_and_respond()
         except KeyboardInterrupt:
             print("\n\nShutting down...")
-            self.tts.speak("Goodbye, sir.")
+            self.tts.speak(self.GOODBYE_PHRASE)
             self.is_running = False
+            self.shutdown()
     
     def run_gui(self):
         """Run with GUI dashboard."""
@@ -535,7 +748,7 @@ class Jarvis:
             skill.dashboard = self.dashboard
         
         # Startup message (non-blocking so UI appears immediately)
-        self.tts.speak("Jarvis Omega online. Systems operational.", wait=False)
+        self.tts.speak(self.ONLINE_PHRASE, wait=False)
         
         # Start background license validation
         self._start_license_validation_thread()
@@ -555,10 +768,34 @@ class Jarvis:
         self.logger.info("Shutting down Jarvis...")
         self.is_running = False
         
+        try:
+            if self.interrupts:
+                self.interrupts.close()
+        except Exception as e:
+            self.logger.error(f"Error removing interrupt hook: {e}")
+        
+        try:
+            if self.stt:
+                self.stt.close()
+        except Exception as e:
+            self.logger.error(f"Error closing microphone: {e}")
+        
         try:
             if self.memory:
                 self.memory.close()
         except Exception as e:
             self.logger.error(f"Error closing memory: {e}")
         
+        try:
+            if self.agents:
+                self.agents.close()
+        except Exception as e:
+            self.logger.error(f"Error closing agents: {e}")
+        
+        try:
+            if self.skills:
+                self.skills.close()
+        except Exception as e:
+            self.logger.error(f"Error closing skills: {e}")
+        
         self.logger.info("Shutdown complete")
@@ -7,11 +7,17 @@ Handles reasoning, intent detection, and response generation using local LLM via
 import logging
 import json
 import re
-from typing import Dict, List, Any
+import threading
+from typing import Dict, List, Any, Callable, Iterator, Optional
 from datetime import datetime
 import ollama
 
 
+# Sentence boundary: terminal punctuation (optionally followed by a closing
+# quote/bracket) and whitespace, or a line break.
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|(?<=[.!?]["\')\]])\s+|\n+')
+
+
 class AIBrain:
     """
     AI reasoning layer using local LLM (Ollama).
@@ -112,10 +118,20 @@ class AIBrain:
             prompt_parts.append(f"Current date and time: {current_datetime}")
             prompt_parts.append("")
         
+        # Add semantically retrieved older exchanges
+        relevant = [item for item in context if item.get('relevant')]
+        recent = [item for item in context if not item.get('relevant')]
+        if relevant:
+            prompt_parts.append("Relevant earlier conversation:")
+            for item in relevant:
+                prompt_parts.append(f"User: {item['input']}")
+                prompt_parts.append(f"Jarvis: {item['response']}")
+            prompt_parts.append("")
+        
         # Add context
-        if context:
+        if recent:
             prompt_parts.append("Recent conversation:")
-            for item in context[-5:]:  # Last 5 exchanges
+            for item in recent[-5:]:  # Last 5 exchanges
                 prompt_parts.append(f"User: {item['input']}")
                 prompt_parts.append(f"Jarvis: {item['response']}")
             prompt_parts.append("")
@@ -160,9 +176,12 @@ class AIBrain:
         is_command = any(keyword in text_lower for keyword in command_keywords)
         
         if is_command:
+            # Imperative phrasing ("open notepad") is a stronger signal than
+            # a keyword buried mid-sentence ("what should I open first?")
+            leads_with_keyword = any(text_lower.startswith(keyword) for keyword in command_keywords)
             return {
                 'type': 'command',
-                'confidence': 0.8,
+                'confidence': 0.9 if leads_with_keyword else 0.7,
                 'raw_text': text
             }
         else:
@@ -267,13 +286,92 @@ class AIBrain:
             self.logger.error(f"Failed to generate response: {e}")
             return "I'm having trouble processing that right now."
     
-    def process(self, user_input: str, context: List[Dict] = None) -> Dict[str, Any]:
+    def generate_response_stream(
+        self,
+        user_input: str,
+        context: List[Dict],
+        cancel: Optional[threading.Event] = None
+    ) -> Iterator[str]:
+        """
+        Generate conversational response, yielding complete sentences as tokens arrive.
+        
+        Lets TTS start on the first sentence while the rest is still generating.
+        
+        Args:
+            user_input: User's input
+            context: Conversation context
+            cancel: When set, generation stops at the next token and the
+                request to Ollama is closed (frees it for the next command)
+            
+        Yields:
+            Response sentences in order
+        """
+        emitted = False
+        buffer = ""
+        
+        try:
+            prompt = self._build_prompt(user_input, context)
+            
+            stream = ollama.chat(
+                model=self.model,
+                messages=[
+                    {'role': 'system', 'content': self.system_prompt},
+                    {'role': 'user', 'content': prompt}
+                ],
+                options={
+                    'temperature': self.temperature,
+                    'num_predict': self.max_tokens
+                },
+                stream=True
+            )
+            
+            for chunk in stream:
+                if cancel is not None and cancel.is_set():
+                    # Closing the stream drops the connection, which stops Ollama
+                    close = getattr(stream, 'close', None)
+                    if close:
+                        close()
+                    self.logger.debug("Streamed response cancelled")
+                    return
+                
+                buffer += chunk['message']['content']
+                
+                # Everything before the last boundary is a finished sentence
+                parts = SENTENCE_BOUNDARY.split(buffer)
+                buffer = parts.pop()
+                for sentence in parts:
+                    sentence = sentence.strip()
+                    if sentence:
+                        emitted = True
+                        yield sentence
+            
+            # Flush trailing text without terminal punctuation
+            if buffer.strip():
+                emitted = True
+                yield buffer.strip()
+                
+        except Exception as e:
+            self.logger.error(f"Failed to stream response: {e}")
+            if not emitted:
+                yield "I'm having trouble processing that right now."
+    
+    def process(
+        self,
+        user_input: str,
+        context: List[Dict] = None,
+        on_sentence: Optional[Callable[[str], None]] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
         """
         Main processing method: classify intent and generate appropriate response.
         
         Args:
             user_input: User's input text
             context: Conversation context
+            on_sentence: Called with each sentence as it is generated when
+                streaming is enabled (llm.generation.stream)
+            cancel: Stops a streamed response early (e.g. when the user
+                interrupts it); the result then has 'cancelled' set
             
         Returns:
             Dict with response type and content
@@ -293,6 +391,18 @@ class AIBrain:
                 'entities': command_details['entities'],
                 'raw_text': user_input
             }
+        elif self.stream and on_sentence:
+            # Stream conversational response sentence by sentence
+            sentences = []
+            for sentence in self.generate_response_stream(user_input, context, cancel=cancel):
+                sentences.append(sentence)
+                on_sentence(sentence)
+            return {
+                'type': 'conversation',
+                'response': " ".join(sentences),
+                'streamed': True,
+                'cancelled': cancel is not None and cancel.is_set()
+            }
         else:
             # Generate conversational response
             response = self.generate_response(user_input, context)
@@ -5,12 +5,616 @@ Handles persistent storage of conversations, preferences, and context using SQLi
 """
 
 import logging
+import queue
+import re
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 from pathlib import Path
 
 
+class ConnectionManager:
+    """
+    Persistent per-thread SQLite connections.
+    
+    Each thread (main loop, dashboard, idle-thought loop, API server) gets
+    its own long-lived connection, so there is no connect/teardown per call
+    and SQLite's per-connection prepared statement cache stays warm. WAL
+    mode lets readers run alongside the single writer; writes are
+    serialized through a process-wide lock so threads never contend for
+    SQLite's write lock.
+    """
+    
+    # Applied to every new connection
+    PRAGMAS = (
+        "PRAGMA synchronous = NORMAL",  # Durable in WAL mode, no fsync per commit
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -8000",  # 8 MB page cache
+        "PRAGMA busy_timeout = 5000",
+    )
+    
+    def __init__(self, db_path: str, cached_statements: int = 256):
+        """
+        Initialize connection manager.
+        
+        Args:
+            db_path: Path to SQLite database file
+            cached_statements: Prepared statements cached per connection
+        """
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self.logger = logging.getLogger("jarvis.memory.db")
+        
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._registry_lock = threading.Lock()
+        self._connections: Dict[int, tuple] = {}  # thread id -> (thread, connection)
+        
+        # WAL is persistent in the database file - set it once
+        conn = self.connection()
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        self.logger.debug(f"SQLite journal mode: {mode}")
+    
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use.
+        
+        Returns:
+            SQLite connection owned by the calling thread
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30,
+                cached_statements=self.cached_statements,
+                check_same_thread=False  # Only so close() can run from any thread
+            )
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            
+            thread = threading.current_thread()
+            with self._registry_lock:
+                self._prune_dead_threads()
+                self._connections[thread.ident] = (thread, conn)
+            self.logger.debug(f"Opened SQLite connection for thread {thread.name}")
+        return conn
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a write transaction on this thread's connection.
+        
+        Commits on success and rolls back on error.
+        
+        Yields:
+            SQLite connection
+        """
+        conn = self.connection()
+        with self._write_lock:
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def _prune_dead_threads(self):
+        """Close connections belonging to threads that have exited."""
+        for ident, (thread, conn) in list(self._connections.items()):
+            if not thread.is_alive():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                del self._connections[ident]
+    
+    def close(self):
+        """Close every open connection."""
+        with self._registry_lock:
+            for thread, conn in self._connections.values():
+                try:
+                    conn.close()
+                except Exception as e:
+                    self.logger.debug(f"Error closing connection for {thread.name}: {e}")
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class WriteBehindQueue:
+    """
+    Background writer that batches inserts into single transactions.
+    
+    Keeps disk I/O off the Listen → Think → Speak path: callers enqueue a
+    write and return immediately. A batch is written when it reaches
+    batch_size, when its oldest write is flush_interval seconds old, when
+    flush() is called, or on close().
+    """
+    
+    def __init__(
+        self,
+        db: ConnectionManager,
+        batch_size: int = 32,
+        flush_interval: float = 1.0,
+        after_write: Optional[Callable[[List[Tuple[str, str, tuple]]], None]] = None
+    ):
+        """
+        Initialize and start the writer thread.
+        
+        Args:
+            db: Connection manager to write through
+            batch_size: Pending writes that trigger an immediate flush
+            flush_interval: Max seconds a write waits before being flushed
+            after_write: Called with each written batch (runs on writer thread)
+        """
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.after_write = after_write
+        self.logger = logging.getLogger("jarvis.memory.writer")
+        
+        self._pending: List[Tuple[str, str, tuple]] = []  # (table, sql, params)
+        self._first_pending_at = 0.0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._stopping = False
+        self._cond = threading.Condition()
+        
+        self._thread = threading.Thread(
+            target=self._run,
+            name="jarvis-memory-writer",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def submit(self, table: str, sql: str, params: tuple):
+        """
+        Queue a write.
+        
+        Args:
+            table: Table the statement writes to
+            sql: Parameterized SQL statement
+            params: Statement parameters
+        """
+        with self._cond:
+            if not self._pending:
+                self._first_pending_at = time.monotonic()
+            self._pending.append((table, sql, params))
+            # Wake the writer to start the time threshold or flush a full batch
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+    
+    def pending(self) -> int:
+        """Number of writes not yet committed."""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Write everything queued so far and wait for it to commit.
+        
+        Args:
+            timeout: Max seconds to wait
+            
+        Returns:
+            True if all pending writes were committed
+        """
+        with self._cond:
+            if not self._pending and not self._in_flight:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._in_flight,
+                timeout
+            )
+    
+    def close(self, timeout: float = 5.0):
+        """Flush remaining writes and stop the writer thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            self.logger.warning(f"Writer did not finish within {timeout}s ({self.pending()} writes pending)")
+    
+    def _ready(self) -> bool:
+        """Check whether the pending batch should be written now."""
+        if self._stopping or self._flush_requested:
+            return True
+        if len(self._pending) >= self.batch_size:
+            return True
+        return bool(self._pending) and time.monotonic() - self._first_pending_at >= self.flush_interval
+    
+    def _run(self):
+        """Writer thread loop."""
+        while True:
+            with self._cond:
+                while not self._ready():
+                    timeout = None
+                    if self._pending:
+                        timeout = max(0.0, self._first_pending_at + self.flush_interval - time.monotonic())
+                    self._cond.wait(timeout)
+                
+                batch = self._pending
+                self._pending = []
+                self._in_flight = len(batch)
+                self._flush_requested = False
+                stopping = self._stopping
+            
+            if batch:
+                self._write_batch(batch)
+            
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+                if stopping and not self._pending:
+                    return
+    
+    def _write_batch(self, batch: List[Tuple[str, str, tuple]]):
+        """Write a batch in one transaction, falling back to one-by-one on error."""
+        try:
+            with self.db.transaction() as conn:
+                for _, sql, params in batch:
+                    conn.execute(sql, params)
+            self.logger.debug(f"Wrote batch of {len(batch)}")
+        except Exception as e:
+            self.logger.error(f"Batch write failed ({e}), retrying individually")
+            for table, sql, params in batch:
+                try:
+                    with self.db.transaction() as conn:
+                        conn.execute(sql, params)
+                except Exception as item_error:
+                    self.logger.error(f"Dropped write to {table}: {item_error}")
+        
+        if self.after_write:
+            try:
+                self.after_write(batch)
+            except Exception as e:
+                self.logger.error(f"Post-write hook failed: {e}")
+
+
+class RetentionManager:
+    """
+    Keeps tables bounded without counting rows.
+    
+    Each table keeps its newest N rows by ID. Instead of COUNT(*) after
+    every insert, the watermark (MAX(id) - N) is computed from the primary
+    key index, and rows at or below it are deleted with a range delete.
+    Enforcement is amortized: it runs once every check_every inserts per
+    table, and each pass deletes at most max_delete rows so a large backlog
+    (e.g. an old install) is trimmed gradually.
+    """
+    
+    # Tables with an INTEGER PRIMARY KEY that grow without bound
+    TABLES = ('conversations', 'statistics', 'agent_debates', 'agent_beliefs')
+    
+    DEFAULT_LIMITS = {
+        'conversations': 1000,
+        'statistics': 5000,
+        'agent_debates': 1000,
+        'agent_beliefs': 500,
+    }
+    
+    def __init__(self, db: ConnectionManager, config: dict):
+        """
+        Initialize retention manager.
+        
+        Args:
+            db: Connection manager to write through
+            config: Retention configuration (memory.retention in config.yaml).
+                Per-table row limits; 0 or null keeps everything.
+        """
+        self.db = db
+        self.logger = logging.getLogger("jarvis.memory.retention")
+        
+        self.limits = {
+            table: config.get(table, self.DEFAULT_LIMITS[table])
+            for table in self.TABLES
+        }
+        self.check_every = max(1, config.get('check_every', 50))
+        self.max_delete = max(1, config.get('max_delete', 500))
+        
+        self._lock = threading.Lock()
+        self._inserts_since_check = {table: 0 for table in self.TABLES}
+    
+    def record_inserts(self, table: str, count: int = 1):
+        """
+        Note new rows in a table, enforcing its policy when due.
+        
+        Args:
+            table: Table that received inserts
+            count: Number of rows inserted
+        """
+        if not self.limits.get(table):
+            return
+        
+        with self._lock:
+            self._inserts_since_check[table] += count
+            due = self._inserts_since_check[table] >= self.check_every
+            if due:
+                self._inserts_since_check[table] = 0
+        
+        if due:
+            self.enforce(table)
+    
+    def enforce(self, table: str) -> int:
+        """
+        Delete rows below a table's retention watermark (one bounded pass).
+        
+        Args:
+            table: Table to trim
+            
+        Returns:
+            Number of rows deleted
+        """
+        keep = self.limits.get(table)
+        if not keep:
+            return 0
+        
+        try:
+            with self.db.transaction() as conn:
+                # Both are index lookups on the primary key
+                min_id, max_id = conn.execute(
+                    f"SELECT MIN(id), MAX(id) FROM {table}"
+                ).fetchone()
+                if max_id is None:
+                    return 0
+                
+                watermark = min(max_id - keep, min_id + self.max_delete - 1)
+                if watermark < min_id:
+                    return 0
+                
+                deleted = conn.execute(
+                    f"DELETE FROM {table} WHERE id <= ?", (watermark,)
+                ).rowcount
+            
+            if deleted:
+                self.logger.debug(f"Retention removed {deleted} rows from {table} (id <= {watermark})")
+            return deleted
+            
+        except Exception as e:
+            self.logger.error(f"Failed to enforce retention on {table}: {e}")
+            return 0
+    
+    def enforce_all(self):
+        """Run one bounded pass over every table."""
+        for table in self.TABLES:
+            self.enforce(table)
+
+
+class SemanticIndex:
+    """
+    Embedding-based retrieval over past interactions.
+    
+    Each interaction is embedded in the background with a local Ollama
+    embedding model and stored as a float16 BLOB in SQLite. Vectors are
+    L2-normalized and kept in an in-memory matrix, so a top-k cosine search
+    is a single matrix-vector product.
+    """
+    
+    def __init__(self, db: ConnectionManager, config: dict):
+        """
+        Initialize semantic index and start the embedding worker.
+        
+        Args:
+            db: Connection manager to read/write embeddings through
+            config: Semantic memory configuration (memory.semantic in config.yaml)
+        """
+        import numpy as np
+        self.np = np
+        
+        self.db = db
+        self.logger = logging.getLogger("jarvis.memory.semantic")
+        
+        self.model = config.get('model', 'nomic-embed-text')
+        self.top_k = config.get('top_k', 3)
+        self.min_score = config.get('min_score', 0.55)
+        self.batch_size = max(1, config.get('batch_size', 16))
+        self.backfill_limit = config.get('backfill', 500)
+        
+        # In-memory index: row i of _vectors belongs to conversation _ids[i]
+        self._lock = threading.Lock()
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._vectors = None
+        self._count = 0
+        
+        self._queue: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        self._load_index()
+        self._enqueue_backfill()
+        
+        self._thread = threading.Thread(
+            target=self._run,
+            name="jarvis-memory-embedder",
+            daemon=True
+        )
+        self._thread.start()
+        
+        self.logger.info(f"Semantic memory ready ({self._count} vectors, model: {self.model})")
+    
+    @staticmethod
+    def interaction_text(user_input: str, response: str) -> str:
+        """Text that represents an interaction in embedding space."""
+        return f"User: {user_input}\nJarvis: {response}"
+    
+    def add(self, interaction_id: int, text: str):
+        """
+        Queue an interaction for embedding.
+        
+        Args:
+            interaction_id: Conversation row ID
+            text: Text to embed
+        """
+        self._queue.put((interaction_id, text))
+    
+    def search(self, query: str, limit: int = None, exclude_ids: set = None) -> List[Tuple[int, float]]:
+        """
+        Find the interactions most similar to a query.
+        
+        Args:
+            query: Text to search for
+            limit: Number of results (defaults to configured top_k)
+            exclude_ids: Conversation IDs to leave out (e.g. the recent window)
+            
+        Returns:
+            List of (conversation_id, cosine score), best first, above min_score
+        """
+        np = self.np
+        limit = limit or self.top_k
+        
+        with self._lock:
+            if not self._count:
+                return []
+            ids = self._ids[:self._count]
+            vectors = self._vectors[:self._count]
+        
+        query_vector = self._embed([query])[0]
+        scores = vectors @ query_vector
+        
+        if exclude_ids:
+            scores = np.where(np.isin(ids, list(exclude_ids)), -1.0, scores)
+        
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        
+        return [
+            (int(ids[i]), float(scores[i]))
+            for i in top
+            if scores[i] >= self.min_score
+        ]
+    
+    def discard(self, interaction_ids: set):
+        """
+        Drop vectors for conversations that no longer exist.
+        
+        Args:
+            interaction_ids: Conversation IDs to remove from the in-memory index
+        """
+        np = self.np
+        with self._lock:
+            keep = ~np.isin(self._ids[:self._count], list(interaction_ids))
+            kept = int(keep.sum())
+            self._ids[:kept] = self._ids[:self._count][keep]
+            self._vectors[:kept] = self._vectors[:self._count][keep]
+            self._count = kept
+    
+    def _embed(self, texts: List[str]):
+        """
+        Embed texts with Ollama and L2-normalize them.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        import ollama
+        np = self.np
+        
+        if hasattr(ollama, 'embed'):
+            response = ollama.embed(model=self.model, input=texts)
+            vectors = response['embeddings']
+        else:
+            # Older clients only embed one prompt per call
+            vectors = [
+                ollama.embeddings(model=self.model, prompt=text)['embedding']
+                for text in texts
+            ]
+        
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+    
+    def _append(self, ids: List[int], matrix):
+        """Append normalized vectors to the in-memory index."""
+        np = self.np
+        with self._lock:
+            needed = self._count + len(ids)
+            if self._vectors is None or self._vectors.shape[1] != matrix.shape[1]:
+                self._vectors = np.zeros((max(needed, 64), matrix.shape[1]), dtype=np.float32)
+                self._ids = np.zeros(len(self._vectors), dtype=np.int64)
+                self._count = 0
+                needed = len(ids)
+            elif needed > len(self._vectors):
+                # Grow geometrically so appends stay amortized O(1)
+                capacity = max(needed, len(self._vectors) * 2)
+                self._vectors = np.resize(self._vectors, (capacity, self._vectors.shape[1]))
+                self._ids = np.resize(self._ids, capacity)
+            
+            self._vectors[self._count:needed] = matrix
+            self._ids[self._count:needed] = ids
+            self._count = needed
+    
+    def _load_index(self):
+        """Load stored vectors for the configured model."""
+        np = self.np
+        rows = self.db.connection().execute(
+            "SELECT conversation_id, vector FROM conversation_embeddings WHERE model = ?",
+            (self.model,)
+        ).fetchall()
+        if not rows:
+            return
+        
+        matrix = np.stack([np.frombuffer(row[1], dtype=np.float16) for row in rows]).astype(np.float32)
+        self._append([row[0] for row in rows], matrix)
+    
+    def _enqueue_backfill(self):
+        """Queue recent conversations that have no embedding yet."""
+        if not self.backfill_limit:
+            return
+        rows = self.db.connection().execute("""
+            SELECT c.id, c.user_input, c.response
+            FROM conversations c
+            LEFT JOIN conversation_embeddings e
+                ON e.conversation_id = c.id AND e.model = ?
+            WHERE e.conversation_id IS NULL
+              AND (c.intent IS NULL OR c.intent != 'idle_thought')
+            ORDER BY c.id DESC
+            LIMIT ?
+        """, (self.model, self.backfill_limit)).fetchall()
+        for row in rows:
+            self.add(row[0], self.interaction_text(row[1], row[2]))
+        if rows:
+            self.logger.info(f"Backfilling embeddings for {len(rows)} conversations")
+    
+    def _run(self):
+        """Embedding worker: embeds queued interactions in batches."""
+        np = self.np
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                ids = [item[0] for item in batch]
+                matrix = self._embed([item[1] for item in batch])
+                
+                with self.db.transaction() as conn:
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO conversation_embeddings
+                        (conversation_id, model, vector)
+                        VALUES (?, ?, ?)
+                    """, [
+                        (interaction_id, self.model, vector.astype(np.float16).tobytes())
+                        for interaction_id, vector in zip(ids, matrix)
+                    ])
+                
+                self._append(ids, matrix)
+                self.logger.debug(f"Embedded {len(batch)} interactions")
+                
+            except Exception as e:
+                self.logger.error(f"Failed to embed {len(batch)} interactions: {e}")
+                time.sleep(5)  # Don't spin if the embedding model is unavailable
+
+
 class MemorySystem:
     """
     Persistent memory storage for Jarvis.
@@ -38,14 +642,46 @@ class MemorySystem:
         
         self.db_path = str(db_path)
         
+        # Persistent per-thread connections (WAL mode)
+        self.db = ConnectionManager(self.db_path)
+        
         # Initialize database
         self._init_database()
         
+        # Per-table retention policies
+        self.retention = RetentionManager(self.db, config.get('retention', {}))
+        self.retention.enforce_all()
+        
+        # Conversation IDs are handed out here so callers get them back
+        # immediately, even when the insert itself is deferred
+        self._id_lock = threading.Lock()
+        self._last_conversation_id = self._load_last_conversation_id()
+        
+        # Semantic retrieval over past interactions (optional)
+        self.semantic = None
+        semantic_config = config.get('semantic', {})
+        if semantic_config.get('enabled', False):
+            try:
+                self.semantic = SemanticIndex(self.db, semantic_config)
+            except Exception as e:
+                self.logger.error(f"Semantic memory unavailable: {e}")
+        
+        # Background write-behind queue for per-turn records
+        write_behind = config.get('write_behind', {})
+        self.writer = None
+        if write_behind.get('enabled', True):
+            self.writer = WriteBehindQueue(
+                self.db,
+                batch_size=write_behind.get('batch_size', 32),
+                flush_interval=write_behind.get('flush_interval', 1.0),
+                after_write=self._after_write
+            )
+        
         self.logger.info(f"Memory system initialized: {self.db_path}")
     
     def _init_database(self):
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.cursor()
             
             # Conversations table
@@ -114,6 +750,7 @@ class MemorySystem:
                     jarvis_decision TEXT,
                     duration_seconds REAL,
                     debate_metadata TEXT,
+                    debate_tier TEXT,
                     FOREIGN KEY (interaction_id) REFERENCES conversations(id)
                 )
             """)
@@ -132,6 +769,23 @@ class MemorySystem:
                 )
             """)
             
+            # Conversation embeddings - compact float16 vectors for semantic retrieval
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS conversation_embeddings (
+                    conversation_id INTEGER PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    vector BLOB NOT NULL
+                )
+            """)
+            
+            # Embeddings go away with their conversation (including retention deletes)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS conversation_embeddings_delete
+                AFTER DELETE ON conversations BEGIN
+                    DELETE FROM conversation_embeddings WHERE conversation_id = old.id;
+                END
+            """)
+            
             # Migrate existing agent_debates table to add new columns
             # Check if columns exist, add them if they don't
             cursor.execute("PRAGMA table_info(agent_debates)")
@@ -148,8 +802,152 @@ class MemorySystem:
                 cursor.execute("ALTER TABLE agent_debates ADD COLUMN overall_confidence REAL")
                 self.logger.info("Migration complete - confidence tracking enabled")
             
+            if 'debate_tier' not in columns:
+                self.logger.info("Migrating agent_debates table - adding debate tier column")
+                cursor.execute("ALTER TABLE agent_debates ADD COLUMN debate_tier TEXT")
+            
             conn.commit()
             self.logger.debug("Database schema initialized")
+        
+        self.fts_enabled = self._init_search_index()
+    
+    # Full-text index definitions: FTS5 table -> (content table, indexed columns)
+    SEARCH_INDEXES = {
+        'conversations_fts': ('conversations', ('user_input', 'response')),
+        'agent_debates_fts': ('agent_debates', (
+            'user_input', 'analyst_response', 'skeptic_response',
+            'architect_response', 'expert_response', 'jarvis_decision'
+        )),
+    }
+    
+    def _init_search_index(self) -> bool:
+        """
+        Create FTS5 indexes over conversations and agent debates.
+        
+        The indexes are external-content tables kept in sync by triggers, so
+        every insert (including batched write-behind inserts) and every
+        retention delete updates them in the same transaction.
+        
+        Returns:
+            True if full-text search is available
+        """
+        try:
+            with self.db.transaction() as conn:
+                existing = {
+                    row[0] for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    )
+                }
+                
+                for fts_table, (table, columns) in self.SEARCH_INDEXES.items():
+                    column_list = ", ".join(columns)
+                    new_values = ", ".join(f"new.{c}" for c in columns)
+                    old_values = ", ".join(f"old.{c}" for c in columns)
+                    
+                    conn.execute(f"""
+                        CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                            {column_list},
+                            content='{table}',
+                            content_rowid='id',
+                            tokenize='porter unicode61'
+                        )
+                    """)
+                    conn.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {fts_table}_insert AFTER INSERT ON {table} BEGIN
+                            INSERT INTO {fts_table}(rowid, {column_list})
+                            VALUES (new.id, {new_values});
+                        END
+                    """)
+                    conn.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {fts_table}_delete AFTER DELETE ON {table} BEGIN
+                            INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                            VALUES ('delete', old.id, {old_values});
+                        END
+                    """)
+                    conn.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {fts_table}_update AFTER UPDATE ON {table} BEGIN
+                            INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                            VALUES ('delete', old.id, {old_values});
+                            INSERT INTO {fts_table}(rowid, {column_list})
+                            VALUES (new.id, {new_values});
+                        END
+                    """)
+                    
+                    # Index rows that existed before the index did
+                    if fts_table not in existing:
+                        self.logger.info(f"Building search index {fts_table}")
+                        conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+            
+            return True
+            
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Full-text search unavailable ({e}), falling back to LIKE queries")
+            return False
+    
+    @staticmethod
+    def _fts_query(text: str, match_any: bool = False) -> str:
+        """
+        Turn free text into a safe FTS5 query.
+        
+        Args:
+            text: User-entered search text
+            match_any: OR the terms together instead of requiring all of them
+            
+        Returns:
+            FTS5 MATCH expression (empty if text has no searchable terms)
+        """
+        terms = re.findall(r"\w+", text.lower())
+        # Quote each term so FTS5 operators/punctuation in user text are literal;
+        # the trailing * allows prefix matches while the user is typing
+        quoted = [f'"{term}"*' for term in terms]
+        return (" OR " if match_any else " ").join(quoted)
+    
+    def _load_last_conversation_id(self) -> int:
+        """Highest conversation ID ever assigned (including deleted rows)."""
+        conn = self.db.connection()
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM conversations").fetchone()[0]
+        row = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'conversations'"
+        ).fetchone()
+        return max(last_id, row[0] if row else 0)
+    
+    def _write(self, table: str, sql: str, params: tuple):
+        """
+        Write a record, through the write-behind queue when enabled.
+        
+        Args:
+            table: Table the statement writes to
+            sql: Parameterized SQL statement
+            params: Statement parameters
+        """
+        if self.writer:
+            self.writer.submit(table, sql, params)
+        else:
+            with self.db.transaction() as conn:
+                conn.execute(sql, params)
+            self._after_write([(table, sql, params)])
+    
+    def _after_write(self, batch: List[Tuple[str, str, tuple]]):
+        """Housekeeping after records are committed."""
+        counts: Dict[str, int] = {}
+        for table, _, _ in batch:
+            counts[table] = counts.get(table, 0) + 1
+        for table, count in counts.items():
+            self.retention.record_inserts(table, count)
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Commit all queued writes.
+        
+        Args:
+            timeout: Max seconds to wait
+            
+        Returns:
+            True if nothing is left pending
+        """
+        if not self.writer:
+            return True
+        return self.writer.flush(timeout)
     
     def store_interaction(
         self,
@@ -175,13 +973,17 @@ class MemorySystem:
         try:
             import json
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
+            with self._id_lock:
+                self._last_conversation_id += 1
+                interaction_id = self._last_conversation_id
+                
+                # Enqueue under the lock so rows are written in ID order
+                self._write('conversations', """
                     INSERT INTO conversations 
-                    (timestamp, user_input, response, intent, success, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    (id, timestamp, user_input, response, intent, success, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
+                    interaction_id,
                     datetime.now().isoformat(),
                     user_input,
                     response,
@@ -189,11 +991,9 @@ class MemorySystem:
                     success,
                     json.dumps(metadata) if metadata else None
                 ))
-                interaction_id = cursor.lastrowid
-                conn.commit()
             
-            # Cleanup old conversations if limit exceeded
-            self._cleanup_old_conversations()
+            if self.semantic and intent != 'idle_thought':
+                self.semantic.add(interaction_id, SemanticIndex.interaction_text(user_input, response))
             
             return interaction_id
             
@@ -212,10 +1012,11 @@ class MemorySystem:
             List of recent interactions
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            self.flush()  # Include writes still in the queue
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT user_input, response, intent
+                    SELECT user_input, response, intent, id
                     FROM conversations
                     ORDER BY id DESC
                     LIMIT ?
@@ -228,7 +1029,8 @@ class MemorySystem:
                     {
                         'input': row[0],
                         'response': row[1],
-                        'intent': row[2]
+                        'intent': row[2],
+                        'id': row[3]
                     }
                     for row in reversed(rows)
                 ]
@@ -236,33 +1038,60 @@ class MemorySystem:
             self.logger.error(f"Failed to retrieve context: {e}")
             return []
     
-    def _cleanup_old_conversations(self):
-        """Remove old conversations beyond retention limit."""
-        retention = self.config['retention']['conversations']
+    def get_relevant_context(self, query: str, limit: int = None, exclude_ids: set = None) -> List[Dict]:
+        """
+        Get older interactions semantically related to the query.
         
+        Complements get_recent_context: the recent window covers the last
+        few turns, this surfaces relevant exchanges from further back.
+        
+        Args:
+            query: Current user input
+            limit: Maximum number of interactions (defaults to memory.semantic.top_k)
+            exclude_ids: Conversation IDs already in the prompt
+            
+        Returns:
+            List of interactions in chronological order, each marked
+            'relevant': True with its similarity 'score'
+        """
+        if not self.semantic:
+            return []
+        
+        self.flush()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Count total conversations
-                cursor.execute("SELECT COUNT(*) FROM conversations")
-                total = cursor.fetchone()[0]
-                
-                if total > retention:
-                    # Delete oldest entries
-                    to_delete = total - retention
-                    cursor.execute("""
-                        DELETE FROM conversations
-                        WHERE id IN (
-                            SELECT id FROM conversations
-                            ORDER BY id ASC
-                            LIMIT ?
-                        )
-                    """, (to_delete,))
-                    conn.commit()
-                    self.logger.debug(f"Cleaned up {to_delete} old conversations")
+            matches = self.semantic.search(query, limit=limit, exclude_ids=exclude_ids)
+            if not matches:
+                return []
+            
+            scores = dict(matches)
+            placeholders = ", ".join("?" for _ in scores)
+            with self.db.connection() as conn:
+                rows = conn.execute(f"""
+                    SELECT id, user_input, response, intent
+                    FROM conversations
+                    WHERE id IN ({placeholders})
+                    ORDER BY id ASC
+                """, list(scores)).fetchall()
+            
+            # Vectors for conversations removed by retention
+            missing = set(scores) - {row[0] for row in rows}
+            if missing:
+                self.semantic.discard(missing)
+            
+            return [
+                {
+                    'input': row[1],
+                    'response': row[2],
+                    'intent': row[3],
+                    'id': row[0],
+                    'relevant': True,
+                    'score': scores[row[0]]
+                }
+                for row in rows
+            ]
         except Exception as e:
-            self.logger.error(f"Failed to cleanup conversations: {e}")
+            self.logger.error(f"Failed to retrieve relevant context: {e}")
+            return []
     
     def set_preference(self, key: str, value: str):
         """
@@ -273,7 +1102,7 @@ class MemorySystem:
             value: Preference value
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT OR REPLACE INTO preferences (key, value, updated_at)
@@ -295,7 +1124,7 @@ class MemorySystem:
             Preference value or default
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT value FROM preferences WHERE key = ?", (key,))
                 row = cursor.fetchone()
@@ -315,17 +1144,14 @@ class MemorySystem:
         try:
             import json
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO statistics (event_type, event_data, timestamp)
-                    VALUES (?, ?, ?)
-                """, (
-                    event_type,
-                    json.dumps(event_data) if event_data else None,
-                    datetime.now().isoformat()
-                ))
-                conn.commit()
+            self._write('statistics', """
+                INSERT INTO statistics (event_type, event_data, timestamp)
+                VALUES (?, ?, ?)
+            """, (
+                event_type,
+                json.dumps(event_data) if event_data else None,
+                datetime.now().isoformat()
+            ))
         except Exception as e:
             self.logger.error(f"Failed to log statistic: {e}")
     
@@ -343,7 +1169,8 @@ class MemorySystem:
         try:
             import json
             
-            with sqlite3.connect(self.db_path) as conn:
+            self.flush()  # Include writes still in the queue
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 
                 if event_type:
@@ -377,7 +1204,10 @@ class MemorySystem:
             return []
     
     def close(self):
-        """Close database connection."""
+        """Flush queued writes and close database connections."""
+        if self.writer:
+            self.writer.close()
+        self.db.close()
         self.logger.info("Memory system closed")
     
     # Context-aware learning methods
@@ -392,7 +1222,7 @@ class MemorySystem:
             value: Context value
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.transaction() as conn:
                 cursor = conn.cursor()
                 
                 # Check if context exists
@@ -437,7 +1267,7 @@ class MemorySystem:
             Most frequently used value or None
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT context_value, frequency
@@ -464,7 +1294,8 @@ class MemorySystem:
             List of frequent commands with usage counts
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            self.flush()  # Include writes still in the queue
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT intent, COUNT(*) as count
@@ -480,6 +1311,149 @@ class MemorySystem:
             self.logger.error(f"Failed to get frequent commands: {e}")
             return []
     
+    def get_recent_interactions(self, limit: int = 50) -> List[Dict]:
+        """
+        Get recent conversation records for display, newest first.
+        
+        Args:
+            limit: Number of interactions to retrieve
+            
+        Returns:
+            List of interactions with timestamp, input, response and intent
+        """
+        try:
+            self.flush()  # Include writes still in the queue
+            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, timestamp, user_input, response, intent
+                    FROM conversations
+                    ORDER BY id DESC
+                    LIMIT ?
+                """, (limit,))
+                
+                return [
+                    {
+                        'id': row[0],
+                        'timestamp': row[1],
+                        'user_input': row[2],
+                        'response': row[3],
+                        'intent': row[4]
+                    }
+                    for row in cursor.fetchall()
+                ]
+        except Exception as e:
+            self.logger.error(f"Failed to get recent interactions: {e}")
+            return []
+    
+    def search_history(self, query: str, limit: int = 20, match_any: bool = False) -> List[Dict]:
+        """
+        Full-text search over conversation history, best matches first.
+        
+        Args:
+            query: Search text
+            limit: Maximum number of results
+            match_any: Match interactions containing any term (default: all terms)
+            
+        Returns:
+            List of matching interactions, each with a 'snippet' where
+            matched terms are wrapped in [brackets]
+        """
+        fts_query = self._fts_query(query, match_any)
+        if not fts_query:
+            return []
+        
+        try:
+            self.flush()  # Include writes still in the queue
+            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                if self.fts_enabled:
+                    cursor.execute("""
+                        SELECT c.id, c.timestamp, c.user_input, c.response, c.intent,
+                               snippet(conversations_fts, -1, '[', ']', '...', 12),
+                               f.rank
+                        FROM conversations_fts f
+                        JOIN conversations c ON c.id = f.rowid
+                        WHERE conversations_fts MATCH ?
+                        ORDER BY f.rank
+                        LIMIT ?
+                    """, (fts_query, limit))
+                else:
+                    cursor.execute("""
+                        SELECT id, timestamp, user_input, response, intent,
+                               user_input, 0
+                        FROM conversations
+                        WHERE user_input LIKE ? OR response LIKE ?
+                        ORDER BY id DESC
+                        LIMIT ?
+                    """, (f'%{query}%', f'%{query}%', limit))
+                
+                return [
+                    {
+                        'id': row[0],
+                        'timestamp': row[1],
+                        'user_input': row[2],
+                        'response': row[3],
+                        'intent': row[4],
+                        'snippet': row[5],
+                        'rank': row[6]
+                    }
+                    for row in cursor.fetchall()
+                ]
+        except Exception as e:
+            self.logger.error(f"Failed to search history: {e}")
+            return []
+    
+    def search_debates(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Full-text search over stored agent debates, best matches first.
+        
+        Args:
+            query: Search text
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching debates with id, timestamp, user_input,
+            jarvis_decision, overall_confidence and 'snippet'
+        """
+        fts_query = self._fts_query(query)
+        if not fts_query or not self.fts_enabled:
+            return []
+        
+        try:
+            self.flush()  # Include writes still in the queue
+            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT d.id, d.timestamp, d.user_input, d.jarvis_decision,
+                           d.overall_confidence,
+                           snippet(agent_debates_fts, -1, '[', ']', '...', 12)
+                    FROM agent_debates_fts f
+                    JOIN agent_debates d ON d.id = f.rowid
+                    WHERE agent_debates_fts MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                """, (fts_query, limit))
+                
+                return [
+                    {
+                        'id': row[0],
+                        'timestamp': row[1],
+                        'user_input': row[2],
+                        'jarvis_decision': row[3],
+                        'overall_confidence': row[4],
+                        'snippet': row[5]
+                    }
+                    for row in cursor.fetchall()
+                ]
+        except Exception as e:
+            self.logger.error(f"Failed to search debates: {e}")
+            return []
+    
     def get_contextual_suggestions(self, current_context: str) -> List[str]:
         """
         Get contextual suggestions based on history.
@@ -491,19 +1465,36 @@ class MemorySystem:
             List of suggested actions
         """
         try:
+            self.flush()  # Include writes still in the queue
+            
             suggestions = []
             
             # Get similar past interactions
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT response, COUNT(*) as count
-                    FROM conversations
-                    WHERE user_input LIKE ? AND success = 1
-                    GROUP BY response
-                    ORDER BY count DESC
-                    LIMIT 3
-                """, (f'%{current_context}%',))
+                terms = re.findall(r"\w+", current_context.lower())
+                
+                if self.fts_enabled and terms:
+                    # Phrase match on user_input via the index instead of a table scan
+                    phrase = " ".join(terms)
+                    cursor.execute("""
+                        SELECT c.response, COUNT(*) as count
+                        FROM conversations_fts f
+                        JOIN conversations c ON c.id = f.rowid
+                        WHERE conversations_fts MATCH ? AND c.success = 1
+                        GROUP BY c.response
+                        ORDER BY count DESC, MIN(f.rank)
+                        LIMIT 3
+                    """, (f'user_input : "{phrase}"',))
+                else:
+                    cursor.execute("""
+                        SELECT response, COUNT(*) as count
+                        FROM conversations
+                        WHERE user_input LIKE ? AND success = 1
+                        GROUP BY response
+                        ORDER BY count DESC
+                        LIMIT 3
+                    """, (f'%{current_context}%',))
                 
                 suggestions = [row[0] for row in cursor.fetchall()]
             
@@ -531,53 +1522,51 @@ class MemorySystem:
         try:
             import json
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    INSERT INTO agent_debates (
-                        interaction_id,
-                        timestamp,
-                        user_input,
-                        analyst_response,
-                        analyst_confidence,
-                        skeptic_response,
-                        skeptic_confidence,
-                        architect_response,
-                        architect_confidence,
-                        expert_response,
-                        expert_confidence,
-                        expert_domain,
-                        overall_confidence,
-                        jarvis_decision,
-                        duration_seconds,
-                        debate_metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            self._write('agent_debates', """
+                INSERT INTO agent_debates (
                     interaction_id,
-                    debate_result.get('timestamp'),
+                    timestamp,
                     user_input,
-                    debate_result.get('analyst_response'),
-                    debate_result.get('analyst_confidence', 0.7),
-                    debate_result.get('skeptic_response'),
-                    debate_result.get('skeptic_confidence', 0.7),
-                    debate_result.get('architect_response'),
-                    debate_result.get('architect_confidence', 0.7),
-                    debate_result.get('expert_response'),
-                    debate_result.get('expert_confidence'),
-                    debate_result.get('expert_domain'),
-                    debate_result.get('overall_confidence', 0.7),
+                    analyst_response,
+                    analyst_confidence,
+                    skeptic_response,
+                    skeptic_confidence,
+                    architect_response,
+                    architect_confidence,
+                    expert_response,
+                    expert_confidence,
+                    expert_domain,
+                    overall_confidence,
                     jarvis_decision,
-                    debate_result.get('duration_seconds'),
-                    json.dumps({
-                        'enabled': debate_result.get('enabled', False),
-                        'error': debate_result.get('error')
-                    })
-                ))
-                
-                conn.commit()
-                self.logger.debug(f"Agent debate stored (confidence: {debate_result.get('overall_confidence', 0.7):.2f})")
-                
+                    duration_seconds,
+                    debate_metadata,
+                    debate_tier
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                interaction_id,
+                debate_result.get('timestamp'),
+                user_input,
+                debate_result.get('analyst_response'),
+                debate_result.get('analyst_confidence', 0.7),
+                debate_result.get('skeptic_response'),
+                debate_result.get('skeptic_confidence', 0.7),
+                debate_result.get('architect_response'),
+                debate_result.get('architect_confidence', 0.7),
+                debate_result.get('expert_response'),
+                debate_result.get('expert_confidence'),
+                debate_result.get('expert_domain'),
+                debate_result.get('overall_confidence', 0.7),
+                jarvis_decision,
+                debate_result.get('duration_seconds'),
+                json.dumps({
+                    'enabled': debate_result.get('enabled', False),
+                    'error': debate_result.get('error'),
+                    'gate_reason': debate_result.get('gate_reason')
+                }),
+                debate_result.get('tier', 'full')
+            ))
+            self.logger.debug(f"Agent debate stored (confidence: {debate_result.get('overall_confidence', 0.7):.2f})")
+            
         except Exception as e:
             self.logger.error(f"Failed to store agent debate: {e}")
     
@@ -594,7 +1583,8 @@ class MemorySystem:
         try:
             import json
             
-            with sqlite3.connect(self.db_path) as conn:
+            self.flush()  # Include writes still in the queue
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT 
@@ -613,7 +1603,8 @@ class MemorySystem:
                         overall_confidence,
                         jarvis_decision,
                         duration_seconds,
-                        debate_metadata
+                        debate_metadata,
+                        debate_tier
                     FROM agent_debates
                     ORDER BY timestamp DESC
                     LIMIT ?
@@ -638,6 +1629,7 @@ class MemorySystem:
                         'jarvis_decision': row[13],
                         'duration_seconds': row[14],
                         'metadata': json.loads(row[15]) if row[15] else {},
+                        'tier': row[16] or 'full',
                         'enabled': True
                     })
                 
@@ -647,26 +1639,57 @@ class MemorySystem:
             self.logger.error(f"Failed to get debates: {e}")
             return []
     
+    def get_average_debate_confidence(self, limit: int = 20) -> Optional[float]:
+        """
+        Average overall confidence of recent full debates.
+        
+        Used by the debate gate to decide whether a shortened pass is enough.
+        
+        Args:
+            limit: Number of recent debates to average over
+            
+        Returns:
+            Average confidence, or None if there is no history yet
+        """
+        try:
+            self.flush()  # Include writes still in the queue
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT AVG(overall_confidence) FROM (
+                        SELECT overall_confidence
+                        FROM agent_debates
+                        WHERE overall_confidence IS NOT NULL
+                          AND (debate_tier IS NULL OR debate_tier = 'full')
+                        ORDER BY id DESC
+                        LIMIT ?
+                    )
+                """, (limit,))
+                row = cursor.fetchone()
+                return row[0] if row and row[0] is not None else None
+        except Exception as e:
+            self.logger.error(f"Failed to get debate confidence: {e}")
+            return None
+    
     def store_agent_belief(self, agent_name: str, topic_key: str, opinion: str, 
                           confidence: float, interaction_count: int):
         """Store agent belief/opinion for learning over time."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO agent_beliefs
-                    (agent_name, topic_key, opinion, confidence, interaction_count, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (agent_name, topic_key, opinion, confidence, 
-                     interaction_count, datetime.now().isoformat()))
-                conn.commit()
+            self._write('agent_beliefs', """
+                INSERT OR REPLACE INTO agent_beliefs
+                (agent_name, topic_key, opinion, confidence, interaction_count, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (agent_name, topic_key, opinion, confidence, 
+                 interaction_count, datetime.now().isoformat()))
         except Exception as e:
             self.logger.error(f"Failed to store agent belief: {e}")
     
     def get_agent_belief(self, agent_name: str, topic_key: str) -> Optional[Dict]:
         """Retrieve agent's previous opinion on topic."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            self.flush()  # Include writes still in the queue
+            
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT opinion, confidence, interaction_count, timestamp
@@ -0,0 +1,184 @@
+"""
+Startup Module - Parallel Subsystem Initialization
+
+Runs subsystem initializers as a dependency graph so independent subsystems
+(e.g. loading the Whisper model and connecting to Ollama) start concurrently,
+and records per-stage wall time for a startup report.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class StartupReport:
+    """Per-stage timings of one startup run."""
+    
+    def __init__(self):
+        # name -> (start offset, end offset, thread name), offsets in seconds
+        self.stages: Dict[str, Tuple[float, float, str]] = {}
+        self.requires: Dict[str, Tuple[str, ...]] = {}
+        self.wall_time = 0.0
+    
+    def record(self, name: str, start: float, end: float, requires: Tuple[str, ...]):
+        """Record a finished stage."""
+        self.stages[name] = (start, end, threading.current_thread().name)
+        self.requires[name] = requires
+    
+    @property
+    def total_stage_time(self) -> float:
+        """Sum of all stage durations (what a sequential start would cost)."""
+        return sum(end - start for start, end, _ in self.stages.values())
+    
+    def critical_path(self) -> List[str]:
+        """
+        Chain of stages that determined the wall time.
+        
+        Returns:
+            Stage names from first to last
+        """
+        if not self.stages:
+            return []
+        
+        path = [max(self.stages, key=lambda name: self.stages[name][1])]
+        while True:
+            requires = [name for name in self.requires.get(path[-1], ()) if name in self.stages]
+            if not requires:
+                break
+            path.append(max(requires, key=lambda name: self.stages[name][1]))
+        return list(reversed(path))
+    
+    def to_dict(self) -> dict:
+        """Report as plain data (e.g. for the API or statistics)."""
+        return {
+            'wall_time': round(self.wall_time, 3),
+            'total_stage_time': round(self.total_stage_time, 3),
+            'critical_path': self.critical_path(),
+            'stages': {
+                name: {
+                    'start': round(start, 3),
+                    'duration': round(end - start, 3),
+                    'thread': thread
+                }
+                for name, (start, end, thread) in self.stages.items()
+            }
+        }
+    
+    def format(self) -> str:
+        """Human-readable report."""
+        lines = [
+            f"Startup: {self.wall_time:.2f}s wall "
+            f"(stages total {self.total_stage_time:.2f}s)"
+        ]
+        for name, (start, end, thread) in sorted(self.stages.items(), key=lambda item: item[1][0]):
+            lines.append(f"  {name:<10} {start:6.2f}s -> {end:6.2f}s  {end - start:6.2f}s  [{thread}]")
+        lines.append(f"  Critical path: {' -> '.join(self.critical_path())}")
+        return "\n".join(lines)
+
+
+class StartupGraph:
+    """
+    Dependency graph of initialization stages.
+    
+    A stage starts as soon as every stage it requires has finished. Stages
+    run on a thread pool, except those marked main_thread, which run on the
+    thread calling run() (for objects with thread affinity such as COM).
+    """
+    
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize graph.
+        
+        Args:
+            max_workers: Maximum stages running concurrently on the pool
+        """
+        self.max_workers = max_workers
+        self._stages: Dict[str, Tuple[Callable[[], None], Tuple[str, ...], bool]] = {}
+    
+    def add(self, name: str, fn: Callable[[], None], requires: Tuple[str, ...] = (), main_thread: bool = False):
+        """
+        Add a stage.
+        
+        Args:
+            name: Stage name
+            fn: Initializer to run
+            requires: Names of stages that must finish first
+            main_thread: Run on the calling thread instead of the pool
+        """
+        self._stages[name] = (fn, tuple(requires), main_thread)
+    
+    def run(self) -> StartupReport:
+        """
+        Run all stages.
+        
+        Returns:
+            Startup report
+        
+        Raises:
+            The first exception raised by a stage, after running stages finish
+        """
+        for name, (_, requires, _) in self._stages.items():
+            missing = [dep for dep in requires if dep not in self._stages]
+            if missing:
+                raise ValueError(f"Startup stage '{name}' requires unknown stage(s): {missing}")
+        
+        report = StartupReport()
+        origin = time.perf_counter()
+        pending = dict(self._stages)
+        done = set()
+        error: Optional[BaseException] = None
+        
+        def run_stage(name: str):
+            fn, requires, _ = self._stages[name]
+            start = time.perf_counter() - origin
+            fn()
+            report.record(name, start, time.perf_counter() - origin, requires)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jarvis-init") as pool:
+            running = {}
+            
+            while (pending and error is None) or running:
+                ready = [
+                    name for name, (_, requires, _) in pending.items()
+                    if all(dep in done for dep in requires)
+                ] if error is None else []
+                
+                # Start pool stages first so they overlap with main-thread work
+                for name in ready:
+                    if not pending[name][2]:
+                        running[pool.submit(run_stage, name)] = name
+                        del pending[name]
+                
+                main_ready = [name for name in ready if name in pending]
+                if main_ready:
+                    name = main_ready[0]
+                    del pending[name]
+                    try:
+                        run_stage(name)
+                        done.add(name)
+                    except BaseException as e:
+                        error = e
+                    continue
+                
+                if not running:
+                    if pending and error is None:
+                        raise ValueError(f"Startup stages have a dependency cycle: {list(pending)}")
+                    break
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        done.add(name)
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+        
+        report.wall_time = time.perf_counter() - origin
+        
+        if error is not None:
+            raise error
+        
+        return report
@@ -0,0 +1,184 @@
+"""
+Streaming Transcription Module
+
+Transcribes speech while it is still being recorded. Overlapping windows
+over the not-yet-confirmed audio are decoded repeatedly; words that two
+consecutive passes agree on are committed and never decoded again, so once
+recording stops only the short unconfirmed tail is left to transcribe.
+"""
+
+import logging
+import re
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from core.whisper_models import WHISPER_SAMPLE_RATE, WhisperModelManager
+
+
+def _normalize_word(word: str) -> str:
+    """Word as compared between passes (case and punctuation ignored)."""
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+class StreamingTranscriber:
+    """
+    Incremental transcription of one utterance.
+    
+    A background thread repeatedly transcribes audio from the commit point
+    to the end of what has been captured so far. The longest word prefix on
+    which the last two passes agree is committed, and the commit point moves
+    to the end of its last word (local agreement).
+    """
+    
+    def __init__(
+        self,
+        models: WhisperModelManager,
+        config: dict,
+        on_partial: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize streaming transcriber.
+        
+        Args:
+            models: Shared Whisper model manager
+            config: Streaming configuration (stt.streaming in config.yaml)
+            on_partial: Called with committed + tentative text after each pass
+        """
+        self.models = models
+        self.get_audio: Optional[Callable[[], np.ndarray]] = None
+        self.on_partial = on_partial
+        self.logger = logging.getLogger("jarvis.stt.streaming")
+        
+        self.step = config.get('step', 1.0)  # Seconds between passes
+        self.min_window = config.get('min_window', 1.0)  # Seconds of new audio before a pass
+        self.final_beam_size = config.get('final_beam_size', 5)
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset()
+    
+    def _reset(self):
+        """Forget all transcription state."""
+        self.committed_words: List[str] = []
+        self.committed_sample = 0
+        self.passes = 0
+        
+        # Words (text, end sample) of the previous pass, not yet committed
+        self._hypothesis: List[Tuple[str, int]] = []
+        self._stop.clear()
+    
+    @property
+    def committed_text(self) -> str:
+        """Text confirmed so far."""
+        return " ".join(self.committed_words)
+    
+    def start(self, get_audio: Callable[[], np.ndarray]):
+        """
+        Start transcribing in the background (restarts from scratch if
+        already running).
+        
+        Args:
+            get_audio: Returns the mono float32 audio captured so far
+        """
+        self.stop()
+        self._reset()
+        self.get_audio = get_audio
+        self._thread = threading.Thread(target=self._run, name="jarvis-stt-streaming", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """Pass loop."""
+        while not self._stop.wait(self.step):
+            try:
+                audio = self.get_audio()
+                if len(audio) - self.committed_sample < self.min_window * WHISPER_SAMPLE_RATE:
+                    continue
+                self._pass(audio)
+            except Exception as e:
+                self.logger.warning(f"Streaming pass failed: {e}")
+    
+    def _transcribe(self, audio: np.ndarray, offset: int, beam_size: int) -> List[Tuple[str, int]]:
+        """
+        Transcribe audio from a sample offset.
+        
+        Returns:
+            Words with the absolute sample where each ends
+        """
+        segments, _ = self.models.transcribe(
+            audio[offset:],
+            language="en",
+            beam_size=beam_size,
+            word_timestamps=True,
+            initial_prompt=self.committed_text[-200:] or None,
+            condition_on_previous_text=False
+        )
+        
+        words = []
+        for segment in segments:
+            for word in (segment.words or []):
+                text = word.word.strip()
+                if text:
+                    words.append((text, offset + int(word.end * WHISPER_SAMPLE_RATE)))
+        return words
+    
+    def _pass(self, audio: np.ndarray):
+        """Transcribe the unconfirmed window and commit the agreed prefix."""
+        with self._lock:
+            if self._stop.is_set():
+                return
+            
+            words = self._transcribe(audio, self.committed_sample, beam_size=1)
+            self.passes += 1
+            
+            agreed = 0
+            for (previous, _), (current, _) in zip(self._hypothesis, words):
+                if _normalize_word(previous) != _normalize_word(current):
+                    break
+                agreed += 1
+            
+            if agreed:
+                self.committed_words.extend(text for text, _ in words[:agreed])
+                self.committed_sample = words[agreed - 1][1]
+                self.logger.debug(f"Committed: {self.committed_text}")
+            
+            self._hypothesis = words[agreed:]
+            if self.on_partial:
+                tentative = " ".join(text for text, _ in self._hypothesis)
+                self.on_partial(f"{self.committed_text} {tentative}".strip())
+    
+    def stop(self):
+        """Stop background passes (waits for a running pass to finish)."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def finish(self, audio: Optional[np.ndarray]) -> str:
+        """
+        Stop streaming and transcribe the unconfirmed tail.
+        
+        Args:
+            audio: Complete mono float32 recording (None if nothing was recorded)
+        
+        Returns:
+            Full transcription
+        """
+        self.stop()
+        
+        if audio is None:
+            return ""
+        
+        with self._lock:
+            tail = []
+            if len(audio) - self.committed_sample >= 0.1 * WHISPER_SAMPLE_RATE:
+                tail = self._transcribe(audio, self.committed_sample, beam_size=self.final_beam_size)
+            
+            self.logger.debug(
+                f"Streaming: {self.passes} passes, final pass over "
+                f"{(len(audio) - self.committed_sample) / WHISPER_SAMPLE_RATE:.1f}s "
+                f"of {len(audio) / WHISPER_SAMPLE_RATE:.1f}s"
+            )
+            return " ".join(self.committed_words + [text for text, _ in tail]).strip()
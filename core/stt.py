@@ -23,12 +23,13 @@ class SpeechRecognizer:
     - API (OpenAI): Fast, requires internet, costs money, privacy concerns
     """
     
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, vad_config: dict = None):
         """
         Initialize speech recognizer.
         
         Args:
             config: STT configuration from config.yaml
+            vad_config: VAD configuration (voice detection for capture and trimming)
         """
         self.config = config
         self.logger = logging.getLogger("jarvis.stt")
@@ -40,6 +41,8 @@ class SpeechRecognizer:
         self.sample_rate = config['audio']['sample_rate']
         self.channels = config['audio']['channels']
         self.duration = config['audio']['duration']
+        self.max_recording_time = config.get('capture', {}).get('max_segment', 15)  # Open mic safety limit (seconds)
+        self.pre_roll = config['audio'].get('pre_roll', 0.0)
         
         # Activation settings
         self.activation_mode = config['activation']['mode']
@@ -47,6 +50,58 @@ class SpeechRecognizer:
         self.activation_key = config['activation'].get('key', 'space')
         self.interrupt_key = config['activation'].get('interrupt_key', 'ctrl')  # Key to interrupt speech
         
+        # One VAD for capture and (optionally) silence trimming
+        from core.vad import VoiceActivityDetector
+        self.vad = VoiceActivityDetector({**(vad_config or {}), 'enabled': True})
+        
+        # Single microphone stream; VAD turns it into speech segments
+        from core.capture import CaptureEngine
+        self.capture_config = config.get('capture', {})
+        self.listen_timeout = self.capture_config.get('listen_timeout', 5.0)
+        capture_seconds = max(self.duration, self.max_recording_time) + self.pre_roll + 2
+        self.capture = CaptureEngine(
+            self.capture_config,
+            self.vad,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            capacity=capture_seconds
+        )
+        self.ring = self.capture.ring
+        self.capture.subscribe('level', self._update_audio_level)
+        
+        # Keyword spotting gates Whisper while waiting for the wake word
+        from core.wake_word import WakeWordSpotter
+        self.spotter = WakeWordSpotter(config.get('wake_word_spotter', {}), self.sample_rate)
+        
+        # Preprocessing: trim silence before transcription, adapt beam size
+        self.preprocess_config = config.get('preprocess', {})
+        from core.audio_preprocess import SpeechTrimmer
+        self.trimmer = SpeechTrimmer(
+            self.preprocess_config,
+            self.sample_rate,
+            vad=self.vad if self.preprocess_config.get('method') == 'vad' else None
+        )
+        
+        # Replay: read utterances from WAV files instead of the microphone
+        self.replay_config = config.get('replay', {})
+        self.replay = self.replay_config.get('enabled', False)
+        self.replay_files = []
+        self._replay_index = 0
+        if self.replay:
+            self._init_replay()
+        
+        # Streaming: transcribe while recording (local mode only, needs the microphone)
+        self.streaming_config = config.get('streaming', {})
+        self.streaming = self.mode == 'local' and self.streaming_config.get('enabled', False) and not self.replay
+        self.on_partial = None  # Called with the partial transcript while streaming
+        
+        # Transcript cache: repeated audio (replayed fixtures) skips the model
+        self.cache = None
+        cache_config = config.get('transcript_cache', {})
+        if cache_config.get('enabled', False) or (self.replay and self.replay_config.get('cache', True)):
+            from core.transcript_cache import TranscriptCache
+            self.cache = TranscriptCache(cache_config)
+        
         # Initialize backend
         if self.mode == 'local':
             self._init_local()
@@ -58,20 +113,11 @@ class SpeechRecognizer:
         self.logger.info(f"STT initialized in {self.mode} mode")
     
     def _init_local(self):
-        """Initialize local Whisper model."""
+        """Initialize local Whisper model (shared and warmed up by the model manager)."""
         try:
-            from faster_whisper import WhisperModel
-            
-            model_size = self.config['local']['model']
-            device = self.config['local']['device']
-            compute_type = self.config['local']['compute_type']
+            from core.whisper_models import get_model_manager
             
-            self.logger.info(f"Loading Whisper model: {model_size} on {device}")
-            self.model = WhisperModel(
-                model_size,
-                device=device,
-                compute_type=compute_type
-            )
+            self.models = get_model_manager(self.config['local'])
             self.logger.info("Local Whisper model loaded")
             
         except ImportError:
@@ -81,6 +127,11 @@ class SpeechRecognizer:
             self.logger.error(f"Failed to load Whisper model: {e}")
             raise
     
+    @property
+    def model(self):
+        """Currently resident Whisper model."""
+        return self.models.model
+    
     def _init_api(self):
         """Initialize OpenAI Whisper API."""
         import openai
@@ -93,128 +144,284 @@ class SpeechRecognizer:
         self.openai = openai
         self.logger.info("OpenAI Whisper API configured")
     
-    def record_audio(self, bypass_activation: bool = False) -> Optional[np.ndarray]:
+    def _init_replay(self):
+        """Collect the WAV files to replay."""
+        import os
+        
+        path = self.replay_config.get('path', 'tests/fixtures')
+        if os.path.isdir(path):
+            self.replay_files = sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.lower().endswith('.wav')
+            )
+        elif os.path.isfile(path):
+            self.replay_files = [path]
+        
+        if not self.replay_files:
+            self.logger.warning(f"Replay mode: no WAV files found at {path}")
+        else:
+            self.logger.info(f"Replay mode: {len(self.replay_files)} recordings from {path}")
+    
+    @property
+    def replay_remaining(self) -> int:
+        """Recordings not yet played in the current pass."""
+        return max(0, len(self.replay_files) - self._replay_index)
+    
+    def _next_replay_clip(self) -> Optional[np.ndarray]:
+        """
+        Decode the next replay recording.
+        
+        Returns:
+            Mono float32 audio, or None when every file has been played
+            (and looping is off)
+        """
+        from core.audio_preprocess import decode_wav
+        
+        if self._replay_index >= len(self.replay_files):
+            if not self.replay_config.get('loop', False) or not self.replay_files:
+                return None
+            self._replay_index = 0
+        
+        path = self.replay_files[self._replay_index]
+        self._replay_index += 1
+        self.logger.debug(f"Replaying {path}")
+        return decode_wav(path, self.sample_rate)
+    
+    def _cached(self, audio: np.ndarray, transcribe, **settings) -> str:
+        """
+        Transcribe through the transcript cache (if enabled).
+        
+        Args:
+            audio: Mono float32 audio
+            transcribe: Called with no arguments to produce the text on a miss
+            **settings: Everything besides the audio that affects the text
+        
+        Returns:
+            Transcribed text
+        """
+        if self.cache is None:
+            return transcribe()
+        
+        key = self.cache.key(audio, **settings)
+        text = self.cache.get(key)
+        if text is None:
+            text = transcribe()
+            if text:
+                self.cache.put(key, text)
+        return text
+    
+    @staticmethod
+    def _to_mono(audio: np.ndarray) -> np.ndarray:
+        """Convert recorded audio to the 1D float32 samples Whisper expects."""
+        if audio.ndim > 1:
+            # Single channel is just a view; only mix down real multichannel audio
+            audio = audio[:, 0] if audio.shape[1] == 1 else audio.mean(axis=1)
+        return audio.astype(np.float32, copy=False)
+    
+    def _copy(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        """
+        Copy audio out of the capture ring buffer.
+        
+        Args:
+            start: First sample position
+            end: Position after the last sample (default: current position)
+        
+        Returns:
+            Array of shape (samples, channels) that the capture can't overwrite
+        
+        Raises:
+            RuntimeError: If the start has already been overwritten
+        """
+        audio = np.array(self.ring.view(start, end))
+        # Checked after copying, so a write that overtook the copy is caught
+        if start < self.ring.oldest:
+            raise RuntimeError("Recording was overwritten in the capture buffer")
+        return audio
+    
+    def _start_streaming(self, streamer, start: int):
+        """Start a streaming transcriber over the recording from a ring position."""
+        # A copy: streaming passes keep the audio while Whisper runs, and
+        # sample offsets must not shift if the buffer wraps past the start
+        streamer.start(lambda: self._to_mono(self._copy(start)))
+    
+    def _update_audio_level(self, rms: float):
+        """Capture level listener: drive the dashboard's audio visualization."""
+        if self.dashboard:
+            # Normalize to 0.0-1.0 range (typical speech is 0.01-0.3)
+            level = min(1.0, rms * 5.0)
+            try:
+                self.dashboard.update_audio_level(level)
+            except:
+                pass  # Dashboard might not be ready
+    
+    def record_audio(self, bypass_activation: bool = False, streamer=None) -> Optional[np.ndarray]:
         """
         Record audio from microphone.
         
+        Open mic and wake word listening take the next speech segment found
+        by the capture engine; push to talk records while the key is held.
+        When the microphone stream closes after recording (push to talk
+        without pre-roll), the returned array is a view into the capture
+        ring buffer, valid until the next recording; while the stream stays
+        open it is a copy, because capture keeps writing into the buffer.
+        In replay mode the next WAV recording is returned instead.
+        
         Args:
             bypass_activation: Skip activation key/wake word (for open mic mode)
+            streamer: StreamingTranscriber to feed while recording (optional)
         
         Returns:
-            Audio data as numpy array, or None if cancelled
+            Audio data as numpy array, or None if cancelled or nothing was said
         """
+        import time
+        
+        if self.replay:
+            return self._next_replay_clip()
+        
         try:
             if self.activation_mode == 'push_to_talk' and not bypass_activation:
+                pre_roll = int(self.pre_roll * self.sample_rate)
+                
+                # With pre-roll the microphone is already open while waiting,
+                # so the start of a word spoken with the key press is kept
+                if pre_roll:
+                    self.capture.start()
+                
                 # Wait for key press
                 self.logger.debug(f"Press [{self.activation_key}] to start recording")
                 keyboard.wait(self.activation_key)
                 self.logger.debug("Recording started")
                 
-                # Record while key is held (or fixed duration if bypassed)
-                audio_buffer = []
-                import time
+                self.capture.start()
+                start = max(self.ring.position - pre_roll, self.ring.oldest)
                 start_time = time.time()
                 
-                def callback(indata, frames, time_info, status):
-                    if status:
-                        self.logger.warning(f"Audio status: {status}")
-                    audio_buffer.append(indata.copy())
+                if streamer:
+                    self._start_streaming(streamer, start)
                 
-                with sd.InputStream(
-                    samplerate=self.sample_rate,
-                    channels=self.channels,
-                    callback=callback
-                ):
-                    if bypass_activation:
-                        # Record for fixed duration in open mic mode
-                        while time.time() - start_time < self.duration:
-                            sd.sleep(100)
-                    else:
-                        # Record until key released or max duration
-                        while keyboard.is_pressed(self.activation_key):
-                            sd.sleep(100)
-                            if time.time() - start_time > self.duration:
-                                break
+                try:
+                    # Record until key released or max duration
+                    while keyboard.is_pressed(self.activation_key):
+                        sd.sleep(100)
+                        if time.time() - start_time > self.duration:
+                            break
+                    end = self.ring.position
+                finally:
+                    if not pre_roll:
+                        self.capture.stop()
                 
                 self.logger.debug("Recording stopped")
                 
-                if not audio_buffer:
-                    return None
-                
-                return np.concatenate(audio_buffer, axis=0)
-            
             else:  # wake_word mode
-                # Dynamic recording: continue while speaking, stop after silence
-                self.logger.debug("Listening for wake word...")
+                # The stream stays open between utterances so nothing is lost
+                self.capture.start()
+                self.logger.debug("Listening for speech...")
                 
-                audio_buffer = []
-                import time
-                start_time = time.time()
-                silence_threshold = 0.01  # RMS threshold for silence
-                silence_duration = 0  # Track consecutive silence
-                max_silence = 2.0  # Stop after 2 seconds of silence (increased from implicit 0)
-                min_audio_length = 0.5  # Minimum recording length
-                max_recording_time = 15  # Maximum recording time (safety limit)
+                on_start = None
+                if streamer:
+                    on_start = lambda start: self._start_streaming(streamer, start)
                 
-                def callback(indata, frames, time_info, status):
-                    if status:
-                        self.logger.warning(f"Audio status: {status}")
-                    audio_buffer.append(indata.copy())
-                    
-                    # Calculate RMS audio level for visualization
-                    if self.dashboard:
-                        rms = np.sqrt(np.mean(indata**2))
-                        # Normalize to 0.0-1.0 range (typical speech is 0.01-0.3)
-                        level = min(1.0, rms * 5.0)
-                        try:
-                            self.dashboard.update_audio_level(level)
-                        except:
-                            pass  # Dashboard might not be ready
-                
-                with sd.InputStream(
-                    samplerate=self.sample_rate,
-                    channels=self.channels,
-                    callback=callback
-                ) as stream:
-                    last_check_time = start_time
-                    
-                    while True:
-                        sd.sleep(100)
-                        current_time = time.time()
-                        elapsed = current_time - start_time
-                        
-                        # Safety limit
-                        if elapsed > max_recording_time:
-                            self.logger.debug("Max recording time reached")
-                            break
-                        
-                        # Check silence every 0.1 seconds after minimum audio length
-                        if elapsed > min_audio_length and current_time - last_check_time >= 0.1:
-                            last_check_time = current_time
-                            
-                            # Get recent audio for silence detection
-                            if len(audio_buffer) > 0:
-                                recent_audio = np.concatenate(audio_buffer[-5:] if len(audio_buffer) >= 5 else audio_buffer, axis=0)
-                                rms = np.sqrt(np.mean(recent_audio**2))
-                                
-                                if rms < silence_threshold:
-                                    silence_duration += 0.1
-                                    if silence_duration >= max_silence:
-                                        self.logger.debug(f"Silence detected ({silence_duration:.1f}s), stopping recording")
-                                        break
-                                else:
-                                    # Reset silence counter when speech detected
-                                    silence_duration = 0
-                
-                if not audio_buffer:
+                segment = self.capture.next_segment(timeout=self.listen_timeout, on_start=on_start)
+                if segment is None:
                     return None
-                
-                return np.concatenate(audio_buffer, axis=0)
-                
+                start, end = segment.start, segment.end
+            
+            if end <= start:
+                return None
+            
+            if self.capture.is_running:
+                return self._copy(start, end)
+            return self.ring.view(start, end)
+            
         except Exception as e:
             self.logger.error(f"Failed to record audio: {e}")
             return None
     
+    def listen_for_wake_word(self) -> str:
+        """
+        Wait for one speech segment and transcribe it only if it may contain
+        the wake word.
+        
+        The keyword spotter rejects most segments without running Whisper.
+        When a transcription confirms the wake word, its audio is enrolled
+        as a spotter template.
+        
+        Returns:
+            Transcribed text of a candidate segment, or "" if there was no
+            speech or the spotter rejected it
+        """
+        try:
+            audio = self.record_audio(bypass_activation=True)
+            if audio is None:
+                return ""
+            
+            # Spotted and enrolled on the same trimmed audio, so templates
+            # and queries are normalized alike
+            audio = self.trimmer.trim(self._to_mono(audio))
+            if not self.spotter.is_candidate(audio):
+                return ""
+            
+            wake_word = self.wake_word.lower()
+            
+            if self.mode != 'local':
+                text = self.transcribe_api(audio)
+                # A segment that is just the wake word is a template as-is
+                if text.lower().strip(" .,!?") == wake_word:
+                    self.spotter.enroll(audio)
+                return text
+            
+            segments, _ = self.models.transcribe(audio, language="en", beam_size=1, word_timestamps=True)
+            text = " ".join(segment.text for segment in segments).strip()
+            
+            for segment in segments:
+                for word in (segment.words or []):
+                    if word.word.lower().strip(" .,!?") == wake_word:
+                        start = max(0, int(word.start * self.sample_rate))
+                        self.spotter.enroll(audio, start, min(len(audio), int(word.end * self.sample_rate)))
+                        break
+            
+            if text:
+                self.logger.debug(f"Wake word listening heard: {text}")
+            return text
+            
+        except Exception as e:
+            self.logger.error(f"Wake word listening error: {e}", exc_info=True)
+            return ""
+    
+    def close(self):
+        """Close the microphone stream."""
+        self.capture.stop()
+    
+    def _beam_size(self, duration: float) -> int:
+        """
+        Beam size for a clip.
+        
+        Short clips always get the full beam. Longer clips get a smaller beam
+        when the model's measured real-time factor predicts a transcription
+        slower than the latency budget. Replay mode always uses the full
+        beam, so replayed clips transcribe (and hit the cache) the same way
+        on every run.
+        
+        Args:
+            duration: Clip length in seconds
+            
+        Returns:
+            Beam size (1 = greedy)
+        """
+        max_beam = self.preprocess_config.get('beam_size', 5)
+        budget = self.preprocess_config.get('latency_budget', 1.5)
+        if self.replay or duration <= self.preprocess_config.get('short_clip', 3.0) or not budget:
+            return max_beam
+        
+        rtf = self.models.stats()['average_rtf']
+        if not rtf:
+            return max_beam
+        
+        predicted = duration * rtf
+        if predicted <= budget:
+            return max_beam
+        return max(1, min(max_beam, int(max_beam * budget / predicted)))
+    
     def transcribe_local(self, audio: np.ndarray) -> str:
         """
         Transcribe audio using local Whisper model.
@@ -226,24 +433,29 @@ class SpeechRecognizer:
             Transcribed text
         """
         try:
-            # Convert to 1D if stereo
-            if audio.ndim > 1:
-                audio = audio.mean(axis=1)
+            # Convert to 1D float32
+            audio = self._to_mono(audio)
             
-            # Normalize audio
-            audio = audio.flatten().astype(np.float32)
+            beam_size = self._beam_size(len(audio) / self.sample_rate)
+            
+            def transcribe():
+                # Transcribe with the resident model
+                segments, info = self.models.transcribe(audio, measure=True, language="en", beam_size=beam_size)
+                
+                # Combine segments
+                text = " ".join([segment.text for segment in segments])
+                return text.strip()
             
-            # Transcribe
-            segments, info = self.model.transcribe(
+            return self._cached(
                 audio,
+                transcribe,
+                backend='local',
+                model=self.models.model_size,
+                compute_type=self.models.compute_type,
                 language="en",
-                beam_size=5
+                beam_size=beam_size
             )
             
-            # Combine segments
-            text = " ".join([segment.text for segment in segments])
-            return text.strip()
-            
         except Exception as e:
             self.logger.error(f"Transcription failed: {e}")
             return ""
@@ -259,32 +471,41 @@ class SpeechRecognizer:
             Transcribed text
         """
         try:
-            import tempfile
-            import soundfile as sf
-            
-            # Save to temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                sf.write(tmp.name, audio, self.sample_rate)
-                tmp_path = tmp.name
-            
-            # Send to API
-            with open(tmp_path, 'rb') as audio_file:
-                transcript = self.openai.Audio.transcribe(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en"
-                )
-            
-            # Cleanup
-            import os
-            os.unlink(tmp_path)
-            
-            return transcript['text'].strip()
-            
+            return self._cached(
+                self._to_mono(audio),
+                lambda: self._transcribe_api(audio),
+                backend='api',
+                model="whisper-1",
+                language="en"
+            )
         except Exception as e:
             self.logger.error(f"API transcription failed: {e}")
             return ""
     
+    def _transcribe_api(self, audio: np.ndarray) -> str:
+        """Send audio to the OpenAI Whisper API."""
+        import tempfile
+        import soundfile as sf
+        
+        # Save to temporary WAV file
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            sf.write(tmp.name, audio, self.sample_rate)
+            tmp_path = tmp.name
+        
+        # Send to API
+        with open(tmp_path, 'rb') as audio_file:
+            transcript = self.openai.Audio.transcribe(
+                model="whisper-1",
+                file=audio_file,
+                language="en"
+            )
+        
+        # Cleanup
+        import os
+        os.unlink(tmp_path)
+        
+        return transcript['text'].strip()
+    
     def recognize(self, bypass_activation: bool = False) -> str:
         """
         Main recognition method: record and transcribe.
@@ -295,22 +516,37 @@ class SpeechRecognizer:
         Returns:
             Transcribed text
         """
+        streamer = None
+        if self.streaming:
+            from core.streaming_stt import StreamingTranscriber
+            streamer = StreamingTranscriber(self.models, self.streaming_config, on_partial=self.on_partial)
+        
         try:
-            # Record audio
-            audio = self.record_audio(bypass_activation=bypass_activation)
+            # Record audio (streaming transcribes it as it comes in)
+            audio = self.record_audio(bypass_activation=bypass_activation, streamer=streamer)
             if audio is None:
                 return ""
             
+            # Convert channels once; everything below works on mono audio
+            audio = self._to_mono(audio)
+            
             # Check if audio has sufficient energy (reduce false positives from silence/noise)
-            rms = np.sqrt(np.mean(audio**2))
+            rms = np.sqrt(np.dot(audio, audio) / len(audio))
             if rms < 0.01:  # Very quiet audio, likely just noise
                 return ""
             
             # Transcribe based on mode
-            if self.mode == 'local':
-                text = self.transcribe_local(audio)
+            if streamer:
+                # Streaming positions are absolute, so only trailing silence is cut
+                _, end = self.trimmer.speech_bounds(audio)
+                text = streamer.finish(audio[:end])
             else:
-                text = self.transcribe_api(audio)
+                # Only speech spans go to the model
+                audio = self.trimmer.trim(audio)
+                if self.mode == 'local':
+                    text = self.transcribe_local(audio)
+                else:
+                    text = self.transcribe_api(audio)
             
             # Filter out very short transcriptions that are likely noise
             # Common noise patterns: "you", ".", "...", "(door slam)", etc.
@@ -330,3 +566,6 @@ class SpeechRecognizer:
         except Exception as e:
             self.logger.error(f"Recognition error: {e}", exc_info=True)
             return ""
+        finally:
+            if streamer:
+                streamer.stop()
@@ -0,0 +1,138 @@
+"""
+Transcript Cache
+
+Remembers transcriptions on disk, keyed by a hash of the audio samples and
+the settings that affect the result (backend, model, compute type, beam
+size). Replaying the same recordings (test fixtures, regression runs) then
+skips Whisper entirely and returns the same text every time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+
+class TranscriptCache:
+    """
+    On-disk map from audio fingerprint and model settings to transcript.
+    
+    Entries are kept in a JSON file in least recently used order; past
+    max_entries the least recently used are dropped.
+    """
+    
+    def __init__(self, config: dict):
+        """
+        Initialize cache and load saved entries.
+        
+        Args:
+            config: Cache configuration (stt.transcript_cache in config.yaml)
+        """
+        self.logger = logging.getLogger("jarvis.stt.cache")
+        self.path = config.get('path', 'data/transcript_cache.json')
+        self.max_entries = config.get('max_entries', 1000)
+        
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        self._load()
+    
+    @staticmethod
+    def key(audio: np.ndarray, **settings) -> str:
+        """
+        Fingerprint audio together with transcription settings.
+        
+        Args:
+            audio: Mono float32 audio
+            **settings: Values that change the transcript (model, beam_size, ...)
+        
+        Returns:
+            Hex digest identifying the audio and settings
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        digest.update(np.ascontiguousarray(audio, dtype=np.float32).data)
+        return digest.hexdigest()
+    
+    def _load(self):
+        """Load saved entries."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = OrderedDict(json.load(f))
+            self.logger.info(f"Loaded {len(self._entries)} cached transcripts")
+        except Exception as e:
+            self.logger.warning(f"Could not load transcript cache: {e}")
+    
+    def _save(self, entries: OrderedDict):
+        """Write entries to disk (replacing the file atomically)."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"Could not save transcript cache: {e}")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a transcript.
+        
+        Args:
+            key: Key from TranscriptCache.key()
+        
+        Returns:
+            Cached text, or None on a miss
+        """
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+    
+    def put(self, key: str, text: str):
+        """
+        Store a transcript.
+        
+        Args:
+            key: Key from TranscriptCache.key()
+            text: Transcribed text
+        """
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save(self._entries)
+    
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._save(self._entries)
+    
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Entry count, hits and misses
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,217 @@
+"""
+Transcription Service
+
+Serves speech-to-text for remote clients (satellite microphones) from the
+shared Whisper model. Requests that arrive close together are grouped into
+one batched decoder call, so several clients cost little more than one.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import List, Optional
+
+import numpy as np
+
+from core.whisper_models import WHISPER_SAMPLE_RATE, WhisperModelManager
+
+
+class TranscriptionRequest:
+    """One queued utterance and its timings."""
+    
+    def __init__(self, audio: np.ndarray):
+        self.audio = audio
+        self.future: Future = Future()
+        self.enqueued = time.perf_counter()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.batch_size = 0
+    
+    def latency(self) -> dict:
+        """Queue, inference and total time in milliseconds."""
+        return {
+            'queue_ms': round((self.started - self.enqueued) * 1000, 1),
+            'inference_ms': round((self.finished - self.started) * 1000, 1),
+            'total_ms': round((self.finished - self.enqueued) * 1000, 1),
+            'batch_size': self.batch_size,
+            'audio_seconds': round(len(self.audio) / WHISPER_SAMPLE_RATE, 2)
+        }
+
+
+class TranscriptionService:
+    """
+    Micro-batching transcription queue.
+    
+    A worker takes the first waiting request, waits up to max_wait for
+    more (up to max_batch), and transcribes them together. Clips longer
+    than one Whisper window are transcribed on their own.
+    """
+    
+    def __init__(self, models: WhisperModelManager, config: dict):
+        """
+        Initialize service and start its worker.
+        
+        Args:
+            models: Shared Whisper model manager
+            config: Service configuration (api.transcription in config.yaml)
+        """
+        self.models = models
+        self.logger = logging.getLogger("jarvis.transcription")
+        
+        self.max_batch = config.get('max_batch', 8)
+        self.max_wait = config.get('max_wait_ms', 50) / 1000
+        self.max_queue = config.get('max_queue', 64)
+        self.beam_size = config.get('beam_size', 1)
+        self.max_batch_seconds = 30  # One Whisper window
+        
+        self._queue: "queue.Queue[TranscriptionRequest]" = queue.Queue(maxsize=self.max_queue)
+        self._latencies = deque(maxlen=200)
+        self._stats_lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.batches = 0
+        
+        self._worker = threading.Thread(target=self._run, name="jarvis-transcription", daemon=True)
+        self._worker.start()
+    
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting to be transcribed."""
+        return self._queue.qsize()
+    
+    def submit(self, audio: np.ndarray) -> TranscriptionRequest:
+        """
+        Queue an utterance.
+        
+        Args:
+            audio: 16 kHz mono float32 audio
+        
+        Returns:
+            The request; its future resolves to the transcribed text
+        
+        Raises:
+            queue.Full: If max_queue requests are already waiting
+        """
+        request = TranscriptionRequest(audio)
+        self._queue.put_nowait(request)
+        return request
+    
+    def transcribe(self, audio: np.ndarray, timeout: float = 60.0) -> TranscriptionRequest:
+        """
+        Queue an utterance and wait for its transcription.
+        
+        Args:
+            audio: 16 kHz mono float32 audio
+            timeout: Seconds to wait for the result
+        
+        Returns:
+            The finished request (text in request.future.result())
+        """
+        request = self.submit(audio)
+        request.future.result(timeout=timeout)
+        return request
+    
+    def _next_batch(self) -> List[TranscriptionRequest]:
+        """Block for the first request, then gather more for up to max_wait."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        """Worker loop."""
+        while True:
+            batch = self._next_batch()
+            
+            window = self.max_batch_seconds * WHISPER_SAMPLE_RATE
+            short = [request for request in batch if len(request.audio) <= window]
+            long = [request for request in batch if len(request.audio) > window]
+            
+            if short:
+                self._run_batch(short)
+            for request in long:
+                self._run_single(request)
+    
+    def _run_batch(self, batch: List[TranscriptionRequest]):
+        """Transcribe short utterances in one decoder call."""
+        started = time.perf_counter()
+        for request in batch:
+            request.started = started
+            request.batch_size = len(batch)
+        
+        try:
+            texts = self.models.transcribe_batch([request.audio for request in batch], beam_size=self.beam_size)
+        except Exception as e:
+            self.logger.error(f"Batched transcription failed: {e}", exc_info=True)
+            self._finish(batch, error=e)
+            return
+        
+        self._finish(batch, texts=texts)
+        self.logger.debug(f"Transcribed batch of {len(batch)} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    
+    def _run_single(self, request: TranscriptionRequest):
+        """Transcribe an utterance longer than one window."""
+        request.started = time.perf_counter()
+        request.batch_size = 1
+        try:
+            segments, _ = self.models.transcribe(request.audio, measure=True, language="en", beam_size=self.beam_size)
+            self._finish([request], texts=[" ".join(segment.text for segment in segments).strip()])
+        except Exception as e:
+            self.logger.error(f"Transcription failed: {e}", exc_info=True)
+            self._finish([request], error=e)
+    
+    def _finish(self, batch: List[TranscriptionRequest], texts: List[str] = None, error: Exception = None):
+        """Resolve requests and record their latency."""
+        finished = time.perf_counter()
+        with self._stats_lock:
+            self.batches += 1
+            for request in batch:
+                request.finished = finished
+                if error is None:
+                    self.completed += 1
+                    self._latencies.append(finished - request.enqueued)
+                else:
+                    self.failed += 1
+        
+        for index, request in enumerate(batch):
+            if error is None:
+                request.future.set_result(texts[index])
+            else:
+                request.future.set_exception(error)
+    
+    def stats(self) -> dict:
+        """
+        Get service statistics.
+        
+        Returns:
+            Queue depth, counts and recent latency percentiles (ms)
+        """
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            completed, failed, batches = self.completed, self.failed, self.batches
+        
+        def percentile(fraction: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000, 1)
+        
+        return {
+            'queue_depth': self.queue_depth,
+            'completed': completed,
+            'failed': failed,
+            'batches': batches,
+            'average_batch_size': round((completed + failed) / batches, 2) if batches else None,
+            'latency_p50_ms': percentile(0.5),
+            'latency_p95_ms': percentile(0.95),
+            'model': self.models.model_size
+        }
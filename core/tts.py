@@ -1,20 +1,117 @@
 """
 Text-to-Speech Module
 
-Handles voice output using local TTS (pyttsx3).
+Handles voice output. Text is rendered to audio by a pluggable synthesis
+backend (Windows SAPI, pyttsx3/espeak or Piper, see core.tts_backends) and
+played through one output stream, sentence by sentence, so playback starts
+as soon as the first sentence is rendered.
 """
 
 import logging
+import queue
+import re
 import threading
 import time
-import win32com.client
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# Sentence boundaries (the same rule that splits streamed LLM replies)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|(?<=[.!?]["\')\]])\s+|\n+')
+
+
+class SpeechPlayback:
+    """
+    One utterance played through a single output stream.
+    
+    Audio is fed in chunks as it is synthesized. If playback catches up with
+    synthesis the stream plays silence; it finishes once complete() has
+    been called and the last chunk has played.
+    """
+    
+    def __init__(self, sample_rate: int):
+        """
+        Open and start the output stream.
+        
+        Args:
+            sample_rate: Sample rate of every chunk
+        """
+        import sounddevice as sd
+        
+        self.sample_rate = sample_rate
+        self.finished = threading.Event()
+        self._chunks = deque()
+        self._offset = 0
+        self._complete = False
+        self._closed = False
+        self._lock = threading.Lock()
+        
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype='int16',
+            callback=self._callback,
+            finished_callback=self.finished.set
+        )
+        self._stream.start()
+    
+    def feed(self, audio: np.ndarray):
+        """Queue int16 mono samples for playback."""
+        self._chunks.append(audio)
+    
+    def complete(self):
+        """Mark the last chunk as fed."""
+        self._complete = True
+    
+    def _callback(self, outdata, frames, time_info, status):
+        """Stream callback: copy queued chunks into the output buffer."""
+        import sounddevice as sd
+        
+        filled = 0
+        while filled < frames and self._chunks:
+            chunk = self._chunks[0]
+            take = min(frames - filled, len(chunk) - self._offset)
+            outdata[filled:filled + take, 0] = chunk[self._offset:self._offset + take]
+            filled += take
+            self._offset += take
+            if self._offset >= len(chunk):
+                self._chunks.popleft()
+                self._offset = 0
+        outdata[filled:] = 0
+        
+        if self._complete and not self._chunks:
+            raise sd.CallbackStop
+    
+    @property
+    def remaining(self) -> float:
+        """Seconds of queued audio not yet played (approximate)."""
+        samples = sum(len(chunk) for chunk in list(self._chunks)) - self._offset
+        return max(0, samples) / self.sample_rate
+    
+    def abort(self):
+        """Stop immediately, dropping unplayed audio (safe from any thread)."""
+        with self._lock:
+            if not self._closed:
+                self._stream.abort()
+        self.finished.set()
+    
+    def close(self):
+        """Close the stream."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._stream.close()
 
 
 class VoiceSynthesizer:
     """
-    Handles text-to-speech using Windows SAPI COM directly.
+    Speaks text through the configured synthesis backend.
     
-    This avoids pyttsx3 threading issues by using win32com directly.
+    Each sentence is synthesized while the previous one plays. Sentences
+    spoken repeatedly are played from the TTS cache, and the synthesis
+    real-time factor (render time / audio length) of the backend is tracked.
     """
     
     def __init__(self, config: dict):
@@ -27,67 +124,202 @@ class VoiceSynthesizer:
         self.config = config
         self.logger = logging.getLogger("jarvis.tts")
         self.is_speaking = False
-        self.should_stop = False
+        self._stop_event = threading.Event()
+        self._begun = False  # begin() has cleared the stop flag for the next utterance
+        self.stopped_at: Optional[float] = None  # perf_counter() when stop() silenced the output
         
-        # Initialize Windows SAPI
         try:
-            import win32com.client
-            self.speaker = win32com.client.Dispatch("SAPI.SpVoice")
-            
-            # Configure voice properties
-            self._configure_voice()
-            
-            self.logger.info("TTS engine initialized")
-            
-        except ImportError:
-            # Fallback to pyttsx3 if win32com not available
-            self.logger.warning("win32com not available, falling back to pyttsx3")
-            import pyttsx3
-            self.speaker = pyttsx3.init()
-            self._configure_voice_pyttsx3()
-            self.use_pyttsx3 = True
-            self.logger.info("TTS engine initialized (pyttsx3 fallback)")
+            from core.tts_backends import create_backend
+            self.backend = create_backend(config)
+            self.logger.info(f"TTS engine initialized ({self.backend.name})")
         except Exception as e:
             self.logger.error(f"Failed to initialize TTS: {e}")
             raise
+        
+        self._speech_lock = threading.Lock()  # One utterance plays at a time
+        self._playback: Optional[SpeechPlayback] = None
+        self._playback_lock = threading.Lock()
+        self._sentence_queue: Optional[queue.Queue] = None
+        self._rtf_samples = deque(maxlen=50)
+        
+        # Audio cache: repeated sentences play from saved audio
+        self.cache = None
+        cache_config = config.get('cache', {})
+        if cache_config.get('enabled', True):
+            from core.tts_cache import TTSCache
+            self.cache = TTSCache(cache_config)
+        self._render_queue: queue.Queue = queue.Queue()
+        self._render_thread = None
     
-    def _configure_voice(self):
-        """Configure voice for Windows SAPI."""
-        try:
-            # Set rate (speed) - SAPI uses -10 to 10, config uses 150-200
-            rate = self.config['voice'].get('rate', 175)
-            # Convert 175 WPM to SAPI rate (-10 to 10, where 0 is normal)
-            sapi_rate = int((rate - 175) / 25)  # -1 to 1 range roughly
-            self.speaker.Rate = max(-10, min(10, sapi_rate))
-            
-            # Set volume (0-100 for SAPI, 0.0-1.0 in config)
-            volume = self.config['voice'].get('volume', 0.9)
-            self.speaker.Volume = int(volume * 100)
-            
-            # Get voice info
-            voice = self.speaker.GetVoices().Item(0)
-            self.logger.info(f"Using voice: {voice.GetDescription()}")
-            
-        except Exception as e:
-            self.logger.warning(f"Could not configure voice properties: {e}")
+    @property
+    def should_stop(self) -> bool:
+        """Whether the current speech has been interrupted."""
+        return self._stop_event.is_set()
     
-    def _configure_voice_pyttsx3(self):
-        """Configure voice for pyttsx3 fallback."""
-        try:
-            voices = self.speaker.getProperty('voices')
-            voice_index = self.config['voice'].get('voice_index', 0)
-            if 0 <= voice_index < len(voices):
-                self.speaker.setProperty('voice', voices[voice_index].id)
-                self.logger.info(f"Using voice: {voices[voice_index].name}")
-            
-            rate = self.config['voice'].get('rate', 175)
-            self.speaker.setProperty('rate', rate)
-            
-            volume = self.config['voice'].get('volume', 0.9)
-            self.speaker.setProperty('volume', volume)
-        except Exception as e:
-            self.logger.warning(f"Could not configure pyttsx3 voice: {e}")
+    def begin(self):
+        """
+        Prepare for the next utterance before it starts.
+        
+        Clears the stop flag now rather than when speak() or speak_stream()
+        starts, so a stop() in between (an interrupt armed before the
+        speaking thread runs) still cancels that utterance.
+        """
+        self._stop_event.clear()
+        self._begun = True
     
+    def _start_utterance(self):
+        """Clear the stop flag, unless begin() already did."""
+        if self._begun:
+            self._begun = False
+        else:
+            self._stop_event.clear()
+    
+    @staticmethod
+    def _sentences(text: str) -> List[str]:
+        """Split text into sentences (the unit of synthesis and caching)."""
+        return [part.strip() for part in SENTENCE_BOUNDARY.split(text) if part.strip()]
+    
+    def _cache_key(self, text: str) -> str:
+        """Cache key for text in the current voice."""
+        return self.cache.key(
+            text,
+            engine=self.backend.name,
+            voice=self.backend.voice_id,
+            rate=self.backend.rate,
+            volume=self.backend.volume
+        )
+    
+    def _synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        """Render text with the backend and record its real-time factor."""
+        started = time.perf_counter()
+        audio, sample_rate = self.backend.synthesize(text)
+        if len(audio):
+            self._rtf_samples.append((time.perf_counter() - started) / (len(audio) / sample_rate))
+        return audio, sample_rate
+    
+    def _render(self, text: str) -> Tuple[np.ndarray, int]:
+        """
+        Audio for one sentence, from the cache or the backend.
+        
+        Args:
+            text: Sentence
+        
+        Returns:
+            (int16 mono samples, sample rate)
+        """
+        if self.cache is None:
+            return self._synthesize(text)
+        
+        key = self._cache_key(text)
+        path = self.cache.get(key)
+        if path:
+            try:
+                from core.tts_cache import read_wav
+                audio, sample_rate = read_wav(path)
+                return audio[:, 0], sample_rate
+            except Exception as e:
+                self.logger.warning(f"Cached speech unreadable, synthesizing: {e}")
+        
+        audio, sample_rate = self._synthesize(text)
+        if not path and self.cache.admit(key):
+            # Said often enough to keep
+            self.cache.store_audio(key, audio, sample_rate)
+        return audio, sample_rate
+    
+    def prerender(self, texts: list):
+        """
+        Render phrases into the cache in the background.
+        
+        Args:
+            texts: Phrases expected to be spoken (greetings, Q&A answers, ...)
+        """
+        if self.cache is None:
+            return
+        
+        queued = 0
+        for text in texts:
+            for sentence in self._sentences(text or ""):
+                key = self._cache_key(sentence)
+                if not self.cache.contains(key):
+                    self._queue_render(sentence, key)
+                    queued += 1
+        
+        if queued:
+            self.logger.info(f"Pre-rendering {queued} sentences in the background")
+    
+    def _queue_render(self, text: str, key: str):
+        """Queue a sentence for the render thread (started on first use)."""
+        self._render_queue.put((text, key))
+        if self._render_thread is None:
+            self._render_thread = threading.Thread(target=self._render_worker, name="jarvis-tts-render", daemon=True)
+            self._render_thread.start()
+    
+    def _render_worker(self):
+        """Render queued sentences into the cache, one at a time."""
+        while True:
+            text, key = self._render_queue.get()
+            if self.cache.contains(key):
+                continue
+            try:
+                audio, sample_rate = self._synthesize(text)
+                self.cache.store_audio(key, audio, sample_rate)
+                self.logger.debug(f"Cached speech: {text[:50]}")
+            except Exception as e:
+                self.logger.warning(f"Could not render speech for cache: {e}")
+    
+    def _play_sentences(self, sentences: Iterable[str]) -> int:
+        """
+        Render sentences and play them back to back, rendering the next
+        while the current one plays.
+        
+        Args:
+            sentences: Sentences to speak (may block between items)
+        
+        Returns:
+            Number of sentences rendered
+        """
+        with self._speech_lock:
+            playback = None
+            spoken = 0
+            try:
+                for sentence in sentences:
+                    if self.should_stop:
+                        break
+                    audio, sample_rate = self._render(sentence)
+                    
+                    if playback is not None and playback.sample_rate != sample_rate:
+                        # Can't share a stream; let the previous audio finish
+                        self._finish_playback(playback)
+                        with self._playback_lock:
+                            self._playback = None
+                            playback.close()
+                        playback = None
+                    if playback is None:
+                        playback = SpeechPlayback(sample_rate)
+                        with self._playback_lock:
+                            self._playback = playback
+                        if self.should_stop:
+                            # Interrupted while the stream was opening
+                            break
+                    
+                    playback.feed(audio)
+                    spoken += 1
+                
+                if playback is not None and not self.should_stop:
+                    self._finish_playback(playback)
+            finally:
+                with self._playback_lock:
+                    self._playback = None
+                    if playback is not None:
+                        playback.close()
+            return spoken
+    
+    def _finish_playback(self, playback: SpeechPlayback):
+        """Wait for queued audio to play out (stop() ends the wait early)."""
+        playback.complete()
+        if not playback.finished.wait(playback.remaining + 2.0):
+            self.logger.warning("Audio output stalled, stopping playback")
+            playback.abort()
     
     def speak(self, text: str, wait: bool = True):
         """
@@ -97,73 +329,98 @@ class VoiceSynthesizer:
             text: Text to speak
             wait: If True, block until speech completes
         """
+        self._start_utterance()
         if not text:
             return
         
         self.logger.info(f"Speaking: {text[:50]}..." if len(text) > 50 else f"Speaking: {text}")
-        self.is_speaking = True
-        self.should_stop = False
         
+        if not wait:
+            threading.Thread(
+                target=self._speak_background,
+                args=(text,),
+                name="jarvis-tts-speak",
+                daemon=True
+            ).start()
+            return
+        
+        self.is_speaking = True
         try:
-            if hasattr(self, 'use_pyttsx3') and self.use_pyttsx3:
-                # pyttsx3 fallback
-                self.logger.info("Using pyttsx3")
-                self.speaker.say(text)
-                if wait:
-                    self.speaker.runAndWait()
-            else:
-                # Windows SAPI - async mode (1) allows interruption
-                # Initialize COM for this thread
-                import pythoncom
-                pythoncom.CoInitialize()
-                
-                try:
-                    # Use flag 1 for async (SVSFlagsAsync)
-                    self.speaker.Speak(text, 1)
-                    
-                    # Give SAPI a moment to start speaking
-                    time.sleep(0.1)
-                    
-                    if wait:
-                        loop_count = 0
-                        max_loops = 1000  # Max 50 seconds (1000 * 0.05s)
-                        # Wait for speech to complete or be interrupted
-                        # Check while NOT done (RunningState 0 = done)
-                        while self.speaker.Status.RunningState != 0 and loop_count < max_loops:  # Keep going while speaking
-                            loop_count += 1
-                            
-                            if self.should_stop:
-                                # Purge speech queue - must be done in same thread
-                                self.speaker.Speak("", 2 | 1)  # SVSFPurgeBeforeSpeak | SVSFlagsAsync
-                                self.logger.info("Speech interrupted")
-                                break
-                            time.sleep(0.05)  # Check every 50ms
-                        
-                        if loop_count >= max_loops:
-                            self.logger.warning(f"Speech timeout after {loop_count} loops - force stopping")
-                            self.speaker.Speak("", 2 | 1)  # Force stop
-                    else:
-                        self.logger.info("Not waiting (async mode)")
-                finally:
-                    pythoncom.CoUninitialize()
-            
-            self.is_speaking = False
-            self.logger.info("Speech completed")
-            
+            self._play_sentences(self._sentences(text))
+            if not self.should_stop:
+                self.logger.info("Speech completed")
         except Exception as e:
+            self.logger.error(f"Speech error: {e}", exc_info=True)
+        finally:
             self.is_speaking = False
+    
+    def _speak_background(self, text: str):
+        """Speak without blocking the caller."""
+        try:
+            self._play_sentences(self._sentences(text))
+        except Exception as e:
             self.logger.error(f"Speech error: {e}", exc_info=True)
     
+    def speak_stream(self, sentences: queue.Queue):
+        """
+        Speak sentences from a queue as they arrive, until a None sentinel.
+        
+        Used for streaming LLM replies: the first sentence is spoken while
+        later ones are still being generated. Stays in the speaking state
+        between sentences so open-mic mode doesn't pick up its own voice.
+        
+        Args:
+            sentences: Queue of sentence strings, terminated by None
+        """
+        self.is_speaking = True
+        self._start_utterance()
+        self._sentence_queue = sentences
+        
+        def incoming():
+            while not self.should_stop:
+                sentence = sentences.get()
+                if sentence is None:
+                    return
+                if sentence:
+                    yield sentence
+        
+        try:
+            spoken = self._play_sentences(incoming())
+            
+            if self.should_stop:
+                self.logger.info(f"Speech stream interrupted after {spoken} sentence(s)")
+            else:
+                self.logger.info(f"Speech stream completed ({spoken} sentences)")
+        
+        except Exception as e:
+            self.logger.error(f"Speech stream error: {e}", exc_info=True)
+        finally:
+            self._sentence_queue = None
+            self.is_speaking = False
     
     def stop(self):
-        """Stop current speech immediately by setting flag."""
+        """
+        Stop current speech immediately.
+        
+        Aborts the output stream from the calling thread, so the speaker is
+        silent when this returns (stopped_at records when).
+        """
         try:
-            self.should_stop = True
+            self._stop_event.set()
             self.is_speaking = False
-            # The actual stopping happens in the speak() thread
-            # which has the proper COM context
+            
+            with self._playback_lock:
+                if self._playback is not None:
+                    self._playback.abort()
+                    self.logger.info("Speech interrupted")
+            self.stopped_at = time.perf_counter()
+            
+            # Wake a speech stream waiting for its next sentence
+            sentences = self._sentence_queue
+            if sentences is not None:
+                sentences.put(None)
         except Exception as e:
-            self.logger.error(f"Failed to set stop flag: {e}")
+            self.logger.error(f"Failed to stop speech: {e}")
     
     def list_voices(self) -> list:
         """
@@ -173,27 +430,47 @@ class VoiceSynthesizer:
             List of voice names and indices
         """
         try:
-            if hasattr(self, 'use_pyttsx3') and self.use_pyttsx3:
-                voices = self.speaker.getProperty('voices')
-                return [
-                    {
-                        'index': i,
-                        'name': voice.name,
-                        'id': voice.id,
-                        'languages': voice.languages
-                    }
-                    for i, voice in enumerate(voices)
-                ]
-            else:
-                voices = self.speaker.GetVoices()
-                return [
-                    {
-                        'index': i,
-                        'name': voices.Item(i).GetDescription(),
-                        'id': voices.Item(i).Id
-                    }
-                    for i in range(voices.Count)
-                ]
+            return self.backend.list_voices()
         except Exception as e:
             self.logger.error(f"Failed to list voices: {e}")
             return []
+    
+    def set_voice(self, index: int) -> str:
+        """
+        Switch voice.
+        
+        Args:
+            index: Index into list_voices()
+        
+        Returns:
+            Name of the new voice, or None if the index is invalid
+        """
+        name = self.backend.set_voice(index)
+        if name:
+            self.logger.info(f"Voice changed to: {name}")
+        return name
+    
+    def set_rate(self, rate: int):
+        """
+        Set speaking rate.
+        
+        Args:
+            rate: Words per minute (175 = normal)
+        """
+        self.backend.set_rate(rate)
+    
+    def stats(self) -> dict:
+        """
+        Get synthesis statistics.
+        
+        Returns:
+            Backend, average real-time factor and cache statistics
+        """
+        samples = list(self._rtf_samples)
+        return {
+            'backend': self.backend.name,
+            'voice': self.backend.voice_name,
+            'average_rtf': round(sum(samples) / len(samples), 3) if samples else None,
+            'samples': len(samples),
+            'cache': self.cache.stats() if self.cache is not None else None
+        }
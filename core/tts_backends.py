@@ -0,0 +1,336 @@
+"""
+TTS Backends
+
+Speech synthesis engines behind a common interface. Every backend renders
+text to a buffer of 16-bit mono samples; VoiceSynthesizer plays, chunks and
+caches that audio the same way whichever engine made it.
+
+- sapi: Windows SAPI through COM (win32com)
+- pyttsx3: pyttsx3 (SAPI5 on Windows, NSSpeechSynthesizer on macOS, espeak on Linux)
+- piper: Piper neural voices (ONNX, runs offline on CPU)
+
+Engine libraries are imported when a backend is created, so this module
+imports on any platform.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class TTSBackend:
+    """
+    Base class for synthesis engines.
+    
+    Subclasses implement synthesize() and, where the engine has several
+    voices, list_voices() and set_voice().
+    """
+    
+    name = "base"
+    
+    def __init__(self, voice_config: dict):
+        """
+        Initialize backend.
+        
+        Args:
+            voice_config: Voice settings (tts.voice in config.yaml)
+        """
+        self.logger = logging.getLogger(f"jarvis.tts.{self.name}")
+        self.rate = voice_config.get('rate', 175)
+        self.volume = voice_config.get('volume', 0.9)
+        self.voice_index = voice_config.get('voice_index', 0)
+        self.voice_name: Optional[str] = None
+    
+    @property
+    def voice_id(self) -> Optional[str]:
+        """Identifier of the current voice (part of the TTS cache key)."""
+        return self.voice_name
+    
+    def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        """
+        Render text to audio.
+        
+        Args:
+            text: Text to speak
+        
+        Returns:
+            (int16 mono samples, sample rate)
+        """
+        raise NotImplementedError
+    
+    def list_voices(self) -> List[dict]:
+        """
+        Get available voices.
+        
+        Returns:
+            List of dicts with index, name and id
+        """
+        return []
+    
+    def set_voice(self, index: int) -> Optional[str]:
+        """
+        Switch voice.
+        
+        Args:
+            index: Index into list_voices()
+        
+        Returns:
+            Name of the new voice, or None if the index is invalid
+        """
+        return None
+    
+    def set_rate(self, rate: int):
+        """
+        Set speaking rate.
+        
+        Args:
+            rate: Words per minute (175 = normal)
+        """
+        self.rate = rate
+
+
+class SAPIBackend(TTSBackend):
+    """
+    Windows SAPI voices rendered into an in-memory stream.
+    
+    COM objects belong to the thread that created them, so every thread
+    that synthesizes gets its own SpVoice.
+    """
+    
+    name = "sapi"
+    sample_rate = 22050
+    STREAM_FORMAT = 22  # SAFT22kHz16BitMono
+    
+    def __init__(self, voice_config: dict):
+        super().__init__(voice_config)
+        import win32com.client  # noqa: F401 - ImportError selects another backend
+        
+        self._local = threading.local()
+        voices = self._voice().GetVoices()
+        index = self.voice_index if 0 <= self.voice_index < voices.Count else 0
+        self._token_id = voices.Item(index).Id
+        self.voice_name = voices.Item(index).GetDescription()
+        self.logger.info(f"Using voice: {self.voice_name}")
+    
+    @property
+    def voice_id(self) -> Optional[str]:
+        return self._token_id
+    
+    def _voice(self):
+        """This thread's SpVoice."""
+        voice = getattr(self._local, 'voice', None)
+        if voice is None:
+            import pythoncom
+            import win32com.client
+            pythoncom.CoInitialize()
+            voice = win32com.client.Dispatch("SAPI.SpVoice")
+            self._local.voice = voice
+        return voice
+    
+    def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        import win32com.client
+        
+        voice = self._voice()
+        if voice.Voice.Id != self._token_id:
+            voices = voice.GetVoices()
+            for i in range(voices.Count):
+                if voices.Item(i).Id == self._token_id:
+                    voice.Voice = voices.Item(i)
+                    break
+        
+        # SAPI uses -10 to 10 (0 = normal), config uses words per minute
+        voice.Rate = max(-10, min(10, int((self.rate - 175) / 25)))
+        voice.Volume = int(self.volume * 100)
+        
+        stream = win32com.client.Dispatch("SAPI.SpMemoryStream")
+        stream.Format.Type = self.STREAM_FORMAT
+        voice.AudioOutputStream = stream
+        voice.Speak(text, 0)  # Synchronous: returns when rendered
+        
+        return np.frombuffer(bytes(stream.GetData()), dtype='<i2'), self.sample_rate
+    
+    def list_voices(self) -> List[dict]:
+        voices = self._voice().GetVoices()
+        return [
+            {
+                'index': i,
+                'name': voices.Item(i).GetDescription(),
+                'id': voices.Item(i).Id
+            }
+            for i in range(voices.Count)
+        ]
+    
+    def set_voice(self, index: int) -> Optional[str]:
+        voices = self._voice().GetVoices()
+        if not 0 <= index < voices.Count:
+            return None
+        self._token_id = voices.Item(index).Id
+        self.voice_name = voices.Item(index).GetDescription()
+        return self.voice_name
+
+
+class Pyttsx3Backend(TTSBackend):
+    """
+    pyttsx3 voices, rendered to a temporary WAV file.
+    
+    pyttsx3 shares one engine per process and runs one event loop at a
+    time, so synthesis is serialized.
+    """
+    
+    name = "pyttsx3"
+    
+    def __init__(self, voice_config: dict):
+        super().__init__(voice_config)
+        import pyttsx3
+        
+        self.engine = pyttsx3.init()
+        self._lock = threading.Lock()
+        self._voice = None
+        
+        voices = self.engine.getProperty('voices')
+        if 0 <= self.voice_index < len(voices):
+            self.engine.setProperty('voice', voices[self.voice_index].id)
+            self._voice = voices[self.voice_index].id
+            self.voice_name = voices[self.voice_index].name
+            self.logger.info(f"Using voice: {self.voice_name}")
+        self.engine.setProperty('rate', self.rate)
+        self.engine.setProperty('volume', self.volume)
+    
+    @property
+    def voice_id(self) -> Optional[str]:
+        return self._voice
+    
+    def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        from core.tts_cache import read_wav
+        
+        handle, path = tempfile.mkstemp(suffix=".wav")
+        os.close(handle)
+        try:
+            with self._lock:
+                self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+            audio, sample_rate = read_wav(path)
+        finally:
+            os.unlink(path)
+        
+        if audio.shape[1] > 1:
+            audio = audio.mean(axis=1).astype(np.int16)
+        return audio.reshape(-1), sample_rate
+    
+    def list_voices(self) -> List[dict]:
+        voices = self.engine.getProperty('voices')
+        return [
+            {
+                'index': i,
+                'name': voice.name,
+                'id': voice.id,
+                'languages': voice.languages
+            }
+            for i, voice in enumerate(voices)
+        ]
+    
+    def set_voice(self, index: int) -> Optional[str]:
+        voices = self.engine.getProperty('voices')
+        if not 0 <= index < len(voices):
+            return None
+        with self._lock:
+            self.engine.setProperty('voice', voices[index].id)
+        self._voice = voices[index].id
+        self.voice_name = voices[index].name
+        return self.voice_name
+    
+    def set_rate(self, rate: int):
+        super().set_rate(rate)
+        with self._lock:
+            self.engine.setProperty('rate', rate)
+
+
+class PiperBackend(TTSBackend):
+    """
+    Piper neural voice (an .onnx model with its .onnx.json config) run on
+    CPU with onnxruntime. Needs the piper-tts package.
+    """
+    
+    name = "piper"
+    
+    def __init__(self, voice_config: dict, piper_config: dict):
+        """
+        Initialize backend and load the voice model.
+        
+        Args:
+            voice_config: Voice settings (tts.voice in config.yaml)
+            piper_config: Piper settings (tts.piper in config.yaml)
+        """
+        super().__init__(voice_config)
+        from piper.voice import PiperVoice
+        
+        self.model_path = piper_config.get('model', '')
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(f"Piper voice model not found: {self.model_path}")
+        
+        self.voice = PiperVoice.load(self.model_path)
+        self.sample_rate = self.voice.config.sample_rate
+        self.voice_name = os.path.splitext(os.path.basename(self.model_path))[0]
+        self.logger.info(f"Using voice: {self.voice_name}")
+    
+    def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        # Piper stretches phoneme durations; 175 words per minute is its normal pace
+        length_scale = 175 / max(self.rate, 1)
+        
+        if hasattr(self.voice, 'synthesize_stream_raw'):
+            # piper-tts < 1.3
+            data = b"".join(self.voice.synthesize_stream_raw(text, length_scale=length_scale))
+            audio = np.frombuffer(data, dtype='<i2')
+        else:
+            from piper import SynthesisConfig
+            chunks = self.voice.synthesize(text, syn_config=SynthesisConfig(length_scale=length_scale))
+            audio = np.concatenate(
+                [np.frombuffer(chunk.audio_int16_bytes, dtype='<i2') for chunk in chunks] or [np.zeros(0, np.int16)]
+            )
+        
+        if self.volume != 1.0:
+            audio = (audio * self.volume).astype(np.int16)
+        return audio, self.sample_rate
+    
+    def list_voices(self) -> List[dict]:
+        return [{'index': 0, 'name': self.voice_name, 'id': self.model_path}]
+
+
+def create_backend(config: dict) -> TTSBackend:
+    """
+    Create the configured synthesis backend.
+    
+    With engine "auto", SAPI is used where win32com is available and
+    pyttsx3 elsewhere.
+    
+    Args:
+        config: TTS configuration (tts in config.yaml)
+    
+    Returns:
+        TTSBackend: The backend
+    
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    logger = logging.getLogger("jarvis.tts")
+    engine = config.get('engine', 'auto')
+    voice_config = config.get('voice', {})
+    
+    if engine == 'piper':
+        return PiperBackend(voice_config, config.get('piper', {}))
+    if engine == 'pyttsx3':
+        return Pyttsx3Backend(voice_config)
+    if engine == 'sapi':
+        return SAPIBackend(voice_config)
+    if engine != 'auto':
+        raise ValueError(f"Unknown TTS engine: {engine}")
+    
+    try:
+        return SAPIBackend(voice_config)
+    except ImportError:
+        logger.warning("win32com not available, falling back to pyttsx3")
+        return Pyttsx3Backend(voice_config)
@@ -0,0 +1,247 @@
+"""
+TTS Audio Cache
+
+Keeps synthesized speech as WAV files so phrases Jarvis says again and again
+(greetings, Q&A answers, command confirmations) play immediately instead of
+waiting for the speech engine. Files are keyed by the text and the voice
+settings, and the least recently played are deleted once the cache grows
+past its size limit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import wave
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def read_wav(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Read a 16-bit PCM WAV file for playback.
+    
+    Args:
+        path: WAV file path
+    
+    Returns:
+        (int16 samples of shape (frames, channels), sample rate)
+    """
+    with wave.open(path, 'rb') as wav:
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"Unsupported sample width: {wav.getsampwidth() * 8} bits")
+        frames = wav.readframes(wav.getnframes())
+    return np.frombuffer(frames, dtype='<i2').reshape(-1, channels), rate
+
+
+def write_wav(path: str, audio: np.ndarray, sample_rate: int):
+    """
+    Write int16 mono samples as a WAV file.
+    
+    Args:
+        path: WAV file path
+        audio: int16 mono samples
+        sample_rate: Sample rate
+    """
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(np.ascontiguousarray(audio, dtype='<i2').tobytes())
+
+
+class TTSCache:
+    """
+    Size-limited directory of synthesized phrases.
+    
+    A phrase is admitted once it has been requested min_repeats times (or
+    when it is pre-rendered), so one-off replies don't churn the cache.
+    Playing a file marks it as recently used (its modification time), so
+    the eviction order survives restarts.
+    """
+    
+    def __init__(self, config: dict):
+        """
+        Initialize cache and index existing files.
+        
+        Args:
+            config: Cache configuration (tts.cache in config.yaml)
+        """
+        self.logger = logging.getLogger("jarvis.tts.cache")
+        self.directory = config.get('path', 'data/tts_cache')
+        self.max_bytes = int(config.get('max_size_mb', 100) * 1024 * 1024)
+        self.min_repeats = config.get('min_repeats', 2)
+        
+        self._files: "OrderedDict[str, int]" = OrderedDict()  # key -> size, least recent first
+        self._size = 0
+        self._requests = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        self._index()
+    
+    @staticmethod
+    def key(text: str, **voice) -> str:
+        """
+        Key for a phrase spoken with given voice settings.
+        
+        Args:
+            text: Phrase
+            **voice: Engine, voice, rate, volume, ...
+        
+        Returns:
+            Hex digest used as the file name
+        """
+        payload = json.dumps({'text': text, **voice}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """Cached file for a key."""
+        return os.path.join(self.directory, f"{key}.wav")
+    
+    def _index(self):
+        """Index cached files, least recently played first."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            entries = []
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                if name.endswith('.tmp.wav'):
+                    # Left over from an interrupted render
+                    os.remove(path)
+                elif name.endswith('.wav'):
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, name[:-4], stat.st_size))
+            
+            for _, key, size in sorted(entries):
+                self._files[key] = size
+                self._size += size
+            
+            if self._files:
+                self.logger.info(f"TTS cache: {len(self._files)} phrases ({self._size / 1024 / 1024:.1f} MB)")
+        except Exception as e:
+            self.logger.warning(f"Could not index TTS cache: {e}")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached phrase and mark it as recently used.
+        
+        Args:
+            key: Key from TTSCache.key()
+        
+        Returns:
+            WAV file path, or None on a miss
+        """
+        with self._lock:
+            if key not in self._files:
+                self.misses += 1
+                return None
+            self._files.move_to_end(key)
+            self.hits += 1
+        
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Deleted behind our back
+            with self._lock:
+                self._size -= self._files.pop(key, 0)
+            return None
+        return path
+    
+    def admit(self, key: str) -> bool:
+        """
+        Count a request for an uncached phrase.
+        
+        Args:
+            key: Key from TTSCache.key()
+        
+        Returns:
+            True when the phrase has been requested often enough to render
+        """
+        with self._lock:
+            count = self._requests.get(key, 0) + 1
+            if count >= self.min_repeats:
+                self._requests.pop(key, None)
+                return True
+            if len(self._requests) > 10000:
+                # Bound the bookkeeping for one-off phrases
+                self._requests.clear()
+            self._requests[key] = count
+            return False
+    
+    def contains(self, key: str) -> bool:
+        """Whether a phrase is cached (without counting a hit)."""
+        with self._lock:
+            return key in self._files
+    
+    def temp_path(self, key: str) -> str:
+        """Path to render a phrase into before store()."""
+        return os.path.join(self.directory, f"{key}.tmp.wav")
+    
+    def store(self, key: str, rendered_path: str):
+        """
+        Move a rendered WAV file into the cache and evict to the size limit.
+        
+        Args:
+            key: Key from TTSCache.key()
+            rendered_path: Rendered file (normally temp_path(key))
+        """
+        path = self._path(key)
+        os.replace(rendered_path, path)
+        size = os.path.getsize(path)
+        
+        with self._lock:
+            self._size += size - self._files.pop(key, 0)
+            self._files[key] = size
+            
+            evicted = []
+            while self._size > self.max_bytes and len(self._files) > 1:
+                old_key, old_size = self._files.popitem(last=False)
+                self._size -= old_size
+                evicted.append(old_key)
+        
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+        if evicted:
+            self.logger.debug(f"Evicted {len(evicted)} cached phrases")
+    
+    def store_audio(self, key: str, audio: np.ndarray, sample_rate: int):
+        """
+        Save synthesized audio and evict to the size limit.
+        
+        Args:
+            key: Key from TTSCache.key()
+            audio: int16 mono samples
+            sample_rate: Sample rate
+        """
+        try:
+            path = self.temp_path(key)
+            write_wav(path, audio, sample_rate)
+            self.store(key, path)
+        except Exception as e:
+            self.logger.warning(f"Could not cache speech: {e}")
+    
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Phrase count, size in MB, hits and misses
+        """
+        with self._lock:
+            return {
+                'phrases': len(self._files),
+                'size_mb': round(self._size / 1024 / 1024, 2),
+                'hits': self.hits,
+                'misses': self.misses
+            }
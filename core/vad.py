@@ -127,86 +127,45 @@ class VoiceActivityDetector:
         self,
         audio_callback: Callable,
         on_speech_start: Callable = None,
-        on_speech_end: Callable = None
+        on_speech_end: Callable = None,
+        config: dict = None
     ):
         """
         Continuous listening with VAD.
         
+        Runs on the shared capture engine (core.capture), so it uses the
+        same microphone stack and segmenting as speech recognition.
+        
         Args:
-            audio_callback: Called with audio when speech detected
+            audio_callback: Called with 16-bit PCM bytes of each speech segment
             on_speech_start: Called when speech starts
             on_speech_end: Called when speech ends
+            config: Capture configuration (stt.capture in config.yaml)
         """
-        import pyaudio
+        from core.capture import CaptureEngine
         
-        CHUNK = 1024
-        FORMAT = pyaudio.paInt16
-        CHANNELS = 1
         RATE = 16000
+        engine = CaptureEngine(config or {}, self, sample_rate=RATE)
+        if on_speech_start:
+            engine.subscribe('speech_start', lambda start: on_speech_start())
         
-        p = pyaudio.PyAudio()
-        stream = p.open(
-            format=FORMAT,
-            channels=CHANNELS,
-            rate=RATE,
-            input=True,
-            frames_per_buffer=CHUNK
-        )
-        
+        engine.start()
         self.logger.info("VAD continuous listening started")
         
-        is_speaking = False
-        speech_frames = []
-        silence_counter = 0
-        silence_threshold = 20  # Number of silent frames before stopping
-        
         try:
             while True:
-                # Read audio chunk
-                data = stream.read(CHUNK, exception_on_overflow=False)
-                audio_array = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+                segment = engine.next_segment()
+                if segment is None:
+                    break
                 
-                # Check for speech
-                has_speech = self.is_speech(audio_array, RATE)
+                if on_speech_end:
+                    on_speech_end()
                 
-                if has_speech:
-                    if not is_speaking:
-                        # Speech started
-                        is_speaking = True
-                        speech_frames = []
-                        silence_counter = 0
-                        
-                        if on_speech_start:
-                            on_speech_start()
-                        
-                        self.logger.debug("Speech detected - recording")
-                    
-                    speech_frames.append(data)
-                else:
-                    if is_speaking:
-                        silence_counter += 1
-                        speech_frames.append(data)  # Include some silence
-                        
-                        if silence_counter >= silence_threshold:
-                            # Speech ended
-                            is_speaking = False
-                            
-                            if on_speech_end:
-                                on_speech_end()
-                            
-                            # Process recorded speech
-                            if speech_frames:
-                                complete_audio = b''.join(speech_frames)
-                                audio_callback(complete_audio)
-                            
-                            speech_frames = []
-                            silence_counter = 0
-                            
-                            self.logger.debug("Speech ended - processing")
+                audio = engine.ring.view(segment.start, segment.end)[:, 0]
+                audio_callback((np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+                self.logger.debug("Speech ended - processing")
                 
         except KeyboardInterrupt:
             self.logger.info("VAD listening stopped")
         finally:
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
+            engine.stop()
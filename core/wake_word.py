@@ -0,0 +1,298 @@
+"""
+Wake Word Spotter
+
+Lightweight keyword spotting that decides whether a speech segment might
+contain the wake word before any Whisper transcription runs. Segments are
+compared with recorded examples of the wake word (templates) using MFCC
+features and subsequence dynamic time warping, which costs a few
+milliseconds instead of a full transcription.
+
+Templates are learned automatically: whenever Whisper confirms the wake word,
+the matching audio is added as a template. Until enough templates exist,
+every segment is let through, and afterwards a rejected segment is still
+transcribed now and then, so a new voice or microphone can be learned.
+"""
+
+import logging
+import os
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+
+def _mel_filterbank(sample_rate: int, n_fft: int, n_mels: int) -> np.ndarray:
+    """Triangular mel filters, shape (n_mels, n_fft // 2 + 1)."""
+    def hz_to_mel(hz):
+        return 2595.0 * np.log10(1.0 + hz / 700.0)
+    
+    def mel_to_hz(mel):
+        return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+    
+    mels = np.linspace(hz_to_mel(0), hz_to_mel(sample_rate / 2), n_mels + 2)
+    bins = np.floor((n_fft + 1) * mel_to_hz(mels) / sample_rate).astype(int)
+    
+    filters = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+    for i in range(1, n_mels + 1):
+        left, center, right = bins[i - 1], bins[i], bins[i + 1]
+        if center > left:
+            filters[i - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+        if right > center:
+            filters[i - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+    return filters
+
+
+class MFCCExtractor:
+    """MFCC features (25 ms frames, 10 ms hop) computed with numpy only."""
+    
+    def __init__(self, sample_rate: int = 16000, n_mels: int = 26, n_coeffs: int = 13):
+        """
+        Initialize extractor.
+        
+        Args:
+            sample_rate: Audio sample rate
+            n_mels: Mel filters
+            n_coeffs: Cepstral coefficients kept (c0 is dropped)
+        """
+        self.sample_rate = sample_rate
+        self.frame = int(0.025 * sample_rate)
+        self.hop = int(0.010 * sample_rate)
+        self.n_fft = 1 << (self.frame - 1).bit_length()
+        self.window = np.hamming(self.frame).astype(np.float32)
+        self.filters = _mel_filterbank(sample_rate, self.n_fft, n_mels)
+        
+        # DCT-II basis for coefficients 1..n_coeffs
+        k = np.arange(1, n_coeffs + 1)[:, None]
+        n = np.arange(n_mels)[None, :]
+        self.dct = np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels)).astype(np.float32)
+    
+    def __call__(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Compute normalized MFCC frames.
+        
+        Args:
+            audio: Mono float32 audio
+        
+        Returns:
+            Array of shape (frames, n_coeffs); mean-normalized, unit-length rows
+        """
+        if len(audio) < self.frame:
+            return np.zeros((0, self.dct.shape[0]), dtype=np.float32)
+        
+        emphasized = np.append(audio[0], audio[1:] - 0.97 * audio[:-1]).astype(np.float32)
+        count = 1 + (len(emphasized) - self.frame) // self.hop
+        frames = np.lib.stride_tricks.as_strided(
+            emphasized,
+            shape=(count, self.frame),
+            strides=(emphasized.strides[0] * self.hop, emphasized.strides[0])
+        ) * self.window
+        
+        power = np.abs(np.fft.rfft(frames, self.n_fft)) ** 2
+        mel = np.log(power @ self.filters.T + 1e-10)
+        mfcc = mel @ self.dct.T
+        
+        # Cepstral mean normalization removes the channel (microphone) response
+        mfcc -= mfcc.mean(axis=0)
+        norms = np.linalg.norm(mfcc, axis=1, keepdims=True)
+        return mfcc / np.maximum(norms, 1e-8)
+
+
+def subsequence_dtw(template: np.ndarray, query: np.ndarray) -> float:
+    """
+    Best alignment cost of a template anywhere inside a query.
+    
+    Local cost is cosine distance between unit-length feature rows. Each
+    template frame advances the query by 0, 1 or 2 frames, so the match may
+    be up to twice as fast as the template or arbitrarily slower, and the
+    cost is normalized by the template length.
+    
+    Args:
+        template: Template features (m, d)
+        query: Query features (n, d)
+    
+    Returns:
+        Mean per-frame distance of the best alignment (0 = identical)
+    """
+    if not len(template) or not len(query):
+        return float('inf')
+    
+    cost = 1.0 - template @ query.T
+    total = cost[0].copy()
+    for row in cost[1:]:
+        previous = total
+        best = previous.copy()
+        best[1:] = np.minimum(best[1:], previous[:-1])
+        best[2:] = np.minimum(best[2:], previous[:-2])
+        total = row + best
+    return float(total.min() / len(template))
+
+
+class WakeWordSpotter:
+    """
+    Gates Whisper in dormant mode with template-matched keyword spotting.
+    
+    A segment is a candidate when its distance to any template is below
+    the threshold. With fewer than min_templates templates every segment is
+    a candidate, so the spotter never blocks the wake word while it is
+    still learning it. After probe_every consecutive rejections the next
+    segment is passed as a probe: if Whisper finds the wake word in it, it
+    becomes a template, so the spotter recovers when the voice, microphone
+    or room no longer match the saved templates.
+    
+    Features are mean-normalized over the whole segment, for templates as
+    well as queries: a template is cut from the features of the segment it
+    was confirmed in.
+    """
+    
+    FEATURE_VERSION = 2  # Saved templates from other versions are discarded
+    
+    def __init__(self, config: dict, sample_rate: int = 16000):
+        """
+        Initialize spotter.
+        
+        Args:
+            config: Spotter configuration (stt.wake_word_spotter in config.yaml)
+            sample_rate: Audio sample rate
+        """
+        self.logger = logging.getLogger("jarvis.wake_word")
+        self.enabled = config.get('enabled', True)
+        self.threshold = config.get('threshold', 0.4)
+        self.min_templates = config.get('min_templates', 3)
+        self.max_templates = config.get('max_templates', 10)
+        self.probe_every = config.get('probe_every', 10)
+        self.templates_path = config.get('templates_path', 'data/wake_word_templates.npz')
+        
+        self.sample_rate = sample_rate
+        self.features = MFCCExtractor(sample_rate)
+        self.templates: List[np.ndarray] = []
+        self._lock = threading.Lock()
+        
+        self.checked = 0
+        self.passed = 0
+        self.probed = 0
+        self.recovered = 0
+        self._rejections = 0  # Consecutive
+        self._probing = False
+        
+        self._load()
+    
+    @property
+    def is_trained(self) -> bool:
+        """Whether there are enough templates to gate segments."""
+        return len(self.templates) >= self.min_templates
+    
+    def _load(self):
+        """Load saved templates."""
+        if not os.path.exists(self.templates_path):
+            return
+        try:
+            with np.load(self.templates_path) as data:
+                version = int(data['feature_version']) if 'feature_version' in data.files else 1
+                if version != self.FEATURE_VERSION:
+                    self.logger.info("Discarding wake word templates saved with older features")
+                    return
+                names = [name for name in data.files if name.startswith('template_')]
+                self.templates = [data[name] for name in sorted(names, key=lambda name: int(name.split('_')[1]))]
+            self.logger.info(f"Loaded {len(self.templates)} wake word templates")
+        except Exception as e:
+            self.logger.warning(f"Failed to load wake word templates: {e}")
+    
+    def _save(self, templates: List[np.ndarray]):
+        """Save templates."""
+        try:
+            os.makedirs(os.path.dirname(self.templates_path) or '.', exist_ok=True)
+            np.savez(
+                self.templates_path,
+                feature_version=self.FEATURE_VERSION,
+                **{f"template_{i}": t for i, t in enumerate(templates)}
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to save wake word templates: {e}")
+    
+    def distance(self, audio: np.ndarray) -> float:
+        """
+        Distance from a segment to the closest template.
+        
+        Args:
+            audio: Mono float32 audio
+        
+        Returns:
+            Best alignment distance (inf without templates)
+        """
+        query = self.features(audio)
+        with self._lock:
+            templates = list(self.templates)
+        return min((subsequence_dtw(template, query) for template in templates), default=float('inf'))
+    
+    def is_candidate(self, audio: np.ndarray) -> bool:
+        """
+        Check whether a segment may contain the wake word.
+        
+        Args:
+            audio: Mono float32 audio
+        
+        Returns:
+            True if the segment should be transcribed
+        """
+        if not self.enabled or not self.is_trained:
+            return True
+        
+        self.checked += 1
+        distance = self.distance(audio)
+        candidate = distance <= self.threshold
+        self._probing = False
+        if candidate:
+            self.passed += 1
+            self._rejections = 0
+            verdict = 'candidate'
+        elif self.probe_every and self._rejections >= self.probe_every:
+            # Transcribe anyway, in case the templates no longer fit
+            self.probed += 1
+            self._rejections = 0
+            self._probing = True
+            verdict = 'probe'
+        else:
+            self._rejections += 1
+            verdict = 'rejected'
+        self.logger.debug(f"Wake word distance {distance:.3f} ({verdict})")
+        return candidate or self._probing
+    
+    def enroll(self, audio: np.ndarray, start: int = 0, end: Optional[int] = None):
+        """
+        Add a confirmed example of the wake word as a template.
+        
+        Args:
+            audio: Mono float32 audio of the segment the wake word was
+                confirmed in (as passed to is_candidate)
+            start: First sample of the wake word in the segment
+            end: Position after the wake word's last sample (default: end
+                of segment)
+        """
+        if end is None:
+            end = len(audio)
+        if not self.enabled:
+            return
+        if not 0.2 * self.sample_rate <= end - start <= 1.5 * self.sample_rate:
+            return
+        
+        # Normalized over the segment, like the queries it is compared with
+        features = self.features(audio)
+        first = start // self.features.hop
+        last = max(first + 1, (end - self.features.frame) // self.features.hop + 1)
+        template = features[first:last]
+        if not len(template):
+            return
+        
+        if self._probing:
+            self._probing = False
+            self.recovered += 1
+            self.logger.info("Wake word confirmed in a rejected segment; learning it")
+        
+        with self._lock:
+            self.templates.append(template)
+            # Newest examples track the current voice and microphone
+            self.templates = self.templates[-self.max_templates:]
+            templates = list(self.templates)
+        
+        self._save(templates)
+        self.logger.debug(f"Enrolled wake word template ({len(templates)} total)")
@@ -0,0 +1,294 @@
+"""
+Whisper Model Manager
+
+Keeps one resident faster-whisper model per configuration, shared by every
+caller (console loop, dashboard open mic, API), warms it up at load time so
+the first utterance doesn't pay for CTranslate2 initialization, and can swap
+between a fast and an accurate model based on the measured real-time factor.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+# Whisper models expect 16 kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+
+class WhisperModelManager:
+    """
+    Owns the resident Whisper model.
+    
+    transcribe() can be called from several threads at once; with
+    num_workers > 1 CTranslate2 decodes them in parallel on the same model.
+    
+    Real-time factor (RTF) is decode time divided by audio duration,
+    measured on full-utterance transcriptions only. With auto_switch enabled, a rolling RTF above max_rtf on the accurate model
+    swaps to the fast model; a rolling RTF below upgrade_rtf on the fast
+    model swaps back. The replacement is loaded and warmed up on a
+    background thread and swapped in atomically, so transcription never
+    waits for a load.
+    """
+    
+    def __init__(self, config: dict):
+        """
+        Initialize manager and load the configured model.
+        
+        Args:
+            config: Local STT configuration (stt.local in config.yaml)
+        """
+        self.config = config
+        self.logger = logging.getLogger("jarvis.stt.models")
+        
+        self.device = config.get('device', 'cpu')
+        self.compute_type = config.get('compute_type', 'int8')
+        self.cpu_threads = config.get('cpu_threads', 0)  # 0 = CTranslate2 default
+        self.num_workers = config.get('num_workers', 1)
+        self.warm_up_enabled = config.get('warm_up', True)
+        
+        switch_config = config.get('auto_switch', {})
+        self.auto_switch = switch_config.get('enabled', False)
+        self.fast_model = switch_config.get('fast_model', 'tiny')
+        self.accurate_model = switch_config.get('accurate_model', 'base')
+        self.max_rtf = switch_config.get('max_rtf', 0.5)
+        self.upgrade_rtf = switch_config.get('upgrade_rtf', 0.1)
+        self.cooldown = switch_config.get('cooldown', 120)
+        
+        self._rtf_samples = deque(maxlen=switch_config.get('window', 8))
+        self._lock = threading.Lock()
+        self._swapping = False
+        self._last_swap = 0.0
+        
+        self.model_size = config['model']
+        self.load_times: Dict[str, float] = {}
+        self.model = self._load(self.model_size)
+    
+    def _load(self, model_size: str) -> Any:
+        """
+        Load and warm up a model.
+        
+        Args:
+            model_size: Whisper model name (tiny, base, ...)
+        
+        Returns:
+            WhisperModel instance
+        """
+        from faster_whisper import WhisperModel
+        
+        start = time.perf_counter()
+        self.logger.info(
+            f"Loading Whisper model: {model_size} on {self.device} "
+            f"(cpu_threads={self.cpu_threads or 'auto'}, num_workers={self.num_workers})"
+        )
+        model = WhisperModel(
+            model_size,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers
+        )
+        loaded = time.perf_counter()
+        
+        if self.warm_up_enabled:
+            self._warm_up(model)
+        
+        self.load_times[model_size] = time.perf_counter() - start
+        self.logger.info(
+            f"Whisper model {model_size} ready in {self.load_times[model_size]:.2f}s "
+            f"(warm-up {time.perf_counter() - loaded:.2f}s)"
+        )
+        return model
+    
+    def _warm_up(self, model: Any):
+        """Run a dummy transcription so lazy initialization happens now."""
+        try:
+            silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+            segments, _ = model.transcribe(silence, language="en", beam_size=1)
+            # Segments are decoded lazily; consume them to run the decoder
+            list(segments)
+        except Exception as e:
+            self.logger.warning(f"Whisper warm-up failed: {e}")
+    
+    def transcribe(self, audio: np.ndarray, measure: bool = False, **options) -> Tuple[List[Any], Any]:
+        """
+        Transcribe 16 kHz mono float32 audio with the resident model.
+        
+        Args:
+            audio: Audio samples
+            measure: Record the real-time factor (for model switching and
+                beam sizing). Only for full utterances: short partial passes
+                (streaming, wake word checks) pay for Whisper's fixed 30 s
+                window and would inflate it.
+            **options: Passed to WhisperModel.transcribe
+        
+        Returns:
+            (decoded segments, transcription info)
+        """
+        with self._lock:
+            model, model_size = self.model, self.model_size
+        
+        start = time.perf_counter()
+        segments, info = model.transcribe(audio, **options)
+        segments = list(segments)
+        elapsed = time.perf_counter() - start
+        
+        duration = len(audio) / WHISPER_SAMPLE_RATE
+        if measure and duration > 0:
+            self._record_rtf(model_size, elapsed / duration)
+        
+        return segments, info
+    
+    def transcribe_batch(self, audios: List[np.ndarray], beam_size: int = 1, language: str = "en") -> List[str]:
+        """
+        Transcribe several utterances in one batched decoder call.
+        
+        Each utterance is encoded as its own 30 s window (longer audio is cut
+        at 30 s), so this suits short commands from several clients rather
+        than long recordings.
+        
+        Args:
+            audios: 16 kHz mono float32 clips
+            beam_size: Beam size
+            language: Spoken language
+            
+        Returns:
+            Transcribed text per clip (empty for clips judged non-speech)
+        """
+        from faster_whisper.audio import pad_or_trim
+        from faster_whisper.tokenizer import Tokenizer
+        from faster_whisper.transcribe import get_suppressed_tokens
+        
+        with self._lock:
+            model = self.model
+        
+        tokenizer = Tokenizer(model.hf_tokenizer, model.model.is_multilingual, task="transcribe", language=language)
+        features = np.stack([
+            pad_or_trim(model.feature_extractor(audio)[..., :model.feature_extractor.nb_max_frames])
+            for audio in audios
+        ])
+        
+        encoder_output = model.encode(features)
+        prompt = model.get_prompt(tokenizer, [], without_timestamps=True)
+        results = model.model.generate(
+            encoder_output,
+            [list(prompt) for _ in audios],
+            beam_size=beam_size,
+            max_length=model.max_length,
+            suppress_blank=True,
+            suppress_tokens=get_suppressed_tokens(tokenizer, [-1]),
+            return_scores=True,
+            return_no_speech_prob=True
+        )
+        
+        texts = []
+        for result in results:
+            tokens = result.sequences_ids[0]
+            # Scores are length-normalized; faster-whisper's average log
+            # probability divides the summed score by length + 1
+            avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+            
+            # Same skip rule as faster-whisper's single transcriptions: likely
+            # non-speech AND a low-confidence decode
+            if result.no_speech_prob > 0.6 and avg_logprob < -1.0:
+                texts.append("")
+            else:
+                texts.append(tokenizer.decode(tokens).strip())
+        return texts
+    
+    def _record_rtf(self, model_size: str, rtf: float):
+        """Track the real-time factor and start a swap if it is out of range."""
+        with self._lock:
+            # Ignore results from a model that has since been swapped out
+            if model_size != self.model_size:
+                return
+            self._rtf_samples.append(rtf)
+            
+            if not self.auto_switch or self._swapping:
+                return
+            if len(self._rtf_samples) < self._rtf_samples.maxlen:
+                return
+            if time.time() - self._last_swap < self.cooldown:
+                return
+            
+            average = sum(self._rtf_samples) / len(self._rtf_samples)
+            target = None
+            if model_size == self.accurate_model and average > self.max_rtf:
+                target = self.fast_model
+            elif model_size == self.fast_model and average < self.upgrade_rtf:
+                target = self.accurate_model
+            
+            if target is None:
+                return
+            self._swapping = True
+        
+        self.logger.info(f"Whisper RTF {average:.2f} on {model_size}, switching to {target}")
+        threading.Thread(target=self._swap, args=(target,), name="jarvis-whisper-swap", daemon=True).start()
+    
+    def _swap(self, model_size: str):
+        """Load a model in the background and make it the resident model."""
+        try:
+            model = self._load(model_size)
+            with self._lock:
+                # The old model is released once in-flight transcriptions finish
+                self.model = model
+                self.model_size = model_size
+                self._rtf_samples.clear()
+            self.logger.info(f"Resident Whisper model is now {model_size}")
+        except Exception as e:
+            self.logger.error(f"Failed to switch Whisper model to {model_size}: {e}")
+        finally:
+            with self._lock:
+                self._swapping = False
+                self._last_swap = time.time()
+    
+    def stats(self) -> dict:
+        """
+        Get model statistics.
+        
+        Returns:
+            Resident model, recent average RTF and load times
+        """
+        with self._lock:
+            samples = list(self._rtf_samples)
+        return {
+            'model': self.model_size,
+            'average_rtf': round(sum(samples) / len(samples), 3) if samples else None,
+            'samples': len(samples),
+            'load_times': {name: round(seconds, 2) for name, seconds in self.load_times.items()},
+            'auto_switch': self.auto_switch
+        }
+
+
+_managers: Dict[Tuple, WhisperModelManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_model_manager(config: dict) -> WhisperModelManager:
+    """
+    Get or create the shared model manager for a configuration.
+    
+    Args:
+        config: Local STT configuration (stt.local in config.yaml)
+    
+    Returns:
+        WhisperModelManager: The manager instance
+    """
+    key = (
+        config['model'],
+        config.get('device', 'cpu'),
+        config.get('compute_type', 'int8'),
+        config.get('cpu_threads', 0),
+        config.get('num_workers', 1)
+    )
+    
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = WhisperModelManager(config)
+            _managers[key] = manager
+        return manager
@@ -4,14 +4,15 @@ Jarvis Mark III - Main Orchestrator
 This is the entry point that coordinates all subsystems.
 """
 
+import argparse
 import sys
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 import yaml
-from core.jarvis import Jarvis
 from core.logger import setup_logger
-from core.license_validator import get_validator
 
 
 def get_resource_path(relative_path):
@@ -39,26 +40,20 @@ def load_config(config_path: str = "config.yaml") -> dict:
             return yaml.safe_load(f)
 
 
-def main():
-    """Main entry point for Jarvis Mark III."""
-    print("=" * 60)
-    print("JARVIS MARK III - AI Assistant")
-    print("=" * 60)
-    print()
+def validate_license(config: dict, logger: logging.Logger) -> Tuple[bool, List[str]]:
+    """
+    Validate the license key.
     
-    # Setup logging
-    config = load_config()
-    logger = setup_logger(config['logging'])
-    logger.info("Initializing Jarvis Mark III...")
-    
-    # Ensure data directory exists
-    Path("data").mkdir(exist_ok=True)
-    Path("logs").mkdir(exist_ok=True)
+    Args:
+        config: Configuration dictionary
+        logger: Application logger
+        
+    Returns:
+        (whether Jarvis may run, console lines to print)
+    """
+    from core.license_validator import get_validator
     
-    # ============================================
-    # LICENSE VALIDATION ON STARTUP
-    # ============================================
-    print("Validating license...")
+    output = []
     logger.info("Performing license validation check...")
     
     try:
@@ -66,9 +61,9 @@ def main():
         license_key = config.get('license_key') or os.environ.get('JARVIS_LICENSE_KEY')
         
         if not license_key:
-            print("\n⚠️  WARNING: No license key configured")
-            print("Running in FREE mode with limited features")
-            print("To activate Pro/Business features, set JARVIS_LICENSE_KEY or add to config.yaml")
+            output.append("\n⚠️  WARNING: No license key configured")
+            output.append("Running in FREE mode with limited features")
+            output.append("To activate Pro/Business features, set JARVIS_LICENSE_KEY or add to config.yaml")
             logger.warning("No license key configured - running in free mode")
         else:
             # Validate license
@@ -80,58 +75,110 @@ def main():
                 expires = result.get('expires', 'N/A')
                 offline_mode = result.get('offline_mode', False)
                 
-                print(f"✓ License validated successfully")
-                print(f"  Tier: {tier}")
-                print(f"  Expires: {expires}")
+                output.append(f"✓ License validated successfully")
+                output.append(f"  Tier: {tier}")
+                output.append(f"  Expires: {expires}")
                 
                 if offline_mode:
                     days_remaining = result.get('offline_days_remaining', 0)
-                    print(f"  Mode: OFFLINE (Grace period: {days_remaining} days remaining)")
+                    output.append(f"  Mode: OFFLINE (Grace period: {days_remaining} days remaining)")
                     logger.warning(f"Running in offline mode - {days_remaining} days remaining")
                 else:
-                    print(f"  Mode: ONLINE")
+                    output.append(f"  Mode: ONLINE")
                 
                 logger.info(f"License validated: {tier} tier (expires {expires})")
             else:
                 error = result.get('error', 'Unknown error')
                 code = result.get('code', 'UNKNOWN')
                 
-                print(f"\n❌ License validation failed: {error}")
-                print(f"Error code: {code}")
+                output.append(f"\n❌ License validation failed: {error}")
+                output.append(f"Error code: {code}")
                 
                 if code in ['LICENSE_EXPIRED', 'LICENSE_INACTIVE', 'INVALID_KEY']:
-                    print("\nYour license is not valid. Please:")
-                    print("1. Check your license key")
-                    print("2. Contact support@jarvisomega.com for assistance")
-                    print("3. Or visit https://jarvisomega.vercel.app to renew")
+                    output.append("\nYour license is not valid. Please:")
+                    output.append("1. Check your license key")
+                    output.append("2. Contact support@jarvisomega.com for assistance")
+                    output.append("3. Or visit https://jarvisomega.vercel.app to renew")
                     logger.error(f"License validation failed: {error}")
                     
                     # Exit if license is explicitly invalid (not just offline)
                     if not result.get('offline'):
-                        print("\nExiting...")
-                        sys.exit(1)
+                        return False, output
                 elif code == 'OFFLINE_GRACE_EXPIRED':
                     offline_days = result.get('offline_days', 0)
-                    print(f"\nYour device has been offline for {offline_days} days")
-                    print("Please connect to the internet to validate your license")
+                    output.append(f"\nYour device has been offline for {offline_days} days")
+                    output.append("Please connect to the internet to validate your license")
                     logger.error(f"Offline grace period expired ({offline_days} days)")
-                    print("\nExiting...")
-                    sys.exit(1)
+                    return False, output
                 else:
-                    print(f"\nContinuing with limited features...")
+                    output.append(f"\nContinuing with limited features...")
                     logger.warning(f"License validation issue: {error} - continuing with limited features")
     
     except Exception as e:
         logger.error(f"License validation error: {e}", exc_info=True)
-        print(f"\n⚠️  License validation error: {e}")
-        print("Continuing with limited features...")
+        output.append(f"\n⚠️  License validation error: {e}")
+        output.append("Continuing with limited features...")
+    
+    return True, output
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Jarvis Mark III - AI Assistant")
+    parser.add_argument('--no-gui', action='store_true', help="Run in console mode")
+    parser.add_argument('--startup-report', action='store_true', help="Print per-subsystem startup timings")
+    # Ignore unknown arguments (e.g. from launchers), as before
+    return parser.parse_known_args(argv)[0]
+
+
+def main():
+    """Main entry point for Jarvis Mark III."""
+    # Parse arguments before importing subsystems, so --help and bad
+    # arguments return immediately
+    args = parse_args()
     
+    print("=" * 60)
+    print("JARVIS MARK III - AI Assistant")
+    print("=" * 60)
     print()
     
+    # Setup logging
+    config = load_config()
+    logger = setup_logger(config['logging'])
+    logger.info("Initializing Jarvis Mark III...")
+    
+    # Ensure data directory exists
+    Path("data").mkdir(exist_ok=True)
+    Path("logs").mkdir(exist_ok=True)
+    
+    # ============================================
+    # LICENSE VALIDATION ON STARTUP
+    # ============================================
+    # Runs alongside subsystem initialization; the result is reported (and
+    # enforced) once Jarvis is constructed
+    print("Validating license...")
+    license_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis-license")
+    license_check = license_executor.submit(validate_license, config, logger)
+    license_executor.shutdown(wait=False)
+    
     try:
-        # Initialize Jarvis
+        # Initialize Jarvis (imports subsystems as they are constructed)
+        from core.jarvis import Jarvis
         jarvis = Jarvis(config)
         
+        license_ok, license_output = license_check.result()
+        for line in license_output:
+            print(line)
+        print()
+        if not license_ok:
+            print("\nExiting...")
+            jarvis.shutdown()
+            sys.exit(1)
+        
+        if args.startup_report:
+            print(jarvis.startup_report.format())
+            print()
+        
         # Print startup information
         print(f"Speech Input: {config['stt']['mode'].upper()}")
         print(f"AI Model: {config['llm']['model']}")
@@ -142,7 +189,7 @@ def main():
         print()
         
         # Check if running in GUI mode
-        if "--no-gui" in sys.argv:
+        if args.no_gui:
             print("Running in console mode (--no-gui)")
             jarvis.run_console()
         else:
@@ -5,11 +5,43 @@ Manages skill registration and execution with safety controls.
 """
 
 from typing import Dict, List, Any, Optional
+import ast
+import importlib
+import importlib.util
 import logging
+import threading
+import time
+
+
+# Built-in skills in priority order: (config name, module, class, load message)
+# IMPORTANT: custom_qa comes FIRST so it has highest priority
+BUILTIN_SKILLS = [
+    ('custom_qa', 'skills.custom_qa', 'CustomQASkill', "Custom Q&A loaded (HIGHEST PRIORITY)"),
+    ('system', 'skills.system_skills', 'SystemSkills', "System skills loaded"),
+    ('web', 'skills.web_skills', 'WebSkills', "Web skills loaded"),
+    ('file', 'skills.file_skills', 'FileSkills', "File skills loaded"),
+    ('python', 'skills.python_skills', 'PythonSkills', "Python skills loaded"),
+    ('calendar', 'skills.calendar_reminder_skills', 'CalendarReminderSkills', "Calendar skills loaded"),
+    ('smarthome', 'skills.smarthome_skills', 'SmartHomeSkills', "Smart home skills loaded"),
+    ('custom', 'skills.custom_skills', 'CustomSkill', "Custom skills loaded"),
+]
 
 
 class BaseSkill:
-    """Base class for all skills."""
+    """
+    Base class for all skills.
+    
+    Skills declare the intents they handle in `intents`; the skills engine
+    routes those intents straight to the skill. Skills that match on the
+    raw user text instead (e.g. custom Q&A) set `matches_raw_text` and are
+    asked in order as a fallback.
+    """
+    
+    # Intent identifiers this skill handles
+    intents: List[str] = []
+    
+    # True if can_handle() inspects the raw text rather than the intent
+    matches_raw_text = False
     
     def __init__(self, config: dict):
         """
@@ -21,6 +53,16 @@ class BaseSkill:
         self.config = config
         self.logger = logging.getLogger(f"jarvis.skills.{self.__class__.__name__}")
     
+    @property
+    def skill_name(self) -> str:
+        """Class name of the skill (for logs and listings)."""
+        return self.__class__.__name__
+    
+    @property
+    def skill_description(self) -> Optional[str]:
+        """Docstring of the skill class (for listings)."""
+        return self.__class__.__doc__
+    
     def can_handle(self, intent: str, entities: dict) -> bool:
         """
         Check if this skill can handle the given intent.
@@ -32,7 +74,7 @@ class BaseSkill:
         Returns:
             True if skill can handle this intent
         """
-        raise NotImplementedError
+        return intent in self.intents
     
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """
@@ -61,6 +103,140 @@ class BaseSkill:
         return False
 
 
+def read_skill_metadata(module_name: str, class_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a skill's declared intents from its source without importing it.
+    
+    Args:
+        module_name: Module containing the skill
+        class_name: Skill class name
+        
+    Returns:
+        Dict with 'intents', 'matches_raw_text', 'custom_can_handle' and
+        'description' (the class docstring), or None if the source isn't
+        available (e.g. frozen builds)
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+        if not spec or not spec.origin or not spec.origin.endswith('.py'):
+            return None
+        
+        with open(spec.origin, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=spec.origin)
+        
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == class_name:
+                metadata = {
+                    'intents': [],
+                    'matches_raw_text': False,
+                    'custom_can_handle': False,
+                    'description': ast.get_docstring(node)
+                }
+                for item in node.body:
+                    if isinstance(item, ast.Assign) and len(item.targets) == 1 and isinstance(item.targets[0], ast.Name):
+                        if item.targets[0].id in ('intents', 'matches_raw_text'):
+                            metadata[item.targets[0].id] = ast.literal_eval(item.value)
+                    elif isinstance(item, ast.FunctionDef) and item.name == 'can_handle':
+                        metadata['custom_can_handle'] = True
+                return metadata
+    except Exception:
+        pass
+    return None
+
+
+class LazySkill(BaseSkill):
+    """
+    Stand-in for a skill that is imported and constructed on first use.
+    
+    Routing only needs the skill's declared intents, which come from
+    read_skill_metadata(), so the module (and its heavy imports or
+    background threads) loads when the skill is first dispatched to - or
+    during warm-up. Attributes set before that (e.g. the dashboard
+    reference) are applied to the real skill once it exists.
+    """
+    
+    def __init__(self, name: str, module_name: str, class_name: str, config: dict, metadata: Dict[str, Any]):
+        """
+        Initialize proxy.
+        
+        Args:
+            name: Skill config name
+            module_name: Module containing the skill
+            class_name: Skill class name
+            config: Skill-specific configuration
+            metadata: Declared intents from read_skill_metadata()
+        """
+        self.__dict__.update(
+            name=name,
+            module_name=module_name,
+            class_name=class_name,
+            config=config,
+            intents=list(metadata['intents']),
+            matches_raw_text=metadata['matches_raw_text'],
+            custom_can_handle=metadata['custom_can_handle'],
+            description=metadata.get('description'),
+            logger=logging.getLogger("jarvis.skills"),
+            _skill=None,
+            _pending={},
+            _lock=threading.Lock()
+        )
+    
+    @property
+    def skill_name(self) -> str:
+        # The real skill's class, not the proxy's
+        return self.class_name
+    
+    @property
+    def skill_description(self) -> Optional[str]:
+        # Read from the source, so listing skills doesn't load them
+        return self.description
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the real skill has been constructed."""
+        return self._skill is not None
+    
+    def load(self) -> BaseSkill:
+        """Import and construct the real skill (once)."""
+        if self._skill is None:
+            with self._lock:
+                if self._skill is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self.module_name)
+                    skill = getattr(module, self.class_name)(self.config)
+                    for attr, value in self._pending.items():
+                        setattr(skill, attr, value)
+                    self.__dict__['_skill'] = skill
+                    self.logger.info(f"Loaded {self.class_name} on demand ({(time.perf_counter() - start) * 1000:.0f}ms)")
+        return self._skill
+    
+    def can_handle(self, intent: str, entities: dict) -> bool:
+        # Plain intent routing can be answered without loading the skill
+        if not self.custom_can_handle:
+            return intent in self.intents
+        return self.load().can_handle(intent, entities)
+    
+    def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
+        return self.load().execute(intent, entities, raw_text)
+    
+    def requires_confirmation(self, intent: str) -> bool:
+        return self.load().requires_confirmation(intent)
+    
+    def __getattr__(self, attr):
+        # Only called for attributes the proxy itself doesn't have
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+    
+    def __setattr__(self, attr, value):
+        if attr in self.__dict__:
+            self.__dict__[attr] = value
+        elif self._skill is not None:
+            setattr(self._skill, attr, value)
+        else:
+            self._pending[attr] = value
+
+
 class SkillsEngine:
     """
     Skills engine that manages and executes skills.
@@ -82,56 +258,169 @@ class SkillsEngine:
         self.logger = logging.getLogger("jarvis.skills")
         self.skills: List[BaseSkill] = []
         
+        # Skills by config name (e.g. 'custom_qa', 'custom'), for direct access
+        self.registry: Dict[str, BaseSkill] = {}
+        
         # Load enabled skills
         self._load_skills()
+        self._build_dispatch_table()
+        
+        # Reload custom Q&A / command files when they change on disk
+        self.watcher = None
+        hot_reload = self.config.get('hot_reload', {})
+        if hot_reload.get('enabled', True):
+            from skills.reloadable import FileWatcher
+            self.watcher = FileWatcher(interval=hot_reload.get('interval', 2.0))
+            for skill in self._reloadable_skills():
+                self.watcher.watch(skill.source_path, skill.reload)
+            self.watcher.start()
         
         self.logger.info(f"Skills engine initialized with {len(self.skills)} skills")
     
+    def _reloadable_skills(self) -> List[BaseSkill]:
+        """Skills backed by a data file that can be reloaded at runtime."""
+        return [
+            skill for skill in self.skills
+            if not isinstance(skill, LazySkill) and hasattr(skill, 'reload') and hasattr(skill, 'source_path')
+        ]
+    
+    def reload_sources(self):
+        """
+        Reload all file-backed skills (custom Q&A and custom commands).
+        
+        Unchanged files are served from the compiled cache, so this is cheap
+        to call after any edit.
+        """
+        for skill in self._reloadable_skills():
+            skill.reload()
+    
+    def close(self):
+        """Stop background file watching."""
+        if self.watcher:
+            self.watcher.stop()
+    
     def _load_skills(self):
-        """Load enabled skills based on configuration."""
+        """
+        Load enabled skills based on configuration.
+        
+        With lazy loading on, skills that are routed by intent are
+        registered as LazySkill proxies and imported on first use. Raw-text
+        matchers (asked on every request anyway) and skills listed in
+        lazy_loading.eager are constructed immediately.
+        """
         enabled = self.config.get('enabled', [])
+        lazy_config = self.config.get('lazy_loading', {})
+        lazy = lazy_config.get('enabled', True)
+        eager = set(lazy_config.get('eager', []))
         
-        # Import and instantiate skills
-        # IMPORTANT: Load custom_qa FIRST so it has highest priority
-        if 'custom_qa' in enabled:
-            from skills.custom_qa import CustomQASkill
-            self.skills.append(CustomQASkill(self.config.get('custom_qa', {})))
-            self.logger.info("✓ Custom Q&A loaded (HIGHEST PRIORITY)")
-        
-        if 'system' in enabled:
-            from skills.system_skills import SystemSkills
-            self.skills.append(SystemSkills(self.config.get('system', {})))
-            self.logger.info("✓ System skills loaded")
-        
-        if 'web' in enabled:
-            from skills.web_skills import WebSkills
-            self.skills.append(WebSkills(self.config.get('web', {})))
-            self.logger.info("✓ Web skills loaded")
-        
-        if 'file' in enabled:
-            from skills.file_skills import FileSkills
-            self.skills.append(FileSkills(self.config.get('file', {})))
-            self.logger.info("✓ File skills loaded")
-        
-        if 'python' in enabled:
-            from skills.python_skills import PythonSkills
-            self.skills.append(PythonSkills(self.config.get('python', {})))
-            self.logger.info("✓ Python skills loaded")
-        
-        if 'calendar' in enabled:
-            from skills.calendar_reminder_skills import CalendarReminderSkills
-            self.skills.append(CalendarReminderSkills(self.config.get('calendar', {})))
-            self.logger.info("✓ Calendar skills loaded")
-        
-        if 'smarthome' in enabled:
-            from skills.smarthome_skills import SmartHomeSkills
-            self.skills.append(SmartHomeSkills(self.config.get('smarthome', {})))
-            self.logger.info("✓ Smart home skills loaded")
-        
-        if 'custom' in enabled:
-            from skills.custom_skills import CustomSkill
-            self.skills.append(CustomSkill(self.config.get('custom', {})))
-            self.logger.info("✓ Custom skills loaded")
+        for name, module_name, class_name, message in BUILTIN_SKILLS:
+            if name not in enabled:
+                continue
+            skill_config = self.config.get(name, {})
+            
+            metadata = None
+            if lazy and name not in eager:
+                metadata = read_skill_metadata(module_name, class_name)
+            
+            if metadata and metadata['intents'] and not metadata['matches_raw_text']:
+                self._register(name, LazySkill(name, module_name, class_name, skill_config, metadata))
+                self.logger.info(f"✓ {class_name} registered (loads on first use)")
+            else:
+                skill_class = getattr(importlib.import_module(module_name), class_name)
+                self._register(name, skill_class(skill_config))
+                self.logger.info(f"✓ {message}")
+    
+    def warm_up(self, names: Optional[List[str]] = None) -> List[str]:
+        """
+        Load deferred skills ahead of their first use.
+        
+        Args:
+            names: Skill config names to load (default: all deferred skills)
+            
+        Returns:
+            Names of the skills that were loaded
+        """
+        loaded = []
+        for name, skill in list(self.registry.items()):
+            if names is not None and name not in names:
+                continue
+            if isinstance(skill, LazySkill) and not skill.loaded:
+                try:
+                    skill.load()
+                    loaded.append(name)
+                except Exception as e:
+                    self.logger.error(f"Warm-up of {name} skill failed: {e}")
+        return loaded
+    
+    def skills_for_intents(self, intents: List[str]) -> List[str]:
+        """
+        Map intents to the names of the skills they are routed to.
+        
+        Args:
+            intents: Intent identifiers
+            
+        Returns:
+            Skill config names, in order of first appearance
+        """
+        names = []
+        for intent in intents:
+            for skill in self.dispatch_table.get(intent, []):
+                if skill.matches_raw_text:
+                    continue
+                name = next((n for n, s in self.registry.items() if s is skill), None)
+                if name and name not in names:
+                    names.append(name)
+        return names
+    
+    def _register(self, name: str, skill: BaseSkill):
+        """Add a loaded skill in priority order and under its config name."""
+        self.skills.append(skill)
+        self.registry[name] = skill
+    
+    def _build_dispatch_table(self):
+        """
+        Build the intent -> skills dispatch table.
+        
+        Each intent maps to the skills that declare it, merged with the
+        raw-text matchers in load order, so routing keeps the same priority
+        as asking every skill in turn while only consulting the few skills
+        that can actually answer. Intents nobody declares fall back to the
+        raw-text matchers alone.
+        """
+        self.fallback_chain: List[BaseSkill] = [
+            skill for skill in self.skills
+            if skill.matches_raw_text or not skill.intents
+        ]
+        
+        routed: Dict[str, List[BaseSkill]] = {}
+        for skill in self.skills:
+            if skill in self.fallback_chain:
+                continue
+            for intent in skill.intents:
+                routed.setdefault(intent, []).append(skill)
+        
+        position = {id(skill): index for index, skill in enumerate(self.skills)}
+        self.dispatch_table: Dict[str, List[BaseSkill]] = {
+            intent: sorted(skills + self.fallback_chain, key=lambda skill: position[id(skill)])
+            for intent, skills in routed.items()
+        }
+        
+        self.logger.debug(
+            f"Dispatch table: {len(self.dispatch_table)} intents, "
+            f"{len(self.fallback_chain)} raw-text matchers"
+        )
+    
+    def get_skill(self, name: str) -> Optional[BaseSkill]:
+        """
+        Get a loaded skill by config name.
+        
+        Args:
+            name: Skill name as listed in skills.enabled (e.g. 'custom_qa')
+            
+        Returns:
+            Skill instance or None if not enabled
+        """
+        return self.registry.get(name)
     
     def find_skill(self, intent: str, entities: dict) -> Optional[BaseSkill]:
         """
@@ -144,7 +433,7 @@ class SkillsEngine:
         Returns:
             Skill instance or None
         """
-        for skill in self.skills:
+        for skill in self.dispatch_table.get(intent, self.fallback_chain):
             if skill.can_handle(intent, entities):
                 return skill
         return None
@@ -182,7 +471,7 @@ class SkillsEngine:
             
             # Execute skill
             result = skill.execute(intent, entities, raw_text)
-            self.logger.info(f"Skill executed successfully: {skill.__class__.__name__}")
+            self.logger.info(f"Skill executed successfully: {skill.skill_name}")
             return result
             
         except Exception as e:
@@ -200,25 +489,42 @@ class SkillsEngine:
         Returns:
             Answer if found, None otherwise
         """
-        # Find the custom_qa skill
-        qa_skill = None
-        for skill in self.skills:
-            if skill.__class__.__name__ == 'CustomQASkill':
-                qa_skill = skill
-                break
-        
+        qa_skill = self.registry.get('custom_qa')
         if not qa_skill:
             return None
         
-        # Check if Q&A can handle this
-        entities = {'raw_text': raw_text}
-        if qa_skill.can_handle('', entities):
-            # Execute and return the answer
-            answer = qa_skill.execute('', entities, raw_text)
-            return answer
+        # Match and answer in a single lookup
+        match = qa_skill.find_match(raw_text)
+        if match:
+            qa_pair, score = match
+            self.logger.info(f"Matched Q&A: '{qa_pair['question']}' (score: {score:.2f})")
+            return qa_pair['answer']
         
         return None
     
+    def canned_responses(self) -> List[str]:
+        """
+        Responses that are always spoken word for word: Q&A answers and
+        custom command confirmations (worth pre-rendering for TTS).
+        
+        Returns:
+            Response texts
+        """
+        responses = []
+        
+        qa_skill = self.registry.get('custom_qa')
+        if qa_skill:
+            responses.extend(qa_pair['answer'] for qa_pair in qa_skill.qa_pairs if qa_pair.get('answer'))
+        
+        custom_skill = self.registry.get('custom')
+        if custom_skill:
+            responses.extend(
+                f"Executed: {cmd['description']}" for cmd in custom_skill.custom_commands
+                if cmd.get('description') and cmd.get('action', '').lower() in ('powershell', 'python', 'executable')
+            )
+        
+        return responses
+    
     def check_custom_commands(self, raw_text: str) -> Optional[str]:
         """
         Check if user input matches any custom command.
@@ -230,13 +536,7 @@ class SkillsEngine:
         Returns:
             Result if command executed, None otherwise
         """
-        # Find the custom skills
-        custom_skill = None
-        for skill in self.skills:
-            if skill.__class__.__name__ == 'CustomSkill':
-                custom_skill = skill
-                break
-        
+        custom_skill = self.registry.get('custom')
         if not custom_skill:
             return None
         
@@ -16,6 +16,16 @@ from skills import BaseSkill
 class CalendarReminderSkills(BaseSkill):
     """Calendar and reminder management."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'set_reminder',
+        'set_timer',
+        'list_reminders',
+        'cancel_reminder',
+        'what_time',
+        'what_date'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         self.reminders_file = Path("data/reminders.json")
@@ -41,15 +51,7 @@ class CalendarReminderSkills(BaseSkill):
         if intent == 'what_date' and not any(phrase in raw_text for phrase in date_phrases):
             return False
         
-        calendar_intents = [
-            'set_reminder',
-            'set_timer',
-            'list_reminders',
-            'cancel_reminder',
-            'what_time',
-            'what_date'
-        ]
-        return intent in calendar_intents
+        return intent in self.intents
     
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute calendar/reminder commands."""
@@ -5,13 +5,25 @@ Checks user-defined question/answer database before other skills.
 Allows users to add their own custom responses to specific questions.
 """
 
-import yaml
 import logging
+import math
+import re
 import sys
 import os
+from bisect import bisect_right
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from skills import BaseSkill
+from skills.matching import AhoCorasick
+from skills.reloadable import CompiledFileCache
+
+
+# Minimum match score for a Q&A pair to answer
+MATCH_THRESHOLD = 0.5
+
+# Terms used for BM25 ranking
+TERM_PATTERN = re.compile(r"\w+")
 
 
 def get_resource_path(relative_path):
@@ -23,61 +35,127 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-class CustomQASkill(BaseSkill):
+class QAIndex:
     """
-    Custom Question & Answer skill.
+    Precompiled index over Q&A pairs.
     
-    Checks custom_qa.yaml for matching questions and returns predefined answers.
-    This skill runs with HIGHEST PRIORITY to override default responses.
+    Pairs are preprocessed once. A lookup gathers candidate pairs - those
+    sharing a word with the input, whose question or keywords occur in the
+    input, or whose question contains the input - and scores only those.
+    
+    Scoring is the Q&A match score (exact match, containment, keyword and
+    word overlap); BM25 over question and keyword terms ranks pairs with
+    equal scores so rarer, more specific terms win.
     """
     
-    def __init__(self, config: dict):
-        super().__init__(config)
-        self.logger = logging.getLogger("jarvis.skills.custom_qa")
-        self.qa_pairs = self._load_qa_pairs()
-        self.logger.info(f"Loaded {len(self.qa_pairs)} custom Q&A pairs")
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
     
-    def _load_qa_pairs(self) -> list:
-        """Load Q&A pairs from custom_qa.yaml."""
-        try:
-            qa_file = get_resource_path("custom_qa.yaml")
-            
-            if not os.path.exists(qa_file):
-                # Fallback to current directory
-                qa_file = "custom_qa.yaml"
-                if not os.path.exists(qa_file):
-                    self.logger.warning("custom_qa.yaml not found")
-                    return []
+    def __init__(self, qa_pairs: List[dict]):
+        """
+        Build the index.
+        
+        Args:
+            qa_pairs: Q&A pairs in file order
+        """
+        self.qa_pairs = qa_pairs
+        self.questions: List[str] = []
+        self.question_words: List[set] = []
+        self.keywords: List[List[str]] = []
+        
+        # Question word -> pair indexes (whitespace words, as the score compares them)
+        self.word_postings: Dict[str, List[int]] = {}
+        # Term -> [(pair index, term frequency)] for BM25
+        self.term_postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.doc_lengths: List[int] = []
+        
+        # Substring patterns: every question and keyword, mapped back to its pair
+        patterns: List[str] = []
+        self.pattern_pairs: List[int] = []
+        
+        for index, qa_pair in enumerate(qa_pairs):
+            question = str(qa_pair.get('question', '')).lower()
+            keywords = [str(kw).lower() for kw in (qa_pair.get('keywords') or [])]
+            words = set(question.split())
             
-            with open(qa_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                
-            if not data or 'qa_pairs' not in data:
-                self.logger.warning("No qa_pairs found in custom_qa.yaml")
-                return []
+            self.questions.append(question)
+            self.keywords.append(keywords)
+            self.question_words.append(words)
             
-            qa_pairs = data['qa_pairs']
-            self.logger.info(f"Loaded {len(qa_pairs)} Q&A pairs")
+            for word in words:
+                self.word_postings.setdefault(word, []).append(index)
             
-            return qa_pairs
+            terms = Counter(TERM_PATTERN.findall(question + " " + " ".join(keywords)))
+            self.doc_lengths.append(sum(terms.values()))
+            for term, count in terms.items():
+                self.term_postings.setdefault(term, []).append((index, count))
             
-        except Exception as e:
-            self.logger.error(f"Error loading custom_qa.yaml: {e}", exc_info=True)
-            return []
+            for pattern in [question] + keywords:
+                patterns.append(pattern)
+                self.pattern_pairs.append(index)
+        
+        self.automaton = AhoCorasick(patterns)
+        
+        # All questions joined, to find questions containing the input with str.find
+        self.corpus = "\n".join(self.questions)
+        self.corpus_offsets: List[int] = []
+        offset = 0
+        for question in self.questions:
+            self.corpus_offsets.append(offset)
+            offset += len(question) + 1
+        
+        self.avg_doc_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+    
+    def _candidates(self, user_text: str) -> set:
+        """Pairs that can score above zero for the input."""
+        candidates = set()
+        
+        for word in user_text.split():
+            candidates.update(self.word_postings.get(word, ()))
+        
+        for pattern_id in self.automaton.find_all(user_text):
+            candidates.add(self.pattern_pairs[pattern_id])
+        
+        if user_text:
+            start = self.corpus.find(user_text)
+            while start != -1:
+                candidates.add(bisect_right(self.corpus_offsets, start) - 1)
+                start = self.corpus.find(user_text, start + 1)
+        
+        return candidates
     
-    def _calculate_match_score(self, user_text: str, qa_pair: dict) -> float:
+    def _bm25(self, user_text: str, candidates: set) -> Dict[int, float]:
+        """BM25 relevance of each candidate to the input."""
+        scores = dict.fromkeys(candidates, 0.0)
+        total = len(self.qa_pairs)
+        
+        for term in set(TERM_PATTERN.findall(user_text)):
+            postings = self.term_postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for index, freq in postings:
+                if index in scores:
+                    norm = 1 - self.B + self.B * self.doc_lengths[index] / self.avg_doc_length
+                    scores[index] += idf * freq * (self.K1 + 1) / (freq + self.K1 * norm)
+        
+        return scores
+    
+    def _score(self, user_text: str, user_words: set, index: int) -> float:
         """
-        Calculate how well user text matches a Q&A pair.
+        Match score of one pair (0.0 to 1.0).
         
         Args:
             user_text: User's input text (lowercase)
-            qa_pair: Q&A pair dictionary
+            user_words: Words of the input
+            index: Pair index
             
         Returns:
-            Match score (0.0 to 1.0)
+            Match score
         """
         score = 0.0
-        question = qa_pair['question'].lower()
+        question = self.questions[index]
         
         # Exact match = perfect score
         if user_text == question:
@@ -90,24 +168,144 @@ class CustomQASkill(BaseSkill):
             score += 0.6
         
         # Check keywords if provided
-        if 'keywords' in qa_pair and qa_pair['keywords']:
-            keywords = [kw.lower() for kw in qa_pair['keywords']]
+        keywords = self.keywords[index]
+        if keywords:
             matched_keywords = sum(1 for kw in keywords if kw in user_text)
-            
             if matched_keywords > 0:
-                keyword_score = matched_keywords / len(keywords)
-                score += keyword_score * 0.5
+                score += (matched_keywords / len(keywords)) * 0.5
         
         # Check individual word matches in question
-        question_words = set(question.split())
+        question_words = self.question_words[index]
+        if question_words:
+            score += (len(question_words & user_words) / len(question_words)) * 0.3
+        
+        return min(score, 1.0)
+    
+    def search(self, text: str) -> Optional[Tuple[dict, float]]:
+        """
+        Find the best matching pair in a single pass.
+        
+        Args:
+            text: User's input text
+            
+        Returns:
+            (Q&A pair, match score) for the best candidate, or None
+        """
+        user_text = text.lower().strip()
+        candidates = self._candidates(user_text)
+        if not candidates:
+            return None
+        
         user_words = set(user_text.split())
-        common_words = question_words & user_words
+        relevance = self._bm25(user_text, candidates)
         
-        if len(question_words) > 0:
-            word_match_score = len(common_words) / len(question_words)
-            score += word_match_score * 0.3
+        best_key = None
+        best_index = None
+        for index in candidates:
+            score = self._score(user_text, user_words, index)
+            if score <= 0:
+                continue
+            # Highest score, then BM25 relevance, then file order
+            key = (score, relevance[index], -index)
+            if best_key is None or key > best_key:
+                best_key = key
+                best_index = index
         
-        return min(score, 1.0)
+        if best_index is None:
+            return None
+        return self.qa_pairs[best_index], best_key[0]
+
+
+class CustomQASkill(BaseSkill):
+    """
+    Custom Question & Answer skill.
+    
+    Checks custom_qa.yaml for matching questions and returns predefined answers.
+    This skill runs with HIGHEST PRIORITY to override default responses.
+    """
+    
+    # Matches on the raw user text, not the classified intent
+    matches_raw_text = True
+    
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.logger = logging.getLogger("jarvis.skills.custom_qa")
+        
+        # Compiled index, swapped as a whole when the file is reloaded
+        self.source_path = self._resolve_qa_path()
+        self.cache = CompiledFileCache("custom_qa")
+        self.index = QAIndex([])
+        
+        # can_handle() remembers its match so execute() doesn't search again
+        self._last_match: Optional[Tuple[QAIndex, str, Optional[Tuple[dict, float]]]] = None
+        
+        self.reload()
+    
+    @property
+    def qa_pairs(self) -> List[dict]:
+        """Currently loaded Q&A pairs."""
+        return self.index.qa_pairs
+    
+    def _resolve_qa_path(self) -> str:
+        """Locate custom_qa.yaml (bundled path, else current directory)."""
+        qa_file = get_resource_path("custom_qa.yaml")
+        if not os.path.exists(qa_file):
+            # Fallback to current directory
+            qa_file = "custom_qa.yaml"
+        return qa_file
+    
+    def _compile_qa_pairs(self, data: Any) -> QAIndex:
+        """Build the Q&A index from parsed YAML."""
+        if not data or 'qa_pairs' not in data:
+            self.logger.warning("No qa_pairs found in custom_qa.yaml")
+            return QAIndex([])
+        return QAIndex(data['qa_pairs'] or [])
+    
+    def reload(self) -> bool:
+        """
+        Load custom_qa.yaml and swap in the new index.
+        
+        Uses the compiled cache when the file is unchanged. On failure the
+        previously loaded pairs stay active.
+        
+        Returns:
+            True if the Q&A pairs were (re)loaded
+        """
+        if not os.path.exists(self.source_path):
+            self.logger.warning("custom_qa.yaml not found")
+            return False
+        
+        try:
+            index = self.cache.load(self.source_path, self._compile_qa_pairs)
+        except Exception as e:
+            self.logger.error(f"Error loading custom_qa.yaml: {e}", exc_info=True)
+            return False
+        
+        self.index = index
+        self.logger.info(f"Loaded {len(index.qa_pairs)} custom Q&A pairs")
+        return True
+    
+    def find_match(self, text: str) -> Optional[Tuple[dict, float]]:
+        """
+        Find the Q&A pair answering the input, if it matches well enough.
+        
+        Args:
+            text: User's input text
+            
+        Returns:
+            (Q&A pair, match score), or None below the match threshold
+        """
+        index = self.index
+        last_match = self._last_match
+        if last_match is not None and last_match[0] is index and last_match[1] == text:
+            return last_match[2]
+        
+        match = index.search(text)
+        if match and match[1] < MATCH_THRESHOLD:
+            match = None
+        
+        self._last_match = (index, text, match)
+        return match
     
     def can_handle(self, intent: str, entities: dict) -> bool:
         """
@@ -125,23 +323,11 @@ class CustomQASkill(BaseSkill):
         if not entities.get('raw_text'):
             return False
         
-        user_text = entities['raw_text'].lower().strip()
-        
-        # Find best match
-        best_score = 0.0
-        for qa_pair in self.qa_pairs:
-            score = self._calculate_match_score(user_text, qa_pair)
-            if score > best_score:
-                best_score = score
+        match = self.find_match(entities['raw_text'])
+        if match:
+            self.logger.debug(f"Match found with score {match[1]:.2f}")
         
-        # Require at least 50% match confidence
-        threshold = 0.5
-        match_found = best_score >= threshold
-        
-        if match_found:
-            self.logger.debug(f"Match found with score {best_score:.2f}")
-        
-        return match_found
+        return match is not None
     
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """
@@ -158,20 +344,10 @@ class CustomQASkill(BaseSkill):
         if not entities.get('raw_text'):
             return "I didn't catch that, sir."
         
-        user_text = entities['raw_text'].lower().strip()
-        
-        # Find best match
-        best_match = None
-        best_score = 0.0
-        
-        for qa_pair in self.qa_pairs:
-            score = self._calculate_match_score(user_text, qa_pair)
-            if score > best_score:
-                best_score = score
-                best_match = qa_pair
-        
-        if best_match:
-            self.logger.info(f"Matched Q&A: '{best_match['question']}' (score: {best_score:.2f})")
-            return best_match['answer']
+        match = self.find_match(entities['raw_text'])
+        if match:
+            qa_pair, score = match
+            self.logger.info(f"Matched Q&A: '{qa_pair['question']}' (score: {score:.2f})")
+            return qa_pair['answer']
         
         return "I don't have an answer for that in my database, sir."
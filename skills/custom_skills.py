@@ -5,13 +5,19 @@ Allows users to add their own voice commands without coding.
 """
 
 import logging
+import string
 import subprocess
-import yaml
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from skills import BaseSkill
+from skills.matching import AhoCorasick
+from skills.reloadable import CompiledFileCache
+
+
+# Punctuation is ignored when comparing triggers to spoken text
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
 
 
 def get_resource_path(relative_path):
@@ -25,9 +31,84 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def normalize_trigger(text: str) -> str:
+    """Lowercase, strip and drop punctuation, as triggers and input are compared."""
+    return text.lower().strip().translate(PUNCTUATION_TABLE)
+
+
+class TriggerMatcher:
+    """
+    Precompiled matcher for custom command triggers.
+    
+    Built once per command list. A trigger matches when it appears anywhere
+    in the input, or when it has as many words as the input and each word
+    pair is a prefix of the other (e.g. "jar" matching "jarvis"). Among
+    matching commands the first one in file order wins.
+    
+    Substring matches use an Aho-Corasick automaton over the normalized
+    triggers, so one pass over the input finds every trigger it contains.
+    Partial matches use an index keyed by word count and word initials,
+    since two words can only be prefixes of each other if they share their
+    first letter.
+    """
+    
+    def __init__(self, commands: List[Dict[str, Any]]):
+        """
+        Compile triggers.
+        
+        Args:
+            commands: Custom commands in priority (file) order
+        """
+        self.commands = commands
+        triggers = [normalize_trigger(str(cmd.get('trigger', ''))) for cmd in commands]
+        
+        # Pattern IDs are command indexes
+        self._automaton = AhoCorasick(triggers)
+        
+        # (word count, word initials) -> [(command index, trigger words)]
+        self._prefix_index: Dict[Tuple[int, str], List[Tuple[int, List[str]]]] = {}
+        for index, trigger in enumerate(triggers):
+            words = trigger.split()
+            if words:
+                key = (len(words), "".join(word[0] for word in words))
+                self._prefix_index.setdefault(key, []).append((index, words))
+    
+    def match(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the command a piece of user text triggers.
+        
+        Args:
+            text: Raw user text
+            
+        Returns:
+            Matching command, or None
+        """
+        cleaned = normalize_trigger(text)
+        
+        # Substring matches - single scan through the automaton
+        found = self._automaton.find_all(cleaned)
+        best = min(found) if found else None
+        
+        # Partial word matches - only triggers with the same shape
+        text_words = cleaned.split()
+        if text_words:
+            key = (len(text_words), "".join(word[0] for word in text_words))
+            for index, trigger_words in self._prefix_index.get(key, ()):
+                if best is not None and index >= best:
+                    break
+                if all(uw.startswith(tw) or tw.startswith(uw) for tw, uw in zip(trigger_words, text_words)):
+                    best = index
+                    break
+        
+        return self.commands[best] if best is not None else None
+
+
 class CustomSkill(BaseSkill):
     """Execute user-defined custom commands."""
     
+    # Matches on the raw user text, not the classified intent
+    matches_raw_text = True
+    
     def __init__(self, config: dict):
         """
         Initialize custom skills.
@@ -38,14 +119,26 @@ class CustomSkill(BaseSkill):
         super().__init__(config)
         self.logger = logging.getLogger("jarvis.skills.custom")
         self.path_variables = {}  # Store resolved paths
-        self.custom_commands = self._load_custom_commands()
         
-        # Register custom intents
-        self.intents = []
-        for cmd in self.custom_commands:
-            self.intents.append(cmd['trigger'])
+        # Compiled commands, swapped as a whole when the file is reloaded
+        self.source_path = self._resolve_commands_path()
+        self.cache = CompiledFileCache("custom_commands")
+        self.matcher = TriggerMatcher([])
+        
+        # can_handle() remembers its match so execute() doesn't search again
+        self._last_match: Optional[Tuple[TriggerMatcher, str, Optional[Dict[str, Any]]]] = None
         
-        self.logger.info(f"Loaded {len(self.custom_commands)} custom commands")
+        self.reload()
+    
+    @property
+    def custom_commands(self) -> List[Dict[str, Any]]:
+        """Currently loaded custom commands."""
+        return self.matcher.commands
+    
+    @property
+    def intents(self) -> List[str]:
+        """Custom command triggers."""
+        return [cmd['trigger'] for cmd in self.custom_commands]
     
     def _get_default_paths(self):
         """Get default Windows folder paths."""
@@ -105,38 +198,56 @@ class CustomSkill(BaseSkill):
         
         return paths
     
-    def _load_custom_commands(self) -> List[Dict[str, Any]]:
-        """Load custom commands from YAML file."""
+    def _resolve_commands_path(self) -> str:
+        """Locate custom_commands.yaml (bundled path, else current directory)."""
+        config_path = get_resource_path("custom_commands.yaml")
+        if not os.path.exists(config_path):
+            # Fallback to current directory
+            config_path = "custom_commands.yaml"
+        return config_path
+    
+    @staticmethod
+    def _compile_commands(data: Any) -> Tuple[TriggerMatcher, Dict[str, str]]:
+        """Build the trigger matcher and path configuration from parsed YAML."""
+        data = data or {}
+        return TriggerMatcher(data.get('commands') or []), data.get('paths') or {}
+    
+    def reload(self) -> bool:
+        """
+        Load custom_commands.yaml and swap in the new commands.
+        
+        Uses the compiled cache when the file is unchanged. On failure the
+        previously loaded commands stay active.
+        
+        Returns:
+            True if the commands were (re)loaded
+        """
+        if not os.path.exists(self.source_path):
+            self.logger.warning("custom_commands.yaml not found, using defaults")
+            return False
+        
         try:
-            config_path = get_resource_path("custom_commands.yaml")
-            if not os.path.exists(config_path):
-                # Fallback to current directory
-                config_path = "custom_commands.yaml"
-                if not os.path.exists(config_path):
-                    self.logger.warning("custom_commands.yaml not found, using defaults")
-                    return []
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                
-                # Load path configuration
-                custom_paths = data.get('paths', {})
-                default_paths = self._get_default_paths()
-                
-                # Merge custom paths with defaults
-                for key, value in default_paths.items():
-                    custom_value = custom_paths.get(key, '')
-                    if custom_value and os.path.exists(custom_value):
-                        self.path_variables[key.upper()] = custom_value
-                    else:
-                        self.path_variables[key.upper()] = value
-                
-                self.logger.info(f"Loaded path variables: {list(self.path_variables.keys())}")
-                
-                return data.get('commands', [])
+            matcher, custom_paths = self.cache.load(self.source_path, self._compile_commands)
         except Exception as e:
             self.logger.error(f"Failed to load custom commands: {e}")
-            return []
+            return False
+        
+        # Merge custom paths with defaults
+        path_variables = {}
+        for key, value in self._get_default_paths().items():
+            custom_value = custom_paths.get(key, '')
+            if custom_value and os.path.exists(custom_value):
+                path_variables[key.upper()] = custom_value
+            else:
+                path_variables[key.upper()] = value
+        
+        self.logger.info(f"Loaded path variables: {list(path_variables.keys())}")
+        
+        self.path_variables = path_variables
+        self.matcher = matcher
+        
+        self.logger.info(f"Loaded {len(matcher.commands)} custom commands")
+        return True
     
     def _replace_path_variables(self, command: str) -> str:
         """Replace path variables like {DESKTOP} with actual paths."""
@@ -145,41 +256,32 @@ class CustomSkill(BaseSkill):
             result = result.replace(f"{{{var_name}}}", var_path)
         return result
     
+    def _match(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the command matching text, reusing the previous lookup if possible.
+        
+        Args:
+            text: Raw user text
+            
+        Returns:
+            Matching command, or None
+        """
+        matcher = self.matcher
+        last_match = self._last_match
+        if last_match is not None and last_match[0] is matcher and last_match[1] == text:
+            return last_match[2]
+        
+        cmd = matcher.match(text)
+        self._last_match = (matcher, text, cmd)
+        return cmd
+    
     def can_handle(self, intent: str, entities: dict) -> bool:
         """Check if this skill can handle the intent."""
         # Check raw_text if available (for priority checking)
-        text_to_check = entities.get('raw_text', intent).lower().strip()
-        
-        # Remove common punctuation for better matching
-        import string
-        text_cleaned = text_to_check.translate(str.maketrans('', '', string.punctuation))
-        
-        # Check if any custom command trigger matches
-        for cmd in self.custom_commands:
-            trigger = cmd['trigger'].lower().strip()
-            trigger_cleaned = trigger.translate(str.maketrans('', '', string.punctuation))
-            
-            # Exact match or close match (check both original and cleaned versions)
-            if (trigger == text_to_check or trigger in text_to_check or 
-                trigger_cleaned == text_cleaned or trigger_cleaned in text_cleaned):
-                self.logger.debug(f"Custom command matched: {cmd['name']}")
-                return True
-            
-            # Special handling for partial word matches (e.g., "jar" matching "jarvis")
-            # Check if all words in trigger appear in sequence in the text (allowing partial matches)
-            trigger_words = trigger_cleaned.split()
-            text_words = text_cleaned.split()
-            
-            if len(trigger_words) == len(text_words):
-                match = True
-                for tw, uw in zip(trigger_words, text_words):
-                    # Check if user word starts with trigger word OR trigger word starts with user word
-                    if not (uw.startswith(tw) or tw.startswith(uw)):
-                        match = False
-                        break
-                if match:
-                    self.logger.debug(f"Custom command matched (partial): {cmd['name']}")
-                    return True
+        cmd = self._match(entities.get('raw_text', intent))
+        if cmd:
+            self.logger.debug(f"Custom command matched: {cmd['name']}")
+            return True
         return False
     
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
@@ -196,38 +298,11 @@ class CustomSkill(BaseSkill):
         """
         try:
             # Get the text to match against
-            text_to_check = entities.get('raw_text', raw_text or intent).lower().strip()
-            
-            # Remove common punctuation for better matching
-            import string
-            text_cleaned = text_to_check.translate(str.maketrans('', '', string.punctuation))
+            text = entities.get('raw_text', raw_text or intent)
+            text_to_check = text.lower().strip()
             
             # Find matching command
-            matching_cmd = None
-            for cmd in self.custom_commands:
-                trigger = cmd['trigger'].lower().strip()
-                trigger_cleaned = trigger.translate(str.maketrans('', '', string.punctuation))
-                
-                # Check both original and cleaned versions
-                if (trigger == text_to_check or trigger in text_to_check or 
-                    trigger_cleaned == text_cleaned or trigger_cleaned in text_cleaned):
-                    matching_cmd = cmd
-                    break
-                
-                # Special handling for partial word matches (e.g., "jar" matching "jarvis")
-                trigger_words = trigger_cleaned.split()
-                text_words = text_cleaned.split()
-                
-                if len(trigger_words) == len(text_words):
-                    match = True
-                    for tw, uw in zip(trigger_words, text_words):
-                        # Check if user word starts with trigger word OR trigger word starts with user word
-                        if not (uw.startswith(tw) or tw.startswith(uw)):
-                            match = False
-                            break
-                    if match:
-                        matching_cmd = cmd
-                        break
+            matching_cmd = self._match(text)
             
             if not matching_cmd:
                 return "Custom command not found"
@@ -16,6 +16,14 @@ from skills import BaseSkill
 class EmailSkills(BaseSkill):
     """Email management."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'send_email',
+        'check_email',
+        'read_emails',
+        'unread_count'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         email_config = config.get('integrations', {}).get('email', {})
@@ -26,16 +34,6 @@ class EmailSkills(BaseSkill):
         self.imap_server = email_config.get('imap_server', 'imap.gmail.com')
         self.imap_port = email_config.get('imap_port', 993)
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        email_intents = [
-            'send_email',
-            'check_email',
-            'read_emails',
-            'unread_count'
-        ]
-        return intent in email_intents
-    
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute email commands."""
         if not self.email_address or not self.email_password:
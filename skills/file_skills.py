@@ -17,17 +17,15 @@ from skills import BaseSkill
 class FileSkills(BaseSkill):
     """File and directory operation skills."""
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill handles the intent."""
-        file_intents = [
-            'create_file',
-            'delete_file',
-            'move_file',
-            'copy_file',
-            'list_directory',
-            'find_file'
-        ]
-        return intent in file_intents
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'create_file',
+        'delete_file',
+        'move_file',
+        'copy_file',
+        'list_directory',
+        'find_file'
+    ]
     
     def requires_confirmation(self, intent: str) -> bool:
         """Check if intent requires confirmation."""
@@ -16,6 +16,15 @@ from skills import BaseSkill
 class MacroSkills(BaseSkill):
     """Hotkey and macro automation."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'record_macro',
+        'play_macro',
+        'list_macros',
+        'delete_macro',
+        'press_hotkey'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         self.macros_file = Path("data/macros.json")
@@ -25,17 +34,6 @@ class MacroSkills(BaseSkill):
         self.is_recording = False
         self.recorded_keys = []
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        macro_intents = [
-            'record_macro',
-            'play_macro',
-            'list_macros',
-            'delete_macro',
-            'press_hotkey'
-        ]
-        return intent in macro_intents
-    
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute macro commands."""
         try:
@@ -0,0 +1,88 @@
+"""
+Text Matching Helpers
+
+Precompiled multi-pattern search shared by the custom command and Q&A skills.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton for finding many substrings in one pass.
+    
+    Patterns are compiled once; a search walks the input a single time and
+    reports every pattern that occurs anywhere in it, regardless of how many
+    patterns there are.
+    """
+    
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile patterns.
+        
+        Args:
+            patterns: Patterns to search for; a pattern's ID is its position.
+                Empty patterns are ignored.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        
+        for pattern_id, pattern in enumerate(patterns):
+            if pattern:
+                self._add_pattern(pattern, pattern_id)
+        
+        self._build_failure_links()
+    
+    def _add_pattern(self, pattern: str, pattern_id: int):
+        """Insert a pattern into the trie."""
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(pattern_id)
+    
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                
+                # Patterns that are suffixes of this node's path also end here
+                if self._output[self._fail[child]]:
+                    self._output[child] = self._output[child] + self._output[self._fail[child]]
+    
+    def find_all(self, text: str) -> Set[int]:
+        """
+        Find all patterns occurring in text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            IDs of the patterns found
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
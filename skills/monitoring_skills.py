@@ -14,19 +14,17 @@ from skills import BaseSkill
 class MonitoringSkills(BaseSkill):
     """System performance monitoring."""
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        monitoring_intents = [
-            'check_system',
-            'system_status',
-            'cpu_usage',
-            'memory_usage',
-            'disk_usage',
-            'battery_status',
-            'network_status',
-            'kill_process'
-        ]
-        return intent in monitoring_intents
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'check_system',
+        'system_status',
+        'cpu_usage',
+        'memory_usage',
+        'disk_usage',
+        'battery_status',
+        'network_status',
+        'kill_process'
+    ]
     
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute monitoring commands."""
@@ -12,25 +12,23 @@ from skills import BaseSkill
 class MusicSkills(BaseSkill):
     """Music and media control."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'play_music',
+        'pause_music',
+        'next_track',
+        'previous_track',
+        'volume_up',
+        'volume_down',
+        'current_track'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         self.spotify_enabled = config.get('integrations', {}).get('spotify_enabled', False)
         self.spotify_client_id = config.get('integrations', {}).get('spotify_client_id', '')
         self.spotify_client_secret = config.get('integrations', {}).get('spotify_client_secret', '')
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        music_intents = [
-            'play_music',
-            'pause_music',
-            'next_track',
-            'previous_track',
-            'volume_up',
-            'volume_down',
-            'current_track'
-        ]
-        return intent in music_intents
-    
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute music control commands."""
         try:
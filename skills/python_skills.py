@@ -17,21 +17,19 @@ from skills import BaseSkill
 class PythonSkills(BaseSkill):
     """Python execution skills."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'run_python_script',
+        'execute_code',
+        'install_package'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         self.sandboxed = config.get('sandboxed', True)
         self.timeout = config.get('timeout', 30)
         self.max_memory = config.get('max_memory', 512)
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill handles the intent."""
-        python_intents = [
-            'run_python_script',
-            'execute_code',
-            'install_package'
-        ]
-        return intent in python_intents
-    
     def requires_confirmation(self, intent: str) -> bool:
         """Check if intent requires confirmation."""
         # Python execution always requires confirmation for security
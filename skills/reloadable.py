@@ -0,0 +1,181 @@
+"""
+Reloadable Skill Data
+
+Compiled caching and change watching for the YAML files behind the custom
+command and Q&A skills, so edits apply without restarting Jarvis.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import yaml
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Bump when the pickled index classes change shape
+CACHE_VERSION = 1
+
+
+class CompiledFileCache:
+    """
+    Pickle cache for data compiled from a YAML file.
+    
+    Entries are keyed by the file's mtime and size, with a content hash as a
+    second check, so startup skips YAML parsing and index building whenever
+    the file is unchanged - including after a touch or a copy that only
+    changed its mtime.
+    """
+    
+    def __init__(self, name: str, cache_dir: str = "data/cache"):
+        """
+        Initialize cache.
+        
+        Args:
+            name: Cache entry name (one file per name)
+            cache_dir: Directory for cache files
+        """
+        self.cache_path = Path(cache_dir) / f"{name}.pkl"
+        self.logger = logging.getLogger("jarvis.skills.cache")
+    
+    def load(self, path: str, compile_fn: Callable[[Any], Any]) -> Any:
+        """
+        Load compiled data for a YAML file, compiling and caching on a miss.
+        
+        Args:
+            path: YAML file path
+            compile_fn: Builds the compiled object from the parsed YAML
+        
+        Returns:
+            Compiled object
+        """
+        stat = os.stat(path)
+        cached = self._read()
+        
+        if cached and (cached['mtime_ns'], cached['size']) == (stat.st_mtime_ns, stat.st_size):
+            return cached['compiled']
+        
+        with open(path, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        
+        if cached and cached['sha256'] == digest:
+            compiled = cached['compiled']
+            self.logger.debug(f"{path} touched but unchanged, reusing compiled cache")
+        else:
+            compiled = compile_fn(yaml.safe_load(content))
+            self.logger.debug(f"Compiled {path}")
+        
+        self._write({
+            'version': CACHE_VERSION,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'compiled': compiled
+        })
+        return compiled
+    
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """Read the cache entry, ignoring missing, stale or unreadable caches."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict) and cached.get('version') == CACHE_VERSION:
+                return cached
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {self.cache_path}: {e}")
+        return None
+    
+    def _write(self, entry: Dict[str, Any]):
+        """Write the cache entry atomically."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write cache {self.cache_path}: {e}")
+
+
+class FileWatcher:
+    """
+    Polls files for changes on a background thread.
+    
+    Each watched file has a callback that runs on the watcher thread when
+    the file's mtime or size changes (or it appears), so reloads happen
+    off the request path.
+    """
+    
+    def __init__(self, interval: float = 2.0):
+        """
+        Initialize watcher.
+        
+        Args:
+            interval: Seconds between checks
+        """
+        self.interval = interval
+        self.logger = logging.getLogger("jarvis.skills.watcher")
+        
+        self._watches: Dict[str, Tuple[Optional[Tuple[int, int]], Callable[[], None]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        """File's (mtime, size), or None if it doesn't exist."""
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def watch(self, path: str, callback: Callable[[], None]):
+        """
+        Watch a file.
+        
+        Args:
+            path: File to watch
+            callback: Called after the file changes
+        """
+        with self._lock:
+            self._watches[path] = (self._signature(path), callback)
+    
+    def start(self):
+        """Start polling."""
+        if self._thread:
+            return
+        self._thread = threading.Thread(target=self._run, name="jarvis-skill-watcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop polling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+    
+    def _run(self):
+        """Polling loop."""
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                watches = list(self._watches.items())
+            
+            for path, (signature, callback) in watches:
+                current = self._signature(path)
+                if current == signature or current is None:
+                    continue
+                
+                with self._lock:
+                    self._watches[path] = (current, callback)
+                
+                self.logger.info(f"{os.path.basename(path)} changed, reloading")
+                try:
+                    callback()
+                except Exception as e:
+                    self.logger.error(f"Reload of {path} failed: {e}", exc_info=True)
@@ -12,6 +12,18 @@ from skills import BaseSkill
 class SmartHomeSkills(BaseSkill):
     """Smart home device control."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'light_on',
+        'light_off',
+        'set_brightness',
+        'set_color',
+        'thermostat_set',
+        'lock_door',
+        'unlock_door',
+        'activate_scene'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         ha_config = config.get('integrations', {}).get('home_assistant', {})
@@ -19,20 +31,6 @@ class SmartHomeSkills(BaseSkill):
         self.ha_token = ha_config.get('token', '')
         self.enabled = ha_config.get('enabled', False)
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        smart_home_intents = [
-            'light_on',
-            'light_off',
-            'set_brightness',
-            'set_color',
-            'thermostat_set',
-            'lock_door',
-            'unlock_door',
-            'activate_scene'
-        ]
-        return intent in smart_home_intents
-    
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute smart home commands."""
         if not self.enabled or not self.ha_url or not self.ha_token:
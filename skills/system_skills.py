@@ -18,22 +18,20 @@ from skills import BaseSkill
 class SystemSkills(BaseSkill):
     """System control skills."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'open_application',
+        'control_volume',
+        'take_screenshot',
+        'shutdown',
+        'restart'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         self.require_confirmation = config.get('require_confirmation', True)
         self.allowed_operations = config.get('allowed_operations', [])
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill handles the intent."""
-        system_intents = [
-            'open_application',
-            'control_volume',
-            'take_screenshot',
-            'shutdown',
-            'restart'
-        ]
-        return intent in system_intents
-    
     def requires_confirmation(self, intent: str) -> bool:
         """Check if intent requires confirmation."""
         dangerous_intents = ['shutdown', 'restart']
@@ -16,23 +16,21 @@ from skills import BaseSkill
 class VisionSkills(BaseSkill):
     """AI vision and image analysis."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'what_do_you_see',
+        'describe_image',
+        'take_photo',
+        'identify_object',
+        'read_text'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         vision_config = config.get('integrations', {}).get('vision', {})
         self.enabled = vision_config.get('enabled', False)
         self.camera_index = vision_config.get('camera_index', 0)
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        vision_intents = [
-            'what_do_you_see',
-            'describe_image',
-            'take_photo',
-            'identify_object',
-            'read_text'
-        ]
-        return intent in vision_intents
-    
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute vision commands."""
         if not self.enabled:
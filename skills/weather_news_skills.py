@@ -13,22 +13,20 @@ from skills import BaseSkill
 class WeatherNewsSkills(BaseSkill):
     """Weather and news information."""
     
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'get_weather',
+        'get_forecast',
+        'get_news',
+        'get_headlines',
+        'weather_today'
+    ]
+    
     def __init__(self, config: dict):
         super().__init__(config)
         self.weather_api_key = config.get('integrations', {}).get('openweather_api_key', '')
         self.news_api_key = config.get('integrations', {}).get('news_api_key', '')
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill can handle the intent."""
-        info_intents = [
-            'get_weather',
-            'get_forecast',
-            'get_news',
-            'get_headlines',
-            'weather_today'
-        ]
-        return intent in info_intents
-    
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute weather/news commands."""
         try:
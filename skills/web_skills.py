@@ -16,14 +16,12 @@ from skills import BaseSkill
 class WebSkills(BaseSkill):
     """Web-related skills."""
     
-    def can_handle(self, intent: str, entities: dict) -> bool:
-        """Check if this skill handles the intent."""
-        web_intents = [
-            'web_search',
-            'open_url',
-            'browse'
-        ]
-        return intent in web_intents
+    # Intents routed to this skill by the skills engine
+    intents = [
+        'web_search',
+        'open_url',
+        'browse'
+    ]
     
     def execute(self, intent: str, entities: dict, raw_text: str = "") -> str:
         """Execute web command."""
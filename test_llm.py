@@ -41,19 +41,23 @@ def main():
     print("=" * 60)
     print()
     
+    # Commands that start with a keyword get confidence 0.9; a keyword
+    # later in the sentence gives 0.7 (it was 0.8 before debate gating)
     test_inputs = [
-        ("open notepad", "command"),
-        ("what's the weather like?", "conversation"),
-        ("search for python tutorials", "command"),
-        ("tell me a joke", "conversation"),
-        ("increase the volume", "command")
+        ("open notepad", "command", 0.9),
+        ("what's the weather like?", "conversation", 0.8),
+        ("search for python tutorials", "command", 0.9),
+        ("tell me a joke", "conversation", 0.8),
+        ("increase the volume", "command", 0.9),
+        ("could you open notepad", "command", 0.7)
     ]
     
-    for text, expected_type in test_inputs:
+    for text, expected_type, expected_confidence in test_inputs:
         result = brain.classify_intent(text)
-        status = "✓" if result['type'] == expected_type else "✗"
+        status = "✓" if result['type'] == expected_type and result['confidence'] == expected_confidence else "✗"
         print(f"{status} Input: {text}")
         print(f"   Type: {result['type']} (expected: {expected_type})")
+        print(f"   Confidence: {result['confidence']} (expected: {expected_confidence})")
         
         if result['type'] == 'command':
             details = brain.extract_command_details(text)
@@ -2,8 +2,15 @@
 Test Script - Speech-to-Text
 
 Quick test to verify STT is working.
+
+Pass a WAV file or folder to replay recordings instead of using the
+microphone (repeat runs are answered from the transcript cache):
+
+    python test_stt.py tests/fixtures
 """
 
+import sys
+import time
 import yaml
 from core.stt import SpeechRecognizer
 
@@ -18,8 +25,14 @@ def main():
     with open('config.yaml', 'r') as f:
         config = yaml.safe_load(f)
     
+    replay_path = sys.argv[1] if len(sys.argv) > 1 else None
+    if replay_path:
+        config['stt']['replay'] = {**config['stt'].get('replay', {}), 'enabled': True, 'path': replay_path}
+    
     print(f"Mode: {config['stt']['mode']}")
     print(f"Activation: {config['stt']['activation']['mode']}")
+    if replay_path:
+        print(f"Replay: {replay_path}")
     print()
     
     # Initialize STT
@@ -29,18 +42,29 @@ def main():
     print()
     
     # Test recognition
-    print("Press the activation key and speak a test phrase")
-    print("Example: 'Hello Jarvis, this is a test'")
-    print()
+    if stt.replay:
+        tests = stt.replay_remaining
+    else:
+        tests = 3
+        print("Press the activation key and speak a test phrase")
+        print("Example: 'Hello Jarvis, this is a test'")
+        print()
     
-    for i in range(3):
-        print(f"\n--- Test {i+1}/3 ---")
-        text = stt.recognize()
+    for i in range(tests):
+        print(f"\n--- Test {i+1}/{tests} ---")
+        started = time.perf_counter()
+        text = stt.recognize(bypass_activation=stt.replay)
+        elapsed = time.perf_counter() - started
         
         if text:
-            print(f"✓ Recognized: {text}")
+            print(f"✓ Recognized: {text} ({elapsed:.2f}s)")
         else:
-            print("✗ No speech detected")
+            print(f"✗ No speech detected ({elapsed:.2f}s)")
+    
+    if stt.cache:
+        stats = stt.cache.stats()
+        print()
+        print(f"Transcript cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
     
     print()
     print("=" * 60)
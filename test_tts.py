@@ -43,6 +43,12 @@ def main():
         print("✓ Complete")
         print()
     
+    stats = tts.stats()
+    rtf = stats['average_rtf']
+    print(f"Backend: {stats['backend']} ({stats['voice']})")
+    print(f"Synthesis real-time factor: {rtf if rtf is not None else 'n/a (all cached)'}")
+    print()
+    
     print("=" * 60)
     print("TTS test complete!")
     print("=" * 60)
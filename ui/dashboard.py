@@ -1462,7 +1462,7 @@ class Dashboard:
         # Speak goodbye message without blocking shutdown
         try:
             import time
-            goodbye_text = "Goodbye sir. System shutting down."
+            goodbye_text = self.jarvis.SHUTDOWN_PHRASE
             
             # Speak in background (don't block shutdown)
             self.jarvis.tts.speak(goodbye_text, wait=False)
@@ -1930,21 +1930,11 @@ class Dashboard:
             def change_voice(idx):
                 """Change the TTS voice."""
                 try:
-                    if hasattr(self.jarvis.tts, 'use_pyttsx3') and self.jarvis.tts.use_pyttsx3:
-                        voices = self.jarvis.tts.speaker.getProperty('voices')
-                        if 0 <= idx < len(voices):
-                            self.jarvis.tts.speaker.setProperty('voice', voices[idx].id)
-                            self.tts_voice_name = voices[idx].name
-                            self._save_settings()
-                            self.logger.info(f"Voice changed to: {voices[idx].name}")
-                    else:
-                        # Windows SAPI
-                        voices = self.jarvis.tts.speaker.GetVoices()
-                        if 0 <= idx < voices.Count:
-                            self.jarvis.tts.speaker.Voice = voices.Item(idx)
-                            self.tts_voice_name = voices.Item(idx).GetDescription()
-                            self._save_settings()
-                            self.logger.info(f"Voice changed to: {voices.Item(idx).GetDescription()}")
+                    name = self.jarvis.tts.set_voice(idx)
+                    if name:
+                        self.tts_voice_name = name
+                        self._save_settings()
+                        self.logger.info(f"Voice changed to: {name}")
                 except Exception as e:
                     self.logger.error(f"Failed to change voice: {e}")
             
@@ -2076,11 +2066,7 @@ class Dashboard:
         try:
             current_rate = getattr(self, 'tts_voice_speed', 175)
             # Apply saved speed to TTS engine
-            if hasattr(self.jarvis.tts, 'use_pyttsx3') and self.jarvis.tts.use_pyttsx3:
-                self.jarvis.tts.speaker.setProperty('rate', current_rate)
-            else:
-                sapi_rate = int((current_rate - 175) / 25)
-                self.jarvis.tts.speaker.Rate = max(-10, min(10, sapi_rate))
+            self.jarvis.tts.set_rate(current_rate)
         except:
             current_rate = 175
         
@@ -2090,12 +2076,7 @@ class Dashboard:
             """Update TTS speed."""
             try:
                 rate = int(val)
-                if hasattr(self.jarvis.tts, 'use_pyttsx3') and self.jarvis.tts.use_pyttsx3:
-                    self.jarvis.tts.speaker.setProperty('rate', rate)
-                else:
-                    # Convert WPM to SAPI rate
-                    sapi_rate = int((rate - 175) / 25)
-                    self.jarvis.tts.speaker.Rate = max(-10, min(10, sapi_rate))
+                self.jarvis.tts.set_rate(rate)
                 self.tts_voice_speed = rate
                 speed_value_label.config(text=f"{rate} WPM")
                 self._save_settings()
@@ -4198,6 +4179,20 @@ class Dashboard:
         )
         title.pack(pady=10)
         
+        # Search entry (full-text search over all stored history)
+        search_frame = tk.Frame(history_window, bg=self.secondary_glow, bd=2)
+        search_frame.pack(fill=tk.X, padx=20)
+        
+        search_entry = tk.Entry(
+            search_frame,
+            font=("Consolas", 11),
+            bg='#1a1f2e',
+            fg='#e0e6ed',
+            insertbackground=self.text_color,
+            bd=0
+        )
+        search_entry.pack(fill=tk.X, padx=5, pady=5)
+        
         # Text widget
         text_frame = tk.Frame(history_window, bg=self.secondary_glow, bd=2)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -4214,23 +4209,42 @@ class Dashboard:
         )
         history_text.pack(fill=tk.BOTH, expand=True)
         
-        # Load history from memory if available
-        if self.jarvis.memory:
-            try:
-                recent = self.jarvis.memory.get_recent_interactions(50)
-                for interaction in recent:
-                    timestamp = interaction.get('timestamp', '')
-                    user_input = interaction.get('user_input', '')
-                    response = interaction.get('response', '')
-                    history_text.insert(tk.END, f"[{timestamp}]\n")
-                    history_text.insert(tk.END, f"You: {user_input}\n")
-                    history_text.insert(tk.END, f"Jarvis: {response}\n\n")
-            except:
-                history_text.insert(tk.END, "No conversation history available.\n")
-        else:
-            history_text.insert(tk.END, "Memory system not enabled.\n")
+        def load_history(event=None):
+            """Show recent history, or search results if a query is entered."""
+            history_text.config(state=tk.NORMAL)
+            history_text.delete('1.0', tk.END)
+            
+            # Load history from memory if available
+            if self.jarvis.memory:
+                try:
+                    query = search_entry.get().strip()
+                    if query:
+                        results = self.jarvis.memory.search_history(query, limit=50)
+                        if not results:
+                            history_text.insert(tk.END, f"No matches for '{query}'.\n")
+                    else:
+                        results = self.jarvis.memory.get_recent_interactions(50)
+                    
+                    for interaction in results:
+                        timestamp = interaction.get('timestamp', '')
+                        user_input = interaction.get('user_input', '')
+                        response = interaction.get('response', '')
+                        history_text.insert(tk.END, f"[{timestamp}]\n")
+                        if interaction.get('snippet'):
+                            history_text.insert(tk.END, f"Match: {interaction['snippet']}\n")
+                        history_text.insert(tk.END, f"You: {user_input}\n")
+                        history_text.insert(tk.END, f"Jarvis: {response}\n\n")
+                except:
+                    history_text.insert(tk.END, "No conversation history available.\n")
+            else:
+                history_text.insert(tk.END, "Memory system not enabled.\n")
+            
+            history_text.config(state=tk.DISABLED)
         
-        history_text.config(state=tk.DISABLED)
+        search_entry.bind('<Return>', load_history)
+        search_entry.bind('<Escape>', lambda e: (search_entry.delete(0, tk.END), load_history()))
+        search_entry.focus_set()
+        load_history()
         
         # Close button
         close_btn = tk.Button(
@@ -4365,7 +4379,7 @@ class Dashboard:
         # Instructions
         instructions = tk.Label(
             settings_window,
-            text="Edit custom_commands.yaml to add your own voice commands.\nRestart Jarvis to load changes.",
+            text="Edit custom_commands.yaml to add your own voice commands.\nChanges load as soon as you save.",
             font=("Consolas", 9),
             bg='#0a0e1a',
             fg='#e0e6ed',
@@ -4462,6 +4476,7 @@ class Dashboard:
                 with open(config_path, 'w', encoding='utf-8') as f:
                     f.write(content)
                 self.logger.info("Custom commands saved")
+                self._reload_skill_sources()
                 settings_window.destroy()
             except Exception as e:
                 self.logger.error(f"Error saving: {str(e)}")
@@ -4499,6 +4514,12 @@ class Dashboard:
         )
         cancel_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
     
+    def _reload_skill_sources(self):
+        """Reload custom commands and Q&A in the background after an edit."""
+        if not self.jarvis:
+            return
+        threading.Thread(target=self.jarvis.skills.reload_sources, daemon=True).start()
+    
     def _open_qa_editor(self):
         """Open Q&A database editor dialog."""
         qa_window = tk.Toplevel(self.root)
@@ -4519,7 +4540,7 @@ class Dashboard:
         # Instructions
         instructions = tk.Label(
             qa_window,
-            text="Add your own questions and answers for Jarvis to respond with.\nJarvis checks this database FIRST, before processing other commands.\nRestart Jarvis to load changes.",
+            text="Add your own questions and answers for Jarvis to respond with.\nJarvis checks this database FIRST, before processing other commands.\nChanges load as soon as you save.",
             font=("Consolas", 9),
             bg='#0a0e1a',
             fg='#e0e6ed',
@@ -4616,6 +4637,7 @@ class Dashboard:
                 with open(qa_path, 'w', encoding='utf-8') as f:
                     f.write(content)
                 self.logger.info("Q&A database saved")
+                self._reload_skill_sources()
                 qa_window.destroy()
             except Exception as e:
                 self.logger.error(f"Error saving Q&A: {str(e)}")
@@ -4715,8 +4737,9 @@ class Dashboard:
                     
                     # Listen for wake word to resume
                     try:
-                        # Record audio
-                        text = self.jarvis.stt.recognize(bypass_activation=True)
+                        # Next speech segment; Whisper only runs if the
+                        # keyword spotter thinks it may be the wake word
+                        text = self.jarvis.stt.listen_for_wake_word()
                         
                         # Check if wake word detected
                         if text:
@@ -4791,19 +4814,26 @@ class Dashboard:
                     self.add_to_history(text)
                     
                     try:
-                        response = self.jarvis.process_input(text)
-                        
-                        self.logger.info(f"Jarvis: {response}")
-                        self.set_state("speaking")
-                        
-                        # Update scanner with completion
-                        self.ai_scanner['status'] = "Responding..."
-                        
-                        # Add notification for command execution
-                        self.add_notification(f"Executed: {text[:30]}", 'info')
-                        
-                        # Speak the response with interrupt capability
-                        self.jarvis._speak_with_interrupt(response)
+                        if self.jarvis._streaming_enabled():
+                            # Streaming: speech starts with the first generated sentence
+                            self.ai_scanner['status'] = "Responding..."
+                            response = self.jarvis._stream_and_speak(text)
+                            self.logger.info(f"Jarvis: {response}")
+                            self.add_notification(f"Executed: {text[:30]}", 'info')
+                        else:
+                            response = self.jarvis.process_input(text)
+                            
+                            self.logger.info(f"Jarvis: {response}")
+                            self.set_state("speaking")
+                            
+                            # Update scanner with completion
+                            self.ai_scanner['status'] = "Responding..."
+                            
+                            # Add notification for command execution
+                            self.add_notification(f"Executed: {text[:30]}", 'info')
+                            
+                            # Speak the response with interrupt capability
+                            self.jarvis._speak_with_interrupt(response)
                         
                         # Check if shutdown was triggered
                         if self.is_shutting_down:
@@ -4922,29 +4952,14 @@ class Dashboard:
                 return
             
             # Apply voice
-            if hasattr(self.jarvis.tts, 'use_pyttsx3') and self.jarvis.tts.use_pyttsx3:
-                voices = self.jarvis.tts.speaker.getProperty('voices')
-                for voice in voices:
-                    if voice.name == saved_voice_name:
-                        self.jarvis.tts.speaker.setProperty('voice', voice.id)
-                        self.logger.info(f"Restored voice: {saved_voice_name}")
-                        break
-            else:
-                # Windows SAPI
-                voices = self.jarvis.tts.speaker.GetVoices()
-                for i in range(voices.Count):
-                    voice = voices.Item(i)
-                    if voice.GetDescription() == saved_voice_name:
-                        self.jarvis.tts.speaker.Voice = voice
-                        self.logger.info(f"Restored voice: {saved_voice_name}")
-                        break
+            for voice in self.jarvis.tts.list_voices():
+                if voice['name'] == saved_voice_name:
+                    self.jarvis.tts.set_voice(voice['index'])
+                    self.logger.info(f"Restored voice: {saved_voice_name}")
+                    break
             
             # Apply speed
-            if hasattr(self.jarvis.tts, 'use_pyttsx3') and self.jarvis.tts.use_pyttsx3:
-                self.jarvis.tts.speaker.setProperty('rate', saved_speed)
-            else:
-                sapi_rate = int((saved_speed - 175) / 25)
-                self.jarvis.tts.speaker.Rate = max(-10, min(10, sapi_rate))
+            self.jarvis.tts.set_rate(saved_speed)
             
             self.logger.info(f"Restored voice speed: {saved_speed}")
         except Exception as e: